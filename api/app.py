@@ -36,6 +36,9 @@ class MCPServerApp:
         # Include routers
         self._include_routers()
         
+        # Release shared resources on shutdown
+        self._register_shutdown_handlers()
+        
         self.logger.info(f"Initialized MCPServerApp v{version}")
 
     def get_app(self) -> FastAPI:
@@ -73,3 +76,15 @@ class MCPServerApp:
         self.app.include_router(cache_router.get_router())
         
         self.logger.debug("Included all routers")
+
+    def _register_shutdown_handlers(self):
+        """Register handlers that release shared resources on shutdown."""
+        async def close_service_clients():
+            from services.search import SearchFactory
+            from services.youtube import YouTubeFactory
+            await SearchFactory.aclose_all()
+            await YouTubeFactory.aclose_all()
+            self.logger.info("Closed search and YouTube service clients")
+
+        self.app.add_event_handler("shutdown", close_service_clients)
+        self.logger.debug("Registered shutdown handlers")
@@ -8,7 +8,7 @@ from typing import List, Dict, Any
 from infrastructure.logging import logger
 from infrastructure.cache import cache
 from core.content_sourcing.search_service import SearchService
-from services.search import search
+from services.search import get_search
 
 
 class DuckDuckGoSearchService(SearchService):
@@ -62,7 +62,7 @@ class DuckDuckGoSearchService(SearchService):
             adjusted_max_results = max(max_results * 2, 10)
             self.logger.info(f"Searching for '{query}' with {adjusted_max_results} max results (requested: {max_results})")
 
-            results = await search.search(query, adjusted_max_results, language)
+            results = await get_search().search(query, adjusted_max_results, language)
 
             # Cache the results if successful
             if results:
@@ -103,7 +103,7 @@ class DuckDuckGoSearchService(SearchService):
             self.logger.debug(f"Background refreshing cache for '{query}'")
             # Perform a new search with increased max_results, skipping the cache
             adjusted_max_results = max(max_results * 2, 10)
-            results = await search.search(query, adjusted_max_results, language)
+            results = await get_search().search(query, adjusted_max_results, language)
 
             if results:
                 self.logger.info(f"Updated cache for '{query}' with {len(results)} new results")
@@ -213,14 +213,18 @@ class TreeBasedNodeStructure(NodeStructureService):
                     subnode_subtopics[task_key] = subtopic
                     current_subtopic_index += 1
 
-        # Wait for all video tasks to complete
+        # Wait for all video tasks to complete, running them concurrently (each with its own timeout)
+        task_keys = list(subnode_video_tasks)
+        results = await asyncio.gather(
+            *(asyncio.wait_for(subnode_video_tasks[task_key], timeout=5) for task_key in task_keys),
+            return_exceptions=True
+        )
         subnode_videos_results = {}
-        for task_key, task in subnode_video_tasks.items():
-            try:
-                subnode_videos_results[task_key] = await asyncio.wait_for(task, timeout=5)
-            except (asyncio.TimeoutError, Exception) as e:
-                self.logger.warning(f"Error fetching videos for subnode {task_key}: {str(e)}")
-                subnode_videos_results[task_key] = []
+        for task_key, result in zip(task_keys, results):
+            if isinstance(result, BaseException):
+                self.logger.warning(f"Error fetching videos for subnode {task_key}: {str(result)}")
+                result = []
+            subnode_videos_results[task_key] = result
 
         # For each main branch, create a path of nodes
         current_subtopic_index = num_main_branches  # Reset index
@@ -2,8 +2,9 @@
 
 from infrastructure.cache.cache_factory import CacheFactory
 from infrastructure.cache.cache_service import CacheService
+from infrastructure.cache.local_cache import LocalCache
 
 # Create a global cache instance
 cache: CacheService = CacheFactory.create_cache("memory", {"max_size": 1000})
 
-__all__ = ["cache", "CacheService", "CacheFactory"]
+__all__ = ["cache", "CacheService", "CacheFactory", "LocalCache"]
@@ -3,7 +3,7 @@ Abstract interface for the cache system.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional, List
+from typing import Any, Dict, Optional, List
 
 
 class CacheService(ABC):
@@ -25,6 +25,25 @@ class CacheService(ABC):
         """
         pass
 
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Get several values from the cache in one call.
+        Backends with a batched read (e.g. Redis MGET) should override this;
+        the default looks the keys up one at a time.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Dictionary mapping each found key to its value (missing or expired keys are omitted)
+        """
+        values = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                values[key] = value
+        return values
+
     @abstractmethod
     def setex(self, key: str, ttl: int, value: Any) -> bool:
         """
@@ -40,6 +59,24 @@ class CacheService(ABC):
         """
         pass
 
+    def setnx(self, key: str, ttl: int, value: Any) -> bool:
+        """
+        Set a value in the cache with TTL only if the key is not already set.
+        Backends shared between processes should override this with an atomic
+        operation (e.g. Redis SET NX EX); the default suits in-process caches.
+
+        Args:
+            key: Cache key
+            ttl: Time to live in seconds
+            value: Value to store
+
+        Returns:
+            True if the value was set, False if the key already existed
+        """
+        if self.get(key) is not None:
+            return False
+        return self.setex(key, ttl, value)
+
     @abstractmethod
     def delete(self, key: str) -> int:
         """
@@ -0,0 +1,217 @@
+"""
+Process-local cache tier for the MCP Server.
+
+A small LRU with per-entry expiry that sits in front of the shared cache, so
+hot keys are answered without a round trip to (or deserialization from) it.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from infrastructure.cache.cache_service import CacheService
+
+# Configure logging
+logger = logging.getLogger("mcp_server.cache.local")
+
+
+class LocalCache:
+    """
+    Process-local LRU cache with per-entry TTL.
+
+    Entries never outlive the configured TTL, which is kept short so that
+    clearing the shared cache takes effect quickly. Lists are shallow-copied
+    on the way in and out so callers can't modify the cached entry.
+    """
+
+    def __init__(self, max_size: int = 512, ttl: int = 300):
+        """
+        Initialize the local cache.
+
+        Args:
+            max_size: Maximum number of entries before the least recently used is evicted
+            ttl: Maximum lifetime of an entry in seconds
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+        # Shared cache writes waiting for the next event loop iteration: key -> (shared, ttl, value)
+        self._pending_writes: Dict[str, Tuple[CacheService, int, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a value from the local cache.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return list(value) if isinstance(value, list) else value
+
+    def set(self, key: str, value: Any, ttl: int) -> None:
+        """
+        Store a value, evicting the least recently used entry when full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Shared cache TTL in seconds (the local entry never outlives it)
+        """
+        if isinstance(value, list):
+            value = list(value)
+        self._entries[key] = (time.monotonic() + min(ttl, self.ttl), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """
+        Remove a key from the local cache if present.
+
+        Args:
+            key: Cache key
+        """
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+    def get_through(self, shared: CacheService, key: str, ttl: int) -> Optional[Any]:
+        """
+        Get a value from the local cache, falling back to the shared cache.
+        A shared cache hit is kept locally for subsequent lookups.
+
+        Args:
+            shared: Shared cache behind this tier
+            key: Cache key
+            ttl: Shared cache TTL in seconds
+
+        Returns:
+            The cached value, or None if neither tier has it
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        value = shared.get(key)
+        if value:
+            self.set(key, value, ttl)
+        return value
+
+    def get_many_through(self, shared: CacheService, keys: List[str], ttl: int) -> Dict[str, Any]:
+        """
+        Get several values from the local cache, fetching the rest from the
+        shared cache in a single get_many call. Shared cache hits are kept locally.
+
+        Args:
+            shared: Shared cache behind this tier
+            keys: Cache keys
+            ttl: Shared cache TTL in seconds
+
+        Returns:
+            Dictionary mapping each found key to its value
+        """
+        values = {}
+        missing = []
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                values[key] = value
+            else:
+                missing.append(key)
+
+        if missing:
+            for key, value in shared.get_many(missing).items():
+                if value:
+                    self.set(key, value, ttl)
+                    values[key] = value
+        return values
+
+    def setex_through(self, shared: CacheService, key: str, ttl: int, value: Any) -> bool:
+        """
+        Store a value in the shared cache and, if that succeeds, locally.
+        A failed shared write drops the local entry so both tiers agree.
+
+        Args:
+            shared: Shared cache behind this tier
+            key: Cache key
+            ttl: Time to live in seconds
+            value: Value to store
+
+        Returns:
+            True if the shared cache accepted the value, False otherwise
+        """
+        if shared.setex(key, ttl, value):
+            self.set(key, value, ttl)
+            return True
+
+        self.delete(key)
+        return False
+
+    def setex_later(self, shared: CacheService, key: str, ttl: int, value: Any) -> None:
+        """
+        Store a value locally now and in the shared cache on the next event loop iteration.
+        Keeps shared cache serialization off the response path. Repeated writes to the
+        same key before the flush collapse into one. Without a running event loop the
+        shared write happens immediately.
+
+        Args:
+            shared: Shared cache behind this tier
+            key: Cache key
+            ttl: Time to live in seconds
+            value: Value to store
+        """
+        self.set(key, value, ttl)
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write_shared(shared, key, ttl, value)
+            return
+
+        if not self._pending_writes:
+            loop.call_soon(self._flush_writes)
+        self._pending_writes[key] = (shared, ttl, value)
+
+    def _flush_writes(self) -> None:
+        """Write all pending values to the shared cache."""
+        pending, self._pending_writes = self._pending_writes, {}
+        for key, (shared, ttl, value) in pending.items():
+            self._write_shared(shared, key, ttl, value)
+
+    def _write_shared(self, shared: CacheService, key: str, ttl: int, value: Any) -> None:
+        """
+        Write a value to the shared cache, dropping the local entry if that fails.
+
+        Args:
+            shared: Shared cache behind this tier
+            key: Cache key
+            ttl: Time to live in seconds
+            value: Value to store
+        """
+        try:
+            if shared.setex(key, ttl, value):
+                return
+        except Exception as e:
+            logger.error("Deferred cache write for '%s' failed: %s", key, str(e))
+
+        self.delete(key)
@@ -6,10 +6,10 @@ import time
 import logging
 from typing import Dict, Any, Optional, List
 from cachetools import LRUCache
-import msgpack
 
 from infrastructure.cache.cache_service import CacheService
 from infrastructure.cache.cache_metrics import CacheMetrics
+from infrastructure.cache.serialization import pack, unpack
 
 # Configure logging
 logger = logging.getLogger("mcp_server.cache.memory")
@@ -68,7 +68,7 @@ class MemoryCache(CacheService):
         if isinstance(value, bytes):
             try:
                 # Deserialize the value
-                deserialized_value = msgpack.unpackb(value, raw=False)
+                deserialized_value = unpack(value)
 
                 # Convert to Resource object if requested
                 if resource_type == 'resource' and isinstance(deserialized_value, dict):
@@ -164,7 +164,7 @@ class MemoryCache(CacheService):
 
             # Serialize dictionaries, lists, and tuples
             if isinstance(value, (dict, list, tuple)) and not isinstance(value, bytes):
-                value = msgpack.packb(value, use_bin_type=True)
+                value = pack(value)
         except Exception as e:
             logger.warning(f"Could not serialize value for key {key}: {str(e)}")
             # Continue with storing the original value
@@ -6,13 +6,69 @@ import logging
 import msgpack
 from typing import Any, Optional
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; msgpack can encode everything on its own
+    orjson = None
+
 # Configure logging
 logger = logging.getLogger("mcp_server.cache.serialization")
 
+# orjson output for a list or dict starts with '[' or '{'. Those bytes are never the
+# first byte of a msgpack-encoded container, so pack() output can be decoded
+# unambiguously. Passthrough options make orjson reject types msgpack would also
+# reject instead of silently turning them into strings.
+_JSON_PREFIXES = (b"[", b"{")
+_ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_SUBCLASS
+    if orjson is not None else 0
+)
+
+
+def pack(value: Any) -> bytes:
+    """
+    Encode a dict, list, or tuple to bytes.
+    Uses orjson when available and the value is plain JSON data, msgpack otherwise
+    (e.g. non-string keys or bytes values).
+
+    Args:
+        value: Value to encode
+
+    Returns:
+        Encoded value
+
+    Raises:
+        Exception: If the value cannot be encoded
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=_ORJSON_OPTIONS)
+        except TypeError:
+            pass
+    return msgpack.packb(value, use_bin_type=True)
+
+
+def unpack(data: bytes) -> Any:
+    """
+    Decode bytes produced by pack().
+
+    Args:
+        data: Encoded value
+
+    Returns:
+        Decoded value
+
+    Raises:
+        Exception: If the data cannot be decoded
+    """
+    if orjson is not None and data[:1] in _JSON_PREFIXES:
+        return orjson.loads(data)
+    return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
 
 def serialize(value: Any) -> Optional[bytes]:
     """
-    Serialize a value to bytes using msgpack.
+    Serialize a value to bytes using orjson or msgpack (see pack()).
 
     Args:
         value: Value to serialize
@@ -22,7 +78,7 @@ def serialize(value: Any) -> Optional[bytes]:
     """
     try:
         if isinstance(value, (dict, list, tuple)) and not isinstance(value, bytes):
-            return msgpack.packb(value, use_bin_type=True)
+            return pack(value)
         return value
     except Exception as e:
         logger.error(f"Error serializing value: {str(e)}")
@@ -31,7 +87,7 @@ def serialize(value: Any) -> Optional[bytes]:
 
 def deserialize(value: Any) -> Any:
     """
-    Deserialize a value from bytes using msgpack.
+    Deserialize a value from bytes produced by serialize().
 
     Args:
         value: Value to deserialize
@@ -43,7 +99,7 @@ def deserialize(value: Any) -> Any:
         return value
         
     try:
-        return msgpack.unpackb(value, raw=False)
+        return unpack(value)
     except Exception as e:
         logger.error(f"Error deserializing value: {str(e)}")
         return value
@@ -74,7 +74,8 @@ class CircuitBreaker:
                 'success_count': breaker.success_count,
                 'total_calls': breaker.total_calls,
                 'error_rate': breaker.error_rate,
-                'last_state_change': breaker.last_state_change
+                'last_state_change': breaker.last_state_change,
+                'reset_timeout': breaker.reset_timeout
             }
             for name, breaker in cls._instances.items()
         }
@@ -94,7 +95,8 @@ class CircuitBreaker:
         error_rate_threshold: float = 0.5,
         consecutive_failures_threshold: int = 3,
         backoff_multiplier: float = 2.0,
-        max_reset_timeout: int = 1800  # 30 minutes max timeout
+        max_reset_timeout: int = 1800,  # 30 minutes max timeout
+        error_rate_min_calls: int = 1
     ):
         """
         Initialize a circuit breaker with enhanced features.
@@ -108,6 +110,7 @@ class CircuitBreaker:
             consecutive_failures_threshold: Number of consecutive failures to trigger circuit open
             backoff_multiplier: Multiplier for exponential backoff on repeated failures
             max_reset_timeout: Maximum reset timeout in seconds (cap for exponential backoff)
+            error_rate_min_calls: Minimum recent calls before the error rate can open the circuit
         """
         self.name = name
         self.failure_threshold = failure_threshold
@@ -118,6 +121,7 @@ class CircuitBreaker:
         self.consecutive_failures_threshold = consecutive_failures_threshold
         self.backoff_multiplier = backoff_multiplier
         self.max_reset_timeout = max_reset_timeout
+        self.error_rate_min_calls = error_rate_min_calls
 
         # State
         self.state = CircuitState.CLOSED
@@ -246,7 +250,8 @@ class CircuitBreaker:
             # 2. Error rate exceeds threshold
             # 3. Consecutive failures exceed threshold
             if (self.failure_count >= self.failure_threshold or
-                self.error_rate >= self.error_rate_threshold or
+                (len(self.call_history) >= self.error_rate_min_calls and
+                 self.error_rate >= self.error_rate_threshold) or
                 self.consecutive_failures >= self.consecutive_failures_threshold):
 
                 self.state = CircuitState.OPEN
@@ -285,6 +290,23 @@ class CircuitBreaker:
                 f"New reset timeout: {self.reset_timeout}s"
             )
 
+    def allow_request(self) -> bool:
+        """
+        Check whether a call may go through, for callers that track outcomes themselves.
+
+        Returns:
+            True if the call is allowed, False if the circuit is open
+        """
+        return self._should_allow_request()
+
+    def record_success(self) -> None:
+        """Record a successful call made after allow_request()."""
+        self._on_success()
+
+    def record_failure(self) -> None:
+        """Record a failed call made after allow_request()."""
+        self._on_failure()
+
     def execute(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
         """
         Execute a function with circuit breaker protection.
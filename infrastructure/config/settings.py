@@ -50,6 +50,11 @@ SEARCH = {
     'rate_limit': {
         'requests_per_minute': 10
     },
+    # Maximum in-flight requests per search engine
+    'max_concurrent_requests': {
+        'default': 10,
+        'brave': 5  # Brave's API plan enforces a stricter rate limit
+    },
     'brave_api_key': os.environ.get('BRAVE_API_KEY', None)  # Added Brave Search API key
 }
 
@@ -71,6 +76,15 @@ SCRAPING = {
 YOUTUBE = {
     'max_results': int(os.environ.get('YOUTUBE_MAX_RESULTS', 5)),
     'timeout': 15,  # seconds
+    'hedge_delay': 2.0,  # seconds before a slow service is hedged with the next one
+    'weighted_selection': True,  # Pick the first service by weight on each call
+    'rate_limit': {
+        'requests_per_second': 10,  # Client-side cap on API requests, retries included
+        'burst': 20
+    },
+    'max_concurrent_requests': 16,  # Maximum in-flight YouTube API requests
+    'ytdlp_max_concurrent_requests': 8,  # Maximum concurrent yt-dlp video detail extractions
+    'ytdlp_workers': 8,  # Threads dedicated to blocking yt-dlp extractions
     'api_key': os.environ.get('YOUTUBE_API_KEY', None)
 }
 
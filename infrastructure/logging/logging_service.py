@@ -13,60 +13,78 @@ class LoggingService(ABC):
     """
 
     @abstractmethod
-    def debug(self, message: str, **kwargs) -> None:
+    def debug(self, message: str, *args, **kwargs) -> None:
         """
         Log a debug message.
 
         Args:
-            message: Message to log
+            message: Message to log (may contain %-style placeholders)
+            *args: Arguments merged into the message only if it is emitted
             **kwargs: Additional context data
         """
         pass
 
     @abstractmethod
-    def info(self, message: str, **kwargs) -> None:
+    def info(self, message: str, *args, **kwargs) -> None:
         """
         Log an info message.
 
         Args:
-            message: Message to log
+            message: Message to log (may contain %-style placeholders)
+            *args: Arguments merged into the message only if it is emitted
             **kwargs: Additional context data
         """
         pass
 
     @abstractmethod
-    def warning(self, message: str, **kwargs) -> None:
+    def warning(self, message: str, *args, **kwargs) -> None:
         """
         Log a warning message.
 
         Args:
-            message: Message to log
+            message: Message to log (may contain %-style placeholders)
+            *args: Arguments merged into the message only if it is emitted
             **kwargs: Additional context data
         """
         pass
 
     @abstractmethod
-    def error(self, message: str, **kwargs) -> None:
+    def error(self, message: str, *args, **kwargs) -> None:
         """
         Log an error message.
 
         Args:
-            message: Message to log
+            message: Message to log (may contain %-style placeholders)
+            *args: Arguments merged into the message only if it is emitted
             **kwargs: Additional context data
         """
         pass
 
     @abstractmethod
-    def critical(self, message: str, **kwargs) -> None:
+    def critical(self, message: str, *args, **kwargs) -> None:
         """
         Log a critical message.
 
         Args:
-            message: Message to log
+            message: Message to log (may contain %-style placeholders)
+            *args: Arguments merged into the message only if it is emitted
             **kwargs: Additional context data
         """
         pass
 
+    @abstractmethod
+    def is_enabled_for(self, level: int) -> bool:
+        """
+        Check whether a message of the given level would be emitted.
+
+        Args:
+            level: Numeric logging level (e.g., logging.DEBUG)
+
+        Returns:
+            True if messages of this level are enabled
+        """
+        pass
+
     @abstractmethod
     def set_context(self, context: Dict[str, Any]) -> None:
         """
@@ -39,55 +39,72 @@ class StandardLogger(LoggingService):
             console_handler.setFormatter(self._get_formatter())
             self.logger.addHandler(console_handler)
 
-    def debug(self, message: str, **kwargs) -> None:
+    def debug(self, message: str, *args, **kwargs) -> None:
         """
         Log a debug message.
 
         Args:
-            message: Message to log
+            message: Message to log (may contain %-style placeholders)
+            *args: Arguments merged into the message only if it is emitted
             **kwargs: Additional context data
         """
-        self._log(logging.DEBUG, message, **kwargs)
+        self._log(logging.DEBUG, message, *args, **kwargs)
 
-    def info(self, message: str, **kwargs) -> None:
+    def info(self, message: str, *args, **kwargs) -> None:
         """
         Log an info message.
 
         Args:
-            message: Message to log
+            message: Message to log (may contain %-style placeholders)
+            *args: Arguments merged into the message only if it is emitted
             **kwargs: Additional context data
         """
-        self._log(logging.INFO, message, **kwargs)
+        self._log(logging.INFO, message, *args, **kwargs)
 
-    def warning(self, message: str, **kwargs) -> None:
+    def warning(self, message: str, *args, **kwargs) -> None:
         """
         Log a warning message.
 
         Args:
-            message: Message to log
+            message: Message to log (may contain %-style placeholders)
+            *args: Arguments merged into the message only if it is emitted
             **kwargs: Additional context data
         """
-        self._log(logging.WARNING, message, **kwargs)
+        self._log(logging.WARNING, message, *args, **kwargs)
 
-    def error(self, message: str, **kwargs) -> None:
+    def error(self, message: str, *args, **kwargs) -> None:
         """
         Log an error message.
 
         Args:
-            message: Message to log
+            message: Message to log (may contain %-style placeholders)
+            *args: Arguments merged into the message only if it is emitted
             **kwargs: Additional context data
         """
-        self._log(logging.ERROR, message, **kwargs)
+        self._log(logging.ERROR, message, *args, **kwargs)
 
-    def critical(self, message: str, **kwargs) -> None:
+    def critical(self, message: str, *args, **kwargs) -> None:
         """
         Log a critical message.
 
         Args:
-            message: Message to log
+            message: Message to log (may contain %-style placeholders)
+            *args: Arguments merged into the message only if it is emitted
             **kwargs: Additional context data
         """
-        self._log(logging.CRITICAL, message, **kwargs)
+        self._log(logging.CRITICAL, message, *args, **kwargs)
+
+    def is_enabled_for(self, level: int) -> bool:
+        """
+        Check whether a message of the given level would be emitted.
+
+        Args:
+            level: Numeric logging level (e.g., logging.DEBUG)
+
+        Returns:
+            True if messages of this level are enabled
+        """
+        return self.logger.isEnabledFor(level)
 
     def set_context(self, context: Dict[str, Any]) -> None:
         """
@@ -151,24 +168,33 @@ class StandardLogger(LoggingService):
         numeric_level = level_map.get(level.upper(), logging.INFO)
         self.logger.setLevel(numeric_level)
 
-    def _log(self, level: int, message: str, **kwargs) -> None:
+    def _log(self, level: int, message: str, *args, **kwargs) -> None:
         """
         Log a message with context.
 
         Args:
             level: Logging level
             message: Message to log
+            *args: Arguments for %-style formatting of the message
             **kwargs: Additional context data
         """
+        # Skip all formatting work for disabled levels
+        if not self.logger.isEnabledFor(level):
+            return
+
         # Combine context with kwargs
         context = {**self.context, **kwargs}
         
         # Add context to message if present
         if context:
+            # Format first so '%' characters in context values are left alone
+            if args:
+                message = message % args
+                args = ()
             context_str = " ".join(f"{k}={v}" for k, v in context.items())
             message = f"{message} [{context_str}]"
         
-        self.logger.log(level, message)
+        self.logger.log(level, message, *args)
 
     def _get_formatter(self) -> logging.Formatter:
         """
@@ -0,0 +1,60 @@
+"""
+Request coalescing for the MCP Server.
+
+Concurrent cache misses for the same key share one upstream lookup instead of
+each starting their own.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, TypeVar, cast
+
+# Configure logging
+logger = logging.getLogger("mcp_server.single_flight")
+
+T = TypeVar('T')
+
+
+class SingleFlight:
+    """
+    Runs at most one lookup per key at a time.
+
+    Callers arriving while a lookup for their key is running wait for that
+    lookup and share its result (or exception) instead of starting another.
+    """
+
+    def __init__(self, name: str = "lookup"):
+        """
+        Initialize the single-flight group.
+
+        Args:
+            name: Name of the lookups, used in log messages
+        """
+        self.name = name
+        self._inflight: Dict[str, "asyncio.Future[Any]"] = {}
+
+    def __len__(self) -> int:
+        """Number of lookups currently in flight."""
+        return len(self._inflight)
+
+    async def run(self, key: str, fetch: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run a lookup once per key, letting concurrent callers join it.
+
+        Args:
+            key: Key identifying the lookup, usually its cache key
+            fetch: Callable returning the awaitable that performs the lookup
+
+        Returns:
+            The lookup result, shared by every caller waiting on the same key
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            logger.debug("Joining in-flight %s for '%s'", self.name, key)
+
+        # Shield so a cancelled caller doesn't cancel the lookup other callers are waiting on
+        return cast(T, await asyncio.shield(task))
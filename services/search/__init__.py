@@ -3,7 +3,13 @@
 from services.search.search_service import SearchService
 from services.search.search_factory import SearchFactory
 
-# Create a global search instance
-search: SearchService = SearchFactory.create_search("default")
+# Lazy-loaded search service, so search engines are only imported and created on first use
+search = None
 
-__all__ = ["search", "SearchService", "SearchFactory"]
+def get_search() -> SearchService:
+    global search
+    if search is None:
+        search = SearchFactory.create_search("default")
+    return search
+
+__all__ = ["get_search", "SearchService", "SearchFactory"]
@@ -10,6 +10,7 @@ from typing import Dict, List, Any, Optional
 from infrastructure.logging import logger
 from infrastructure.cache import cache
 from infrastructure.config import config
+from infrastructure.circuit_breaker import CircuitBreakerOpenError
 from services.search.search_service import SearchService
 
 
@@ -30,6 +31,9 @@ class BaseSearch(SearchService):
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36 Edg/91.0.864.59"
     ]
 
+    # Upper bound in seconds for a single retry backoff in search_with_retry
+    MAX_RETRY_DELAY = 30
+
     def __init__(self, name: str, cache_ttl: int = 86400):
         """
         Initialize the search service.
@@ -46,6 +50,11 @@ class BaseSearch(SearchService):
         search_config = config.get_section("SEARCH")
         self.timeout = search_config.get("timeout", 15)
         self.rate_limit = search_config.get("rate_limit", {}).get("requests_per_minute", 10)
+
+        # Bound in-flight requests to this engine's upstream
+        concurrency = search_config.get("max_concurrent_requests", {})
+        self.max_concurrent_requests = concurrency.get(name, concurrency.get("default", 10))
+        self.request_semaphore = asyncio.Semaphore(self.max_concurrent_requests)
         
         self.logger.info(f"Initialized {name} search service")
 
@@ -121,6 +130,9 @@ class BaseSearch(SearchService):
                                max_retries: int = 3, backoff_factor: float = 1.5) -> List[Dict[str, Any]]:
         """
         Search with retry and exponential backoff.
+        Uses "full jitter" (a random delay between 0 and the capped exponential
+        backoff) so retries from concurrent callers don't synchronize.
+        An open circuit breaker is not retried.
 
         Args:
             query: Search query
@@ -166,12 +178,17 @@ class BaseSearch(SearchService):
                     self.logger.warning(f"No results found for '{query}'")
                     return []
 
+            except CircuitBreakerOpenError:
+                # Retrying can't succeed until the breaker's reset timeout has passed
+                self.logger.warning(f"Circuit breaker open for {self.name}, not retrying '{query}'")
+                return []
+
             except Exception as e:
                 retries += 1
 
                 if retries < max_retries:
-                    # Calculate wait time with exponential backoff and jitter
-                    wait_time = (backoff_factor ** retries) * random.uniform(0.5, 1.5)
+                    # Calculate wait time with capped exponential backoff and full jitter
+                    wait_time = random.uniform(0, min(self.MAX_RETRY_DELAY, backoff_factor ** retries))
                     self.logger.warning(f"Attempt {retries}/{max_retries} failed for '{query}'. Waiting {wait_time:.2f}s before next attempt.")
                     await asyncio.sleep(wait_time)
                 else:
@@ -71,7 +71,7 @@ class BraveSearch(BaseSearch):
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self.request_semaphore, aiohttp.ClientSession() as session:
                 async with session.get(self.API_BASE_URL, params=params, headers=headers) as response:
                     if response.status != 200:
                         self.logger.error(f"Brave Search API error: {response.status}")
@@ -3,30 +3,41 @@ DuckDuckGo search implementation with rate limit handling and circuit breaker pr
 """
 
 import asyncio
+import logging
 import random
 import time
-from typing import Dict, List, Any
-from duckduckgo_search import DDGS
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type
-)
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, List, Any, ClassVar, Mapping, Optional, Tuple, TYPE_CHECKING
+from urllib.parse import parse_qs, urlparse
 
 from services.search.base_search import BaseSearch
 from infrastructure.circuit_breaker import async_circuit_breaker, CircuitBreakerOpenError, CircuitBreaker
 
+if TYPE_CHECKING:
+    import httpx
+
+# Marker stored in the negative cache for queries that recently hit a rate limit
+_RATE_LIMITED_SENTINEL = object()
+
+
+class DuckDuckGoRateLimitError(Exception):
+    """Raised when DuckDuckGo throttles a request. Not retried, since retrying only prolongs the throttling."""
+
+    def __init__(self, status_code: Optional[int] = None):
+        super().__init__(f"DuckDuckGo rate limit: HTTP {status_code}" if status_code else "DuckDuckGo rate limit (cached)")
+        self.status_code = status_code
+
 
 class DuckDuckGoSearch(BaseSearch):
     """
     DuckDuckGo search implementation with rate limit handling.
-    Uses the duckduckgo_search library to search the web with retry logic
-    and advanced rate limit avoidance techniques.
+    Queries DuckDuckGo's HTML endpoint through a shared, pooled HTTP client
+    with retry logic and advanced rate limit avoidance techniques.
     """
 
     # Mapping of language codes to DuckDuckGo regions
-    LANGUAGE_TO_REGION = {
+    LANGUAGE_TO_REGION: ClassVar[Mapping[str, str]] = MappingProxyType({
         "en": "us-en",
         "pt": "br-pt",
         "es": "es-es",
@@ -37,10 +48,10 @@ class DuckDuckGoSearch(BaseSearch):
         "ru": "ru-ru",
         "ja": "jp-jp",
         "zh": "cn-zh",
-    }
+    })
 
     # Extended list of User Agents for better rotation
-    EXTENDED_USER_AGENTS = [
+    EXTENDED_USER_AGENTS: ClassVar[Tuple[str, ...]] = (
         # Chrome on Windows
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36",
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/95.0.4638.69 Safari/537.36",
@@ -67,10 +78,10 @@ class DuckDuckGoSearch(BaseSearch):
         "Mozilla/5.0 (iPad; CPU OS 15_1 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.1 Mobile/15E148 Safari/604.1",
         "Mozilla/5.0 (Linux; Android 12; SM-G991B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.45 Mobile Safari/537.36",
         "Mozilla/5.0 (Linux; Android 11; Pixel 5) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.45 Mobile Safari/537.36",
-    ]
+    )
 
     # Accept-Language headers for different languages
-    ACCEPT_LANGUAGE_HEADERS = {
+    ACCEPT_LANGUAGE_HEADERS: ClassVar[Mapping[str, str]] = MappingProxyType({
         "en": "en-US,en;q=0.9",
         "pt": "pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7",
         "es": "es-ES,es;q=0.9,en-US;q=0.8,en;q=0.7",
@@ -81,7 +92,29 @@ class DuckDuckGoSearch(BaseSearch):
         "ru": "ru-RU,ru;q=0.9,en-US;q=0.8,en;q=0.7",
         "ja": "ja-JP,ja;q=0.9,en-US;q=0.8,en;q=0.7",
         "zh": "zh-CN,zh;q=0.9,en-US;q=0.8,en;q=0.7",
-    }
+    })
+
+    # Optional headers and their candidate values, included at random per request
+    OPTIONAL_HEADERS: ClassVar[Mapping[str, Tuple[str, ...]]] = MappingProxyType({
+        'Referer': ('https://duckduckgo.com/', 'https://www.google.com/', 'https://www.bing.com/'),
+        'DNT': ('1',),
+        'Sec-Fetch-Dest': ('document', 'empty'),
+        'Sec-Fetch-Mode': ('navigate', 'cors'),
+        'Sec-Fetch-Site': ('same-origin', 'cross-site', 'none'),
+        'Upgrade-Insecure-Requests': ('1',),
+        'Cache-Control': ('max-age=0', 'no-cache', 'max-age=300'),
+        'Connection': ('keep-alive',),
+        'Pragma': ('no-cache',),
+    })
+
+    # HTML search endpoint (no JavaScript required)
+    HTML_SEARCH_URL = "https://html.duckduckgo.com/html/"
+
+    # Negative cache settings: how long to remember empty results and rate
+    # limits for a query, and how many queries to remember at most
+    NEGATIVE_CACHE_TTL = 60
+    RATE_LIMIT_CACHE_TTL = 30
+    NEGATIVE_CACHE_MAX_SIZE = 256
 
     def __init__(self, cache_ttl: int = 86400):
         """
@@ -96,8 +129,15 @@ class DuckDuckGoSearch(BaseSearch):
         self.last_request_time = 0
         self.min_request_interval = 3.5  # Increased from 2.0 to 3.5 seconds between requests
 
-        # Initialize semaphore for rate limiting
-        self.semaphore = asyncio.Semaphore(1)  # Allow only 1 concurrent request
+        # Serialize request pacing so the rate limiting below sees one request at a time
+        # (in-flight requests are bounded by BaseSearch.request_semaphore)
+        self.request_lock = asyncio.Lock()
+
+        # Shared HTTP client, created on first search so connections are reused across queries
+        self._client: Optional["httpx.AsyncClient"] = None
+
+        # Recently failed queries: key -> (expires_at, [] or _RATE_LIMITED_SENTINEL)
+        self._negative_cache: "OrderedDict[Tuple[str, int, str], Tuple[float, Any]]" = OrderedDict()
 
         # Track success/failure rate
         self.success_count = 0
@@ -175,21 +215,8 @@ class DuckDuckGoSearch(BaseSearch):
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
         }
 
-        # Additional headers with randomized inclusion
-        optional_headers = {
-            'Referer': ['https://duckduckgo.com/', 'https://www.google.com/', 'https://www.bing.com/'],
-            'DNT': ['1'],
-            'Sec-Fetch-Dest': ['document', 'empty'],
-            'Sec-Fetch-Mode': ['navigate', 'cors'],
-            'Sec-Fetch-Site': ['same-origin', 'cross-site', 'none'],
-            'Upgrade-Insecure-Requests': ['1'],
-            'Cache-Control': ['max-age=0', 'no-cache', 'max-age=300'],
-            'Connection': ['keep-alive', 'close'],
-            'Pragma': ['no-cache'],
-        }
-
         # Add some optional headers randomly
-        for header, values in optional_headers.items():
+        for header, values in self.OPTIONAL_HEADERS.items():
             if random.random() > 0.3:  # 70% chance to include each optional header
                 headers[header] = random.choice(values)
 
@@ -198,6 +225,67 @@ class DuckDuckGoSearch(BaseSearch):
         random.shuffle(header_items)
         return dict(header_items)
 
+    def _get_client(self) -> "httpx.AsyncClient":
+        """
+        Get the shared HTTP client, creating it on first use.
+
+        Returns:
+            httpx.AsyncClient with keep-alive connection pooling
+        """
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                timeout=10,  # 10 second timeout per request
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=20, keepalive_expiry=300),
+                follow_redirects=True,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """
+        Close the shared HTTP client. Safe to call more than once.
+        """
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+            self.logger.debug("Closed DuckDuckGo HTTP client")
+
+    def _get_negative_result(self, key: Tuple[str, int, str]) -> Optional[Any]:
+        """
+        Look up a query in the negative cache.
+
+        Args:
+            key: Negative cache key (query, max_results, language)
+
+        Returns:
+            An empty list, _RATE_LIMITED_SENTINEL, or None if there is no live entry
+        """
+        entry = self._negative_cache.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._negative_cache[key]
+            return None
+
+        return value
+
+    def _remember_negative_result(self, key: Tuple[str, int, str], ttl: float, value: Any) -> None:
+        """
+        Store a failed query in the negative cache, evicting the oldest entry when full.
+
+        Args:
+            key: Negative cache key (query, max_results, language)
+            ttl: Time to live in seconds
+            value: An empty list or _RATE_LIMITED_SENTINEL
+        """
+        self._negative_cache[key] = (time.monotonic() + ttl, value)
+        self._negative_cache.move_to_end(key)
+        while len(self._negative_cache) > self.NEGATIVE_CACHE_MAX_SIZE:
+            self._negative_cache.popitem(last=False)
+
     @async_circuit_breaker("duckduckgo_search")
     async def _search_impl(self, query: str, max_results: int, language: str) -> List[Dict[str, Any]]:
         """
@@ -214,14 +302,24 @@ class DuckDuckGoSearch(BaseSearch):
         Raises:
             CircuitBreakerOpenError: If the circuit breaker is open
         """
+        # Fail fast on queries that recently came back empty or rate limited
+        negative_key = (query, max_results, language)
+        negative_result = self._get_negative_result(negative_key)
+        if negative_result is _RATE_LIMITED_SENTINEL:
+            self.logger.debug("Skipping DuckDuckGo request for '%s': recently rate limited", query)
+            raise DuckDuckGoRateLimitError()
+        if negative_result is not None:
+            self.logger.debug("Skipping DuckDuckGo request for '%s': recently returned no results", query)
+            return []
+
         # Get region for language
         region = self.get_region_for_language(language)
 
         # Generate random headers
         headers = self.get_random_headers(language)
 
-        # Use semaphore for rate limiting
-        async with self.semaphore:
+        # Serialize request pacing for rate limiting; the request itself runs outside the lock
+        async with self.request_lock:
             # Ensure minimum time between requests
             current_time = time.time()
             time_since_last_request = current_time - self.last_request_time
@@ -233,13 +331,13 @@ class DuckDuckGoSearch(BaseSearch):
                 if failure_rate > 0.3:  # If more than 30% of requests fail
                     # Increase delay up to 2x based on failure rate
                     dynamic_interval = self.min_request_interval * (1 + failure_rate)
-                    self.logger.info(f"Increasing delay due to high failure rate ({failure_rate:.2f}): {dynamic_interval:.2f}s")
+                    self.logger.info("Increasing delay due to high failure rate (%.2f): %.2fs", failure_rate, dynamic_interval)
 
             if time_since_last_request < dynamic_interval:
                 delay = dynamic_interval - time_since_last_request
                 # Add more jitter (0.8-1.2) to avoid patterns
                 delay_with_jitter = delay * (0.8 + 0.4 * random.random())
-                self.logger.debug(f"Rate limiting: waiting {delay_with_jitter:.2f}s before next request")
+                self.logger.debug("Rate limiting: waiting %.2fs before next request", delay_with_jitter)
                 await asyncio.sleep(delay_with_jitter)
 
             # Update last request time
@@ -248,76 +346,92 @@ class DuckDuckGoSearch(BaseSearch):
             # Increment total requests counter
             self.total_requests += 1
 
+        try:
+            # Set a timeout for the entire operation
+            search_timeout = 15  # 15 seconds timeout for the entire search operation
             try:
-                # Run in a separate thread to avoid blocking the event loop
-                loop = asyncio.get_event_loop()
-
-                # Set a timeout for the entire operation
-                search_timeout = 15  # 15 seconds timeout for the entire search operation
-                try:
-                    search_task = loop.run_in_executor(
-                        None,
-                        self._perform_ddg_search_with_retry,
-                        query, max_results, region, headers
+                async with self.request_semaphore:
+                    results = await asyncio.wait_for(
+                        self._perform_ddg_search_with_retry(query, max_results, region, headers),
+                        timeout=search_timeout
                     )
-                    results = await asyncio.wait_for(search_task, timeout=search_timeout)
-                except asyncio.TimeoutError:
-                    self.logger.error(f"Timeout after {search_timeout}s searching DuckDuckGo for '{query}'")
-                    self.failure_count += 1
-                    # Treat timeouts as a serious failure that should trigger circuit breaker
-                    raise Exception(f"DuckDuckGo search timeout after {search_timeout}s")
-
-                if results:
-                    # Check if results are valid (have required fields)
-                    valid_results = [r for r in results if r.get('url') and r.get('title')]
-
-                    if valid_results:
-                        self.logger.info(f"Search successful with {self.name} ({len(valid_results)} valid results)")
-                        # Track success
-                        self.success_count += 1
-                        return valid_results
-                    else:
-                        self.logger.warning(f"DuckDuckGo returned {len(results)} results but none were valid for '{query}'")
-                        # Track failure - invalid results count as failures
-                        self.failure_count += 1
-                        return []
+            except asyncio.TimeoutError:
+                self.logger.error("Timeout after %ss searching DuckDuckGo for '%s'", search_timeout, query)
+                self.failure_count += 1
+                # Treat timeouts as a serious failure that should trigger circuit breaker
+                raise Exception(f"DuckDuckGo search timeout after {search_timeout}s")
+
+            if results:
+                # Check if results are valid (have required fields)
+                valid_results = [r for r in results if r.get('url') and r.get('title')]
+
+                if valid_results:
+                    self.logger.info("Search successful with %s (%d valid results)", self.name, len(valid_results))
+                    # Track success
+                    self.success_count += 1
+                    return valid_results
                 else:
-                    self.logger.warning(f"No search results found for '{query}'")
-                    # Track failure - empty results count as failures
+                    self.logger.warning("DuckDuckGo returned %d results but none were valid for '%s'", len(results), query)
+                    # Track failure - invalid results count as failures
                     self.failure_count += 1
+                    self._remember_negative_result(negative_key, self.NEGATIVE_CACHE_TTL, [])
                     return []
-            except CircuitBreakerOpenError:
-                # Re-raise circuit breaker errors to be handled by the fallback search service
-                self.logger.warning(f"Circuit breaker open for DuckDuckGo search, failing fast")
-                # Track failure
-                self.failure_count += 1
-                raise
-            except Exception as e:
-                self.logger.error(f"Error in DuckDuckGo search: {str(e)}")
-                # Track failure
+            else:
+                self.logger.warning("No search results found for '%s'", query)
+                # Track failure - empty results count as failures
                 self.failure_count += 1
+                self._remember_negative_result(negative_key, self.NEGATIVE_CACHE_TTL, [])
+                return []
+        except CircuitBreakerOpenError:
+            # Re-raise circuit breaker errors to be handled by the fallback search service
+            self.logger.warning("Circuit breaker open for DuckDuckGo search, failing fast")
+            # Track failure
+            self.failure_count += 1
+            raise
+        except DuckDuckGoRateLimitError as e:
+            self.logger.error("DuckDuckGo rate limit detected: %s", e)
+            # Track failure
+            self.failure_count += 1
+
+            # Increase the min request interval temporarily
+            self.min_request_interval = min(10.0, self.min_request_interval * 1.5)
+            self.logger.info("Increased min request interval to %ss", self.min_request_interval)
+            self._remember_negative_result(negative_key, self.RATE_LIMIT_CACHE_TTL, _RATE_LIMITED_SENTINEL)
+
+            # Re-raise to trigger circuit breaker
+            raise
+        except Exception as e:
+            self.logger.error("Error in DuckDuckGo search: %s", e)
+            # Track failure
+            self.failure_count += 1
+            return []
 
-                # Check for rate limit errors specifically
-                error_str = str(e).lower()
-                if "ratelimit" in error_str or "rate limit" in error_str or "429" in error_str or "too many requests" in error_str:
-                    self.logger.error(f"DuckDuckGo rate limit detected: {str(e)}")
-                    # Increase the min request interval temporarily
-                    self.min_request_interval = min(10.0, self.min_request_interval * 1.5)
-                    self.logger.info(f"Increased min request interval to {self.min_request_interval}s")
+    async def _perform_ddg_search_with_retry(self, query: str, max_results: int, region: str, headers: Dict[str, str]) -> List[Dict[str, Any]]:
+        """
+        Perform the DuckDuckGo search with retry logic.
 
-                    # Re-raise to trigger circuit breaker
-                    raise
+        Args:
+            query: Search query
+            max_results: Maximum number of results to return
+            region: DuckDuckGo region code
+            headers: HTTP headers for the request
 
-                return []
+        Returns:
+            List of dictionaries with title, URL, and description
+        """
+        from tenacity import AsyncRetrying, stop_after_attempt, wait_exponential, retry_if_not_exception_type
 
-    @retry(
-        stop=stop_after_attempt(4),  # Increased from 3 to 4 attempts
-        wait=wait_exponential(multiplier=2, min=3, max=15),  # More aggressive backoff
-        retry=retry_if_exception_type((Exception))
-    )
-    def _perform_ddg_search_with_retry(self, query: str, max_results: int, region: str, headers: Dict[str, str]) -> List[Dict[str, Any]]:
+        retrying = AsyncRetrying(
+            stop=stop_after_attempt(4),  # Increased from 3 to 4 attempts
+            wait=wait_exponential(multiplier=2, min=3, max=15),  # More aggressive backoff
+            # Rate limits are raised straight away, so _search_impl can back off and remember them
+            retry=retry_if_not_exception_type(DuckDuckGoRateLimitError)
+        )
+        return await retrying(self._perform_ddg_search, query, max_results, region, headers)
+
+    async def _perform_ddg_search(self, query: str, max_results: int, region: str, headers: Dict[str, str]) -> List[Dict[str, Any]]:
         """
-        Perform the actual DuckDuckGo search with enhanced retry logic and error handling.
+        Perform the actual DuckDuckGo search with enhanced error handling.
 
         Args:
             query: Search query
@@ -331,95 +445,129 @@ class DuckDuckGoSearch(BaseSearch):
         results = []
 
         try:
-            self.logger.info(f"Starting DuckDuckGo search for query: '{query}', max_results: {max_results}, region: {region}")
+            self.logger.info("Starting DuckDuckGo search for query: '%s', max_results: %s, region: %s", query, max_results, region)
 
             # Only log headers in debug mode to avoid exposing sensitive information
-            if self.logger.isEnabledFor(10):  # DEBUG level
+            if self.logger.is_enabled_for(logging.DEBUG):
                 # Redact potentially sensitive header values
                 safe_headers = headers.copy()
                 for k in safe_headers:
                     if k.lower() in ('cookie', 'authorization', 'x-api-key'):
                         safe_headers[k] = '[REDACTED]'
-                self.logger.debug(f"Using headers: {safe_headers}")
-
-            # Request more results than needed to account for filtering
-            request_max_results = max(15, max_results * 2)
-
-            # Set a timeout for the DDGS operation
-            with DDGS(headers=headers, timeout=10) as ddgs:  # 10 second timeout
-                try:
-                    # Use a list comprehension with a timeout check
-                    start_time = time.time()
-                    max_time = 8  # 8 seconds max for the actual search
-
-                    # Get raw results with timeout check
-                    raw_results = []
-                    for result in ddgs.text(query, max_results=request_max_results, region=region):
-                        raw_results.append(result)
-
-                        # Check if we've exceeded our time limit
-                        if time.time() - start_time > max_time:
-                            self.logger.warning(f"Stopping DuckDuckGo search early after {max_time}s with {len(raw_results)} results")
-                            break
-
-                    self.logger.info(f"DuckDuckGo raw results count: {len(raw_results)}")
-
-                    # Process results with better error handling
-                    for r in raw_results:
-                        if not isinstance(r, dict):
-                            self.logger.warning(f"Skipping invalid result (not a dict): {type(r)}")
-                            continue
-
-                        # Extract and validate fields
-                        title = r.get('title')
-                        url = r.get('href')
-                        body = r.get('body', '')
-
-                        if not title or not url:
-                            self.logger.debug(f"Skipping result with missing title or URL: {r}")
-                            continue
-
-                        # Truncate description if needed
-                        description = body[:200] + '...' if body and len(body) > 200 else body
-
-                        results.append({
-                            "title": title,
-                            "url": url,
-                            "description": description,
-                        })
-
-                except Exception as inner_e:
-                    self.logger.error(f"Error during DuckDuckGo search execution: {str(inner_e)}")
-                    # Check for rate limiting indicators
-                    error_str = str(inner_e).lower()
-                    if "ratelimit" in error_str or "429" in error_str or "too many requests" in error_str:
-                        self.logger.error("DuckDuckGo rate limit detected in inner exception")
-                        raise Exception(f"DuckDuckGo rate limit: {str(inner_e)}")
-                    raise
-
-            self.logger.info(f"DuckDuckGo search completed with {len(results)} processed results")
+                self.logger.debug("Using headers: %s", safe_headers)
+
+            response = await self._get_client().post(
+                self.HTML_SEARCH_URL,
+                data={"q": query, "kl": region},
+                headers=headers,
+            )
+
+            # DuckDuckGo answers throttled clients with 202/403 instead of results
+            if response.status_code in (202, 403, 429):
+                raise DuckDuckGoRateLimitError(response.status_code)
+            response.raise_for_status()
+
+            raw_results = self._parse_html_results(response.text)
+            self.logger.info("DuckDuckGo raw results count: %d", len(raw_results))
+
+            append = results.append
+            for r in raw_results:
+                # Extract and validate fields
+                title = r['title']
+                url = r['href']
+                body = r['body']
+
+                if not title or not url:
+                    self.logger.debug("Skipping result with missing title or URL: %s", r)
+                    continue
+
+                # Truncate description if needed
+                description = f"{body[:200]}..." if len(body) > 200 else body
+
+                append({
+                    "title": title,
+                    "url": url,
+                    "description": description,
+                })
+
+            self.logger.info("DuckDuckGo search completed with %d processed results", len(results))
             if len(results) == 0:
-                self.logger.warning(f"DuckDuckGo returned zero results for query: '{query}'")
+                self.logger.warning("DuckDuckGo returned zero results for query: '%s'", query)
 
             # Limit to requested max_results
             return results[:max_results]
 
+        except DuckDuckGoRateLimitError:
+            raise
         except Exception as e:
             error_str = str(e).lower()
 
             # Special handling for common error types
-            if "ratelimit" in error_str or "429" in error_str or "too many requests" in error_str:
-                self.logger.error(f"DuckDuckGo rate limit detected: {str(e)}")
-                # Make this error more identifiable for circuit breaker
-                raise Exception(f"DuckDuckGo rate limit: {str(e)}")
-            elif "timeout" in error_str:
-                self.logger.error(f"DuckDuckGo timeout: {str(e)}")
+            if "timeout" in error_str:
+                self.logger.error("DuckDuckGo timeout: %s", e)
                 raise Exception(f"DuckDuckGo timeout: {str(e)}")
             elif "connection" in error_str or "network" in error_str:
-                self.logger.error(f"DuckDuckGo connection error: {str(e)}")
+                self.logger.error("DuckDuckGo connection error: %s", e)
                 raise Exception(f"DuckDuckGo connection error: {str(e)}")
             else:
-                self.logger.error(f"Error in DuckDuckGo search thread: {str(e)}")
-                self.logger.error(f"Query: '{query}', Region: {region}")
+                self.logger.error("Error in DuckDuckGo search request: %s", e)
+                self.logger.error("Query: '%s', Region: %s", query, region)
                 # Re-raise the exception to trigger retry
                 raise
+
+    def _parse_html_results(self, html_text: str) -> List[Dict[str, str]]:
+        """
+        Extract organic results from a DuckDuckGo HTML results page.
+
+        Args:
+            html_text: Response body of the HTML endpoint
+
+        Returns:
+            List of dictionaries with title, href, and body
+        """
+        if not html_text:
+            return []
+
+        from lxml import html as lxml_html
+
+        tree = lxml_html.fromstring(html_text)
+        raw_results = []
+        for node in tree.xpath('//div[contains(concat(" ", normalize-space(@class), " "), " result ")]'):
+            # Skip sponsored results
+            if "result--ad" in node.get("class", "").split():
+                continue
+
+            links = node.xpath('.//a[contains(@class, "result__a")]')
+            if not links:
+                continue
+
+            snippets = node.xpath('.//*[contains(@class, "result__snippet")]')
+            raw_results.append({
+                "title": links[0].text_content().strip(),
+                "href": self._resolve_result_url(links[0].get("href", "")),
+                "body": snippets[0].text_content().strip() if snippets else "",
+            })
+
+        return raw_results
+
+    @staticmethod
+    def _resolve_result_url(href: str) -> str:
+        """
+        Unwrap DuckDuckGo's redirect links (//duckduckgo.com/l/?uddg=...) to the target URL.
+
+        Args:
+            href: Link as it appears in the results page
+
+        Returns:
+            Target URL
+        """
+        if href.startswith("//"):
+            href = f"https:{href}"
+
+        parsed = urlparse(href)
+        if parsed.path.startswith("/l/"):
+            target = parse_qs(parsed.query).get("uddg")
+            if target:
+                return target[0]
+
+        return href
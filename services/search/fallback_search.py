@@ -3,14 +3,50 @@ Fallback search implementation that combines multiple search engines with circui
 """
 
 import asyncio
-from typing import Dict, List, Any, Optional, Tuple
+import heapq
+import time
+from typing import Dict, FrozenSet, List, Any, Optional, Tuple
+from urllib.parse import urlsplit
 
 from infrastructure.logging import logger
 from infrastructure.cache import cache
+from infrastructure.cache.local_cache import LocalCache
 from infrastructure.circuit_breaker import CircuitBreakerOpenError, CircuitBreaker
+from infrastructure.single_flight import SingleFlight
 from services.search.base_search import BaseSearch
 from services.search.search_service import SearchService
 
+# Process-local tier in front of the shared cache.
+# Hot queries are answered from here without deserializing from the shared cache.
+_local_cache = LocalCache(max_size=512, ttl=300)
+
+
+# Query parameters that only track the click source and never change the page
+_TRACKING_PARAM_PREFIXES = ("utm_", "fbclid", "gclid")
+
+
+def _canonical_url(url: str) -> Tuple[str, str, FrozenSet[str]]:
+    """
+    Normalize a URL for duplicate detection.
+    Ignores the scheme, a leading "www.", trailing slashes, query parameter
+    order, and tracking parameters.
+
+    Args:
+        url: Result URL
+
+    Returns:
+        Hashable key that is equal for URLs pointing at the same page
+    """
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    params = frozenset(
+        param for param in parts.query.split("&")
+        if param and not param.startswith(_TRACKING_PARAM_PREFIXES)
+    )
+    return host, parts.path.rstrip("/"), params
+
 
 class FallbackSearch(BaseSearch):
     """
@@ -29,10 +65,14 @@ class FallbackSearch(BaseSearch):
         super().__init__(name="fallback", cache_ttl=cache_ttl)
         self.search_engines = search_engines
 
+        # Searches currently running, keyed by cache key
+        self._inflight = SingleFlight("search")
+
         engine_names = [engine[0].name for engine in search_engines]
-        self.logger.info(f"Initialized fallback search with engines: {', '.join(engine_names)}")
+        self.logger.info("Initialized fallback search with engines: %s", ', '.join(engine_names))
 
-    async def _search_impl(self, query: str, max_results: int, language: str) -> List[Dict[str, Any]]:
+    async def _search_impl(self, query: str, max_results: int, language: str,
+                           open_breakers: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
         Search using multiple search engines with fallback.
         Handles circuit breaker exceptions to gracefully fail over to the next engine.
@@ -41,53 +81,54 @@ class FallbackSearch(BaseSearch):
             query: Search query
             max_results: Maximum number of results to return
             language: Language code (e.g., 'en', 'pt')
+            open_breakers: Names of open circuit breakers, if the caller already has them
 
         Returns:
             List of dictionaries with title, URL, and description
         """
         # Check if any circuit breakers are open
-        circuit_breakers = CircuitBreaker.get_all_statuses()
-        open_breakers = [name for name, status in circuit_breakers.items() if status["state"] == "OPEN"]
+        if open_breakers is None:
+            open_breakers = self._open_breakers(CircuitBreaker.get_all_statuses())
 
         if open_breakers:
-            self.logger.warning(f"Circuit breakers are open for: {', '.join(open_breakers)}")
+            self.logger.warning("Circuit breakers are open for: %s", ', '.join(open_breakers))
 
             # If DuckDuckGo is open, try to use Brave directly
             if "duckduckgo_search" in open_breakers:
                 for engine, weight in self.search_engines:
                     if engine.name == "brave":
-                        self.logger.info(f"DuckDuckGo circuit breaker is open, trying Brave Search directly for query: '{query}'")
+                        self.logger.info("DuckDuckGo circuit breaker is open, trying Brave Search directly for query: '%s'", query)
                         try:
                             results = await engine.search(query, max_results, language)
                             if results:
-                                self.logger.info(f"Search successful with Brave ({len(results)} results) for query: '{query}'")
+                                self.logger.info("Search successful with Brave (%d results) for query: '%s'", len(results), query)
                                 return results
                             else:
-                                self.logger.warning(f"No results from Brave for query: '{query}'")
+                                self.logger.warning("No results from Brave for query: '%s'", query)
                         except Exception as e:
-                            self.logger.error(f"Error with Brave Search for query: '{query}': {str(e)}")
+                            self.logger.error("Error with Brave Search for query: '%s': %s", query, e)
                         break
 
         # Try each search engine in order
         for engine, weight in self.search_engines:
             try:
-                self.logger.info(f"Trying search engine: {engine.name} for query: '{query}'")
+                self.logger.info("Trying search engine: %s for query: '%s'", engine.name, query)
                 results = await engine.search(query, max_results, language)
 
                 if results:
-                    self.logger.info(f"Search successful with {engine.name} ({len(results)} results) for query: '{query}'")
+                    self.logger.info("Search successful with %s (%d results) for query: '%s'", engine.name, len(results), query)
                     return results
                 else:
-                    self.logger.warning(f"No results from {engine.name} for query: '{query}', trying next engine")
+                    self.logger.warning("No results from %s for query: '%s', trying next engine", engine.name, query)
             except CircuitBreakerOpenError:
                 # Circuit breaker is open for this engine, try the next one
-                self.logger.warning(f"Circuit breaker open for {engine.name}, skipping to next engine for query: '{query}'")
+                self.logger.warning("Circuit breaker open for %s, skipping to next engine for query: '%s'", engine.name, query)
                 continue
             except Exception as e:
-                self.logger.error(f"Error with search engine {engine.name} for query: '{query}': {str(e)}")
+                self.logger.error("Error with search engine %s for query: '%s': %s", engine.name, query, e)
 
         # If all engines fail, return empty list
-        self.logger.error(f"All search engines failed for query: {query}")
+        self.logger.error("All search engines failed for query: %s", query)
         return []
 
     async def search(self, query: str, max_results: int = 10, language: str = "en") -> List[Dict[str, Any]]:
@@ -105,44 +146,70 @@ class FallbackSearch(BaseSearch):
         """
         # Check cache first
         cache_key = f"search:{self.name}:{query}_{max_results}_{language}"
+        cached_result = _local_cache.get(cache_key)
+        if cached_result:
+            return cached_result
+
         cached_result = cache.get(cache_key)
         if cached_result:
-            self.logger.debug(f"Using cached search results for '{query}'")
+            self.logger.debug("Using cached search results for '%s'", query)
+            _local_cache.set(cache_key, cached_result, self.cache_ttl)
             return cached_result
 
-        # Check if any circuit breakers are open
-        circuit_breakers = CircuitBreaker.get_all_statuses()
-        open_breakers = [name for name, status in circuit_breakers.items() if status["state"] == "OPEN"]
+        # Coalesce concurrent identical searches into a single fan-out
+        results = await self._inflight.run(
+            cache_key, lambda: self._search_and_cache(query, max_results, language, cache_key)
+        )
+        return list(results)
+
+    async def _search_and_cache(self, query: str, max_results: int, language: str, cache_key: str) -> List[Dict[str, Any]]:
+        """
+        Run the uncached search and store the results.
+
+        Args:
+            query: Search query
+            max_results: Maximum number of results to return
+            language: Language code (e.g., 'en', 'pt')
+            cache_key: Cache key for the combined results
+
+        Returns:
+            List of dictionaries with title, URL, and description
+        """
+        # Take one snapshot of the circuit breakers for the whole search
+        statuses = CircuitBreaker.get_all_statuses()
+        open_breakers = self._open_breakers(statuses)
 
         # Use parallel search by default for better results
         if open_breakers:
-            self.logger.warning(f"Circuit breakers are open for: {', '.join(open_breakers)}")
-            self.logger.info(f"Using parallel search for query: '{query}' due to open circuit breakers")
-            results = await self.search_parallel_impl(query, max_results, language)
+            self.logger.warning("Circuit breakers are open for: %s", ', '.join(open_breakers))
+            self.logger.info("Using parallel search for query: '%s' due to open circuit breakers", query)
+            results = await self.search_parallel_impl(query, max_results, language, statuses=statuses)
         else:
             # Try parallel search first
-            self.logger.info(f"Using parallel search for query: '{query}'")
-            results = await self.search_parallel_impl(query, max_results, language)
+            self.logger.info("Using parallel search for query: '%s'", query)
+            results = await self.search_parallel_impl(query, max_results, language, statuses=statuses)
 
             # If parallel search fails, fall back to sequential search
             if not results:
-                self.logger.warning(f"Parallel search failed for query: '{query}', falling back to sequential search")
-                results = await self._search_impl(query, max_results, language)
+                self.logger.warning("Parallel search failed for query: '%s', falling back to sequential search", query)
+                results = await self._search_impl(query, max_results, language, open_breakers=open_breakers)
 
         # Cache the results
         if results:
             cache.setex(cache_key, self.cache_ttl, results)
-            self.logger.debug(f"Cached {len(results)} search results for '{query}'")
+            _local_cache.set(cache_key, results, self.cache_ttl)
+            self.logger.debug("Cached %d search results for '%s'", len(results), query)
 
         return results
 
-    async def search_parallel_impl(self, query: str, max_results: int = 10, language: str = "en") -> List[Dict[str, Any]]:
+    async def search_parallel_impl(self, query: str, max_results: int = 10, language: str = "en",
+                                   statuses: Optional[Dict[str, Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
         """
         Search using multiple search engines in parallel and combine results.
         Handles circuit breaker exceptions gracefully.
 
         This improved implementation prioritizes getting results quickly by:
-        1. Using a more aggressive timeout strategy
+        1. Returning as soon as the highest-weight engine has results
         2. Allocating more results to more reliable engines
         3. Handling partial results better
 
@@ -150,123 +217,193 @@ class FallbackSearch(BaseSearch):
             query: Search query
             max_results: Maximum number of results to return
             language: Language code (e.g., 'en', 'pt')
+            statuses: Circuit breaker statuses snapshot, if the caller already has one
 
         Returns:
             List of dictionaries with title, URL, and description
         """
         # Check cache first
         cache_key = f"search:parallel:{query}_{max_results}_{language}"
+        cached_result = _local_cache.get(cache_key)
+        if cached_result:
+            return cached_result
+
         cached_result = cache.get(cache_key)
         if cached_result:
-            self.logger.debug(f"Using cached parallel search results for '{query}'")
+            self.logger.debug("Using cached parallel search results for '%s'", query)
+            _local_cache.set(cache_key, cached_result, self.cache_ttl)
             return cached_result
 
+        # Leave out engines whose circuit breaker would reject the call anyway;
+        # their share of the allocation goes to the remaining engines
+        if statuses is None:
+            statuses = CircuitBreaker.get_all_statuses()
+        now = time.time()
+        active_engines = [
+            (engine, weight) for engine, weight in self.search_engines
+            if not self._is_breaker_open(statuses.get(f"{engine.name}_search"), now)
+        ]
+        if not active_engines:
+            self.logger.warning("All engines have open circuit breakers, skipping parallel search for query: '%s'", query)
+            return []
+
         # Create tasks for each search engine with dynamic allocation
-        tasks = []
-        engines_used = []
+        tasks = {}
 
         # Calculate reliability-based allocation
-        total_weight = sum(weight for _, weight in self.search_engines)
+        total_weight = sum(weight for _, weight in active_engines)
+        top_weight = max(weight for _, weight in active_engines)
 
-        for engine, weight in self.search_engines:
+        for i, (engine, weight) in enumerate(active_engines):
             # Allocate more results to engines with higher weights
             # Add at least 1 to ensure each engine gets some allocation
             engine_allocation = max(1, int((weight / total_weight) * max_results * 1.5))
 
             # Add task with appropriate error handling
-            tasks.append(self._safe_search(engine, query, engine_allocation, language))
-            engines_used.append((engine, engine_allocation))
-            self.logger.debug(f"Allocated {engine_allocation} results to {engine.name} (weight: {weight})")
-
-        # Run all searches in parallel with a timeout
+            task = asyncio.create_task(self._safe_search(engine, query, engine_allocation, language))
+            tasks[task] = i
+            self.logger.debug("Allocated %s results to %s (weight: %s)", engine_allocation, engine.name, weight)
+
+        # Collect results as engines finish; stop early once the highest-weight
+        # engine has returned results so a slow secondary engine doesn't add latency
+        # None marks engines that did not finish (timed out or cancelled)
+        all_results: List[Any] = [None] * len(active_engines)
+        pending = set(tasks)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + 10  # 10 second timeout for all parallel searches
         try:
-            # Use a timeout to ensure we don't wait too long
-            all_results = await asyncio.wait_for(
-                asyncio.gather(*tasks, return_exceptions=True),
-                timeout=10  # 10 second timeout for all parallel searches
-            )
-        except asyncio.TimeoutError:
-            self.logger.warning(f"Timeout in parallel search for '{query}', using partial results")
-            # Get partial results from completed tasks
-            all_results = []
-            for i, task in enumerate(tasks):
-                if task.done() and not task.cancelled():
+            while pending:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    self.logger.warning("Timeout in parallel search for '%s', using partial results", query)
+                    break
+
+                done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+
+                top_engine_succeeded = False
+                for task in done:
+                    i = tasks[task]
                     try:
-                        all_results.append(task.result())
+                        all_results[i] = task.result()
                     except Exception as e:
-                        all_results.append(e)
-                else:
-                    # Cancel the task and add an exception placeholder
-                    task.cancel()
-                    all_results.append(Exception("Timeout"))
-
-        # Combine and deduplicate results with improved weighting
-        combined_results = []
-        seen_urls = set()
+                        all_results[i] = e
+                        continue
+                    if all_results[i] and active_engines[i][1] >= top_weight:
+                        top_engine_succeeded = True
+
+                if top_engine_succeeded and pending:
+                    self.logger.debug("Highest-weight engine answered for '%s', cancelling %d slower searches", query, len(pending))
+                    break
+        finally:
+            # Cancel whatever is still running and let the cancellations settle
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        # Combine and deduplicate results with improved weighting; for pages
+        # returned by several engines keep the copy with the highest weight
+        combined: Dict[Tuple[str, str, FrozenSet[str]], Dict[str, Any]] = {}
+
+        # Casefold once for Unicode-aware, case-insensitive title matching
+        query_folded = query.casefold()
 
         # Process results from each engine with dynamic weighting
-        for i, (engine, weight) in enumerate(self.search_engines):
-            if i >= len(all_results):
-                continue
-
+        for i, (engine, weight) in enumerate(active_engines):
             result = all_results[i]
+            if result is None:
+                continue
 
             # Skip exceptions (including CircuitBreakerOpenError)
             if isinstance(result, Exception):
                 if isinstance(result, CircuitBreakerOpenError):
-                    self.logger.warning(f"Circuit breaker open for {engine.name} in parallel search for query: '{query}'")
+                    self.logger.warning("Circuit breaker open for %s in parallel search for query: '%s'", engine.name, query)
                 else:
-                    self.logger.error(f"Error with {engine.name} in parallel search for query: '{query}': {str(result)}")
+                    self.logger.error("Error with %s in parallel search for query: '%s': %s", engine.name, query, result)
                 continue
 
             # Skip empty results
             if not result:
-                self.logger.warning(f"No results from {engine.name} in parallel search for query: '{query}'")
+                self.logger.warning("No results from %s in parallel search for query: '%s'", engine.name, query)
                 continue
 
-            self.logger.info(f"Got {len(result)} results from {engine.name} in parallel search for query: '{query}'")
+            self.logger.info("Got %d results from %s in parallel search for query: '%s'", len(result), engine.name, query)
+
+            # Position-based weighting: items at the top of each engine's results get
+            # higher weight, falling linearly from 1.0 towards 0.5
+            position_step = 0.5 / len(result)
 
             # Add results from this engine with position-based weighting
             for j, item in enumerate(result):
                 url = item.get("url")
-                if url and url not in seen_urls:
-                    seen_urls.add(url)
-
-                    # Calculate position-based weight
-                    # Items at the top of each engine's results get higher weight
-                    position_factor = 1.0 - (j / max(len(result), 1) * 0.5)  # 1.0 to 0.5 based on position
+                if not url:
+                    continue
 
-                    # Apply engine weight and position factor
-                    item["_weight"] = weight * position_factor
+                # Apply engine weight and position factor
+                item_weight = weight * (1.0 - j * position_step)
 
-                    # Add relevance boost for exact title matches
-                    if query.lower() in item.get("title", "").lower():
-                        item["_weight"] += 0.2
+                # Add relevance boost for exact title matches
+                if query_folded in (item.get("title") or "").casefold():
+                    item_weight += 0.2
 
-                    combined_results.append(item)
+                url_key = _canonical_url(url)
+                existing = combined.get(url_key)
+                if existing is None or existing["_weight"] < item_weight:
+                    item["_weight"] = item_weight
+                    combined[url_key] = item
 
-        # Sort by weight (if available) and limit to max_results
-        combined_results.sort(key=lambda x: x.get("_weight", 0), reverse=True)
-        combined_results = combined_results[:max_results]
+        # Select the max_results highest-weighted results without sorting the whole list
+        combined_results = heapq.nlargest(max_results, combined.values(), key=lambda x: x["_weight"])
 
         # Remove temporary weight field
         for result in combined_results:
-            if "_weight" in result:
-                del result["_weight"]
+            result.pop("_weight", None)
 
         # If we got no results, log a warning
         if not combined_results:
-            self.logger.warning(f"No combined results from any engine for query: '{query}'")
+            self.logger.warning("No combined results from any engine for query: '%s'", query)
         else:
-            self.logger.info(f"Combined {len(combined_results)} unique results from multiple engines for query: '{query}'")
+            self.logger.info("Combined %d unique results from multiple engines for query: '%s'", len(combined_results), query)
 
         # Cache the results
         if combined_results:
             cache.setex(cache_key, self.cache_ttl, combined_results)
-            self.logger.info(f"Cached {len(combined_results)} combined results for '{query}'")
+            _local_cache.set(cache_key, combined_results, self.cache_ttl)
+            self.logger.info("Cached %d combined results for '%s'", len(combined_results), query)
 
         return combined_results
 
+    @staticmethod
+    def _open_breakers(statuses: Dict[str, Dict[str, Any]]) -> List[str]:
+        """
+        Get the names of open circuit breakers.
+
+        Args:
+            statuses: Breaker statuses from CircuitBreaker.get_all_statuses()
+
+        Returns:
+            Names of breakers in the OPEN state
+        """
+        return [name for name, status in statuses.items() if status["state"] == "OPEN"]
+
+    @staticmethod
+    def _is_breaker_open(status: Optional[Dict[str, Any]], now: float) -> bool:
+        """
+        Check whether a circuit breaker status means calls are currently rejected.
+        An OPEN breaker whose reset timeout has elapsed will let a trial call
+        through, so it is not treated as open.
+
+        Args:
+            status: Breaker status from CircuitBreaker.get_all_statuses(), or None
+            now: Current time (time.time())
+
+        Returns:
+            True if the breaker is open and still within its reset timeout
+        """
+        if status is None or status["state"] != "OPEN":
+            return False
+        return now - status["last_failure_time"] <= status["reset_timeout"]
+
     async def _safe_search(self, engine: SearchService, query: str, max_results: int, language: str) -> List[Dict[str, Any]]:
         """
         Safely execute a search with proper error handling.
@@ -287,5 +424,5 @@ class FallbackSearch(BaseSearch):
             raise
         except Exception as e:
             # Log and re-raise other exceptions
-            self.logger.error(f"Error in safe search with {engine.name}: {str(e)}")
+            self.logger.error("Error in safe search with %s: %s", engine.name, e)
             raise
@@ -2,14 +2,16 @@
 Factory for creating search instances.
 """
 
-from typing import Dict, Any, Optional, List, Tuple
+import threading
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, List, Tuple
 
 from infrastructure.logging import logger
 from infrastructure.config import config
 from services.search.search_service import SearchService
-from services.search.duckduckgo_search import DuckDuckGoSearch
-from services.search.brave_search import BraveSearch
-from services.search.fallback_search import FallbackSearch
+
+# Search settings don't change at runtime, so read them once
+_SEARCH_CONFIG: Mapping[str, Any] = MappingProxyType(config.get_section("SEARCH"))
 
 
 class SearchFactory:
@@ -20,6 +22,9 @@ class SearchFactory:
     # Singleton instances
     _instances: Dict[str, SearchService] = {}
 
+    # Guards instance creation; reentrant because the fallback search creates its engines
+    _lock = threading.RLock()
+
     @classmethod
     def create_search(cls, search_type: str = "default", config_options: Optional[Dict[str, Any]] = None) -> SearchService:
         """
@@ -33,25 +38,50 @@ class SearchFactory:
             Search instance implementing SearchService
         """
         # Use singleton pattern for efficiency
-        if search_type in cls._instances:
-            return cls._instances[search_type]
+        search = cls._instances.get(search_type)
+        if search is not None:
+            return search
+
+        with cls._lock:
+            # Another thread may have created it while we waited for the lock
+            search = cls._instances.get(search_type)
+            if search is not None:
+                return search
+
+            return cls._create_search(search_type, config_options)
+
+    @classmethod
+    def _create_search(cls, search_type: str, config_options: Optional[Dict[str, Any]]) -> SearchService:
+        """
+        Create and register a search instance. Must be called with _lock held.
 
+        Args:
+            search_type: Type of search to create ("duckduckgo", "brave", "fallback", "default")
+            config_options: Configuration options for the search
+
+        Returns:
+            Search instance implementing SearchService
+        """
         # Get configuration
         if config_options is None:
             config_options = {}
 
         # Get cache TTL from config
-        search_config = config.get_section("SEARCH")
-        cache_ttl = config_options.get("cache_ttl", search_config.get("cache_ttl", 86400))
+        cache_ttl = config_options.get("cache_ttl", _SEARCH_CONFIG.get("cache_ttl", 86400))
 
         # Create search instance
         search: SearchService
 
+        # Engine modules are imported on demand so unused engines stay off the startup path
         if search_type == "duckduckgo":
+            from services.search.duckduckgo_search import DuckDuckGoSearch
             search = DuckDuckGoSearch(cache_ttl=cache_ttl)
         elif search_type == "brave":
+            from services.search.brave_search import BraveSearch
             search = BraveSearch(cache_ttl=cache_ttl)
         elif search_type == "fallback" or search_type == "default":
+            from services.search.fallback_search import FallbackSearch
+
             # Create fallback search with multiple engines
             engines: List[Tuple[SearchService, float]] = []
 
@@ -59,7 +89,7 @@ class SearchFactory:
             engines.append((cls.create_search("duckduckgo"), 1.0))
 
             # Add Brave if API key is configured
-            if search_config.get("brave_api_key"):
+            if _SEARCH_CONFIG.get("brave_api_key"):
                 logger.info("Brave Search API key is configured. Adding Brave Search to fallback engines.")
                 # Increase Brave's weight to make it more likely to be used
                 engines.append((cls.create_search("brave"), 1.2))
@@ -76,3 +106,15 @@ class SearchFactory:
         cls._instances[search_type] = search
 
         return search
+
+    @classmethod
+    async def aclose_all(cls) -> None:
+        """
+        Release network resources held by all created search instances.
+        Intended to be called once on application shutdown.
+        """
+        for search_type, search in cls._instances.items():
+            try:
+                await search.aclose()
+            except Exception as e:
+                logger.error(f"Error closing {search_type} search: {str(e)}")
@@ -31,7 +31,7 @@ class SearchService(ABC):
     async def search_with_retry(self, query: str, max_results: int = 10, language: str = "en", 
                                max_retries: int = 3, backoff_factor: float = 1.5) -> List[Dict[str, Any]]:
         """
-        Search with retry and exponential backoff.
+        Search with retry and exponential backoff with jitter.
 
         Args:
             query: Search query
@@ -44,3 +44,10 @@ class SearchService(ABC):
             List of dictionaries with title, URL, and description
         """
         pass
+
+    async def aclose(self) -> None:
+        """
+        Release network resources held by the service.
+        The default implementation has nothing to release.
+        """
+        pass
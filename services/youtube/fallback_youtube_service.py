@@ -2,10 +2,15 @@
 Fallback YouTube service that combines multiple implementations.
 """
 
+import asyncio
+import random
 from typing import List, Dict, Any, Optional, Tuple
 
 from infrastructure.logging import logger
 from infrastructure.cache import cache
+from infrastructure.cache.local_cache import LocalCache
+from infrastructure.circuit_breaker import CircuitBreaker, CircuitState
+from infrastructure.single_flight import SingleFlight
 from api.models import Resource
 from services.youtube.youtube_service import YouTubeService
 
@@ -13,24 +18,173 @@ from services.youtube.youtube_service import YouTubeService
 class FallbackYouTubeService(YouTubeService):
     """
     Fallback YouTube service that combines multiple implementations.
-    Tries each implementation in order until one succeeds.
+    Tries each implementation in order until one succeeds, starting the next
+    one early when the current one is slow (hedged requests). With weighted
+    selection the first service is picked at random by weight on each call.
     """
 
-    def __init__(self, services: List[Tuple[YouTubeService, float]], cache_ttl: int = 86400):
+    def __init__(self, services: List[Tuple[YouTubeService, float]], cache_ttl: int = 86400,
+                 hedge_delay: float = 2.0, weighted: bool = False):
         """
         Initialize the fallback YouTube service.
 
         Args:
             services: List of (service, weight) tuples
             cache_ttl: Cache TTL in seconds (default: 1 day)
+            hedge_delay: Seconds to wait on a service before also starting the next one
+            weighted: Pick the first service by weight on each call instead of always using the first one
         """
         self.services = services
         self.cache_ttl = cache_ttl
+        self.hedge_delay = hedge_delay
+        self.weighted = weighted
         self.logger = logger.get_logger("youtube.fallback")
 
+        # In-flight lookups by cache key, so concurrent misses share one upstream call
+        self._inflight = SingleFlight("YouTube lookup")
+
+        # Process-local tier in front of the shared cache for hot keys
+        self._local_cache = LocalCache(max_size=1024, ttl=300)
+
+        # One circuit breaker per upstream service, so a failing backend is skipped
+        self._breakers = [self._init_circuit_breaker(service) for service, _ in services]
+
         service_names = [service[0].__class__.__name__ for service in services]
         self.logger.info(f"Initialized FallbackYouTubeService with services: {', '.join(service_names)}")
 
+    @staticmethod
+    def _init_circuit_breaker(service: YouTubeService) -> CircuitBreaker:
+        """
+        Get the circuit breaker for a YouTube service and tune it.
+
+        The services swallow their own errors and return empty results, so empty
+        results count as failures here. The breaker therefore opens on consecutive
+        failures rather than on the first empty answer.
+
+        Args:
+            service: YouTube service to protect
+
+        Returns:
+            CircuitBreaker instance for the service
+        """
+        breaker = CircuitBreaker.get_instance(f"youtube_{service.__class__.__name__}")
+        breaker.consecutive_failures_threshold = 5
+        breaker.failure_threshold = 20
+        breaker.error_rate_threshold = 0.8
+        breaker.error_rate_min_calls = 10
+        breaker.reset_timeout = breaker.initial_reset_timeout = 30
+        return breaker
+
+    def _service_order(self) -> List[Tuple[YouTubeService, CircuitBreaker]]:
+        """
+        Get the order in which to try the services for one call.
+
+        Without weighted selection this is the configured order. Otherwise the
+        first service is drawn by weight, ignoring services whose circuit
+        breaker is open, and the rest follow in descending weight order.
+
+        Returns:
+            List of (service, breaker) tuples
+        """
+        entries = [(service, breaker, weight) for (service, weight), breaker in zip(self.services, self._breakers)]
+        if not self.weighted:
+            return [(service, breaker) for service, breaker, _ in entries]
+
+        entries.sort(key=lambda entry: entry[2], reverse=True)
+        candidates = [entry for entry in entries if entry[1].state != CircuitState.OPEN and entry[2] > 0]
+        if candidates:
+            primary = random.choices(candidates, weights=[weight for _, _, weight in candidates], k=1)[0]
+            entries.remove(primary)
+            entries.insert(0, primary)
+
+        return [(service, breaker) for service, breaker, _ in entries]
+
+    async def _hedged_fetch(self, method: str, *args: Any) -> Any:
+        """
+        Call a method on the services in order, hedging slow and failed attempts.
+
+        The first service (see _service_order) is started immediately. If it hasn't answered within
+        hedge_delay the next one is started alongside it, and a service that
+        fails or returns nothing starts the next one right away. The first
+        non-empty result wins and the remaining attempts are cancelled.
+        Services with an open circuit breaker are skipped.
+
+        Args:
+            method: Name of the YouTubeService method to call
+            *args: Positional arguments for the method
+
+        Returns:
+            The first non-empty result, or None if every service failed
+        """
+        queue = self._service_order()
+        pending: Dict["asyncio.Future[Any]", Tuple[str, CircuitBreaker]] = {}
+
+        def start_next() -> None:
+            # Skip services whose circuit breaker is open
+            while queue:
+                service, breaker = queue.pop(0)
+                name = service.__class__.__name__
+                if not breaker.allow_request():
+                    self.logger.debug("Circuit breaker open for YouTube service %s, skipping", name)
+                    continue
+                self.logger.debug("Trying YouTube service %s.%s", name, method)
+                pending[asyncio.ensure_future(getattr(service, method)(*args))] = (name, breaker)
+                return
+
+        start_next()
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    set(pending),
+                    timeout=self.hedge_delay if queue else None,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+
+                if not done:
+                    self.logger.debug("YouTube %s still pending after %.1fs, hedging with next service",
+                                      method, self.hedge_delay)
+                    start_next()
+                    continue
+
+                # Record the outcome of every finished attempt, keeping the first non-empty result
+                result = None
+                failures = 0
+                for task in done:
+                    name, breaker = pending.pop(task)
+                    try:
+                        task_result = task.result()
+                    except Exception as e:
+                        self.logger.error("Error with YouTube service %s: %s", name, str(e))
+                    else:
+                        if task_result:
+                            breaker.record_success()
+                            if result is None:
+                                self.logger.info("YouTube %s successful with %s", method, name)
+                                result = task_result
+                            continue
+                        self.logger.warning("No %s results from %s, trying next service", method, name)
+                    breaker.record_failure()
+                    failures += 1
+
+                if result is not None:
+                    return result
+
+                # Each failed attempt starts the next service immediately
+                for _ in range(failures):
+                    start_next()
+
+            return None
+        finally:
+            for task, (_, breaker) in pending.items():
+                if task.done():
+                    continue
+                task.cancel()
+                # A cancelled recovery probe proved nothing; reopen rather than leave it half-open
+                if breaker.state == CircuitState.HALF_OPEN:
+                    breaker.record_failure()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
     async def search_videos(self, query: str, max_results: int = 5, language: str = "en") -> List[Dict[str, Any]]:
         """
         Search for YouTube videos using multiple implementations with fallback.
@@ -45,28 +199,35 @@ class FallbackYouTubeService(YouTubeService):
         """
         # Check cache first
         cache_key = f"youtube:fallback:search:{query}_{max_results}_{language}"
-        cached_result = cache.get(cache_key)
+        cached_result = self._local_cache.get_through(cache, cache_key, self.cache_ttl)
         if cached_result:
             self.logger.debug(f"Using cached fallback YouTube search results for '{query}'")
             return cached_result
 
-        # Try each service in order
-        for service, _ in self.services:
-            try:
-                self.logger.debug(f"Trying YouTube service: {service.__class__.__name__}")
-                results = await service.search_videos(query, max_results, language)
+        results = await self._inflight.run(
+            cache_key, lambda: self._search_videos_uncached(query, max_results, language, cache_key)
+        )
+        return list(results)
 
-                if results:
-                    self.logger.info(f"YouTube search successful with {service.__class__.__name__} ({len(results)} results)")
+    async def _search_videos_uncached(self, query: str, max_results: int, language: str,
+                                      cache_key: str) -> List[Dict[str, Any]]:
+        """
+        Search the services with hedging and cache the first non-empty result.
 
-                    # Cache the results
-                    cache.setex(cache_key, self.cache_ttl, results)
+        Args:
+            query: Search query
+            max_results: Maximum number of results to return
+            language: Language code (e.g., 'en', 'pt')
+            cache_key: Cache key for the results
 
-                    return results
-                else:
-                    self.logger.warning(f"No results from {service.__class__.__name__}, trying next service")
-            except Exception as e:
-                self.logger.error(f"Error with YouTube service {service.__class__.__name__}: {str(e)}")
+        Returns:
+            List of dictionaries with video information
+        """
+        results = await self._hedged_fetch("search_videos", query, max_results, language)
+        if results:
+            # Cache the results
+            self._local_cache.setex_later(cache, cache_key, self.cache_ttl, results)
+            return results
 
         # If all services fail, return empty list
         self.logger.error(f"All YouTube services failed for query: {query}")
@@ -84,28 +245,31 @@ class FallbackYouTubeService(YouTubeService):
         """
         # Check cache first
         cache_key = f"youtube:fallback:video:{video_id}"
-        cached_result = cache.get(cache_key)
+        cached_result = self._local_cache.get_through(cache, cache_key, self.cache_ttl)
         if cached_result:
             self.logger.debug(f"Using cached fallback YouTube video details for '{video_id}'")
             return cached_result
 
-        # Try each service in order
-        for service, _ in self.services:
-            try:
-                self.logger.debug(f"Trying YouTube service for video details: {service.__class__.__name__}")
-                result = await service.get_video_details(video_id)
+        return await self._inflight.run(
+            cache_key, lambda: self._get_video_details_uncached(video_id, cache_key)
+        )
 
-                if result:
-                    self.logger.info(f"YouTube video details successful with {service.__class__.__name__}")
+    async def _get_video_details_uncached(self, video_id: str, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get video details from the services with hedging and cache the first result.
 
-                    # Cache the result
-                    cache.setex(cache_key, self.cache_ttl, result)
+        Args:
+            video_id: YouTube video ID
+            cache_key: Cache key for the result
 
-                    return result
-                else:
-                    self.logger.warning(f"No video details from {service.__class__.__name__}, trying next service")
-            except Exception as e:
-                self.logger.error(f"Error with YouTube service {service.__class__.__name__}: {str(e)}")
+        Returns:
+            Dictionary with video details or None if not found
+        """
+        result = await self._hedged_fetch("get_video_details", video_id)
+        if result:
+            # Cache the result
+            self._local_cache.setex_later(cache, cache_key, self.cache_ttl, result)
+            return result
 
         # If all services fail, return None
         self.logger.error(f"All YouTube services failed for video: {video_id}")
@@ -127,28 +291,36 @@ class FallbackYouTubeService(YouTubeService):
         """
         # Check cache first
         cache_key = f"youtube:fallback:topic:{topic}_{subtopic}_{max_results}_{language}"
-        cached_result = cache.get(cache_key)
+        cached_result = self._local_cache.get_through(cache, cache_key, self.cache_ttl)
         if cached_result:
             self.logger.debug(f"Using cached fallback YouTube topic results for '{topic}'")
             return cached_result
 
-        # Try each service in order
-        for service, _ in self.services:
-            try:
-                self.logger.debug(f"Trying YouTube service for topic: {service.__class__.__name__}")
-                results = await service.search_videos_for_topic(topic, subtopic, max_results, language)
+        results = await self._inflight.run(
+            cache_key, lambda: self._search_videos_for_topic_uncached(topic, subtopic, max_results, language, cache_key)
+        )
+        return list(results)
 
-                if results:
-                    self.logger.info(f"YouTube topic search successful with {service.__class__.__name__} ({len(results)} results)")
+    async def _search_videos_for_topic_uncached(self, topic: str, subtopic: Optional[str], max_results: int,
+                                                language: str, cache_key: str) -> List[Resource]:
+        """
+        Search the services for topic videos with hedging and cache the first non-empty result.
 
-                    # Cache the results
-                    cache.setex(cache_key, self.cache_ttl, results)
+        Args:
+            topic: Main topic
+            subtopic: Optional subtopic for more specific results
+            max_results: Maximum number of results to return
+            language: Language code (e.g., 'en', 'pt')
+            cache_key: Cache key for the results
 
-                    return results
-                else:
-                    self.logger.warning(f"No topic results from {service.__class__.__name__}, trying next service")
-            except Exception as e:
-                self.logger.error(f"Error with YouTube service {service.__class__.__name__}: {str(e)}")
+        Returns:
+            List of Resource objects
+        """
+        results = await self._hedged_fetch("search_videos_for_topic", topic, subtopic, max_results, language)
+        if results:
+            # Cache the results
+            self._local_cache.setex_later(cache, cache_key, self.cache_ttl, results)
+            return results
 
         # If all services fail, return empty list
         self.logger.error(f"All YouTube services failed for topic: {topic}")
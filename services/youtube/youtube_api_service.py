@@ -3,17 +3,152 @@ YouTube integration using the YouTube Data API.
 """
 
 import asyncio
-import aiohttp
+import functools
+import importlib.util
+import itertools
 import random
 import re
-from typing import List, Dict, Any, Optional
+import time
+from types import MappingProxyType
+from typing import List, Dict, Any, Callable, Optional, Union, TYPE_CHECKING
+
+_json_loads: Callable[[Union[str, bytes]], Any]
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; the stdlib parser also accepts bytes
+    from json import loads as _json_loads
 
 from infrastructure.logging import logger
 from infrastructure.cache import cache
+from infrastructure.cache.local_cache import LocalCache
 from infrastructure.config import config
 from api.models import Resource
 from services.youtube.youtube_service import YouTubeService
 
+if TYPE_CHECKING:
+    import httpx
+
+# The YouTube API is a single host, so HTTP/2 multiplexing helps when the h2 package is available
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Duration formats, compiled once since they are parsed for every video
+_ISO_DURATION_RE = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
+_HMS_RE = re.compile(r'(?:(\d+):)?(\d+):(\d+)')
+
+# Thumbnail sizes from best to worst
+_THUMBNAIL_QUALITIES = ("maxres", "high", "medium", "default")
+
+
+class _RetryableStatusError(Exception):
+    """Raised for API responses that are worth retrying (rate limits and server errors)."""
+
+    def __init__(self, status_code: int, retry_after: Optional[float] = None):
+        super().__init__(f"YouTube API error: {status_code}")
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class _TokenBucket:
+    """
+    Token bucket limiting how many API requests (including retries) are sent.
+    Requests are rejected rather than queued when it is empty, so retries
+    can't pile up behind an outage.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Initialize the token bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens (the allowed burst)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+
+    def try_acquire(self) -> bool:
+        """
+        Take a token if one is available.
+
+        Returns:
+            True if a token was taken, False if the bucket is empty
+        """
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header given in seconds.
+
+    Args:
+        value: Header value
+
+    Returns:
+        Delay in seconds, or None if missing or not a number of seconds
+    """
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_duration(duration_str: Optional[str]) -> Optional[int]:
+    """
+    Convert a duration string to minutes.
+    Memoized because the same durations recur across responses.
+
+    Args:
+        duration_str: Duration string (e.g., "PT1H30M15S" or "1:30:15")
+
+    Returns:
+        Duration in minutes or None if conversion is not possible
+    """
+    if not duration_str:
+        return None
+
+    # ISO 8601 format (PT1H30M15S)
+    iso_match = _ISO_DURATION_RE.match(duration_str)
+    if iso_match:
+        hours = int(iso_match.group(1) or 0)
+        minutes = int(iso_match.group(2) or 0)
+        seconds = int(iso_match.group(3) or 0)
+        return hours * 60 + minutes + (1 if seconds > 30 else 0)
+
+    # HH:MM:SS or MM:SS format
+    time_match = _HMS_RE.match(duration_str)
+    if time_match:
+        hours = int(time_match.group(1) or 0)
+        minutes = int(time_match.group(2) or 0)
+        seconds = int(time_match.group(3) or 0)
+        return hours * 60 + minutes + (1 if seconds > 30 else 0)
+
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_search_term(template: str, topic: str) -> str:
+    """
+    Fill a subtopic search term template, memoized for repeated subtopics.
+
+    Args:
+        template: Search term template with a {topic} placeholder
+        topic: Cleaned subtopic
+
+    Returns:
+        Formatted search term
+    """
+    return template.format(topic=topic)
+
 
 class YouTubeApiService(YouTubeService):
     """
@@ -24,8 +159,31 @@ class YouTubeApiService(YouTubeService):
     # YouTube API base URL
     API_BASE_URL = "https://www.googleapis.com/youtube/v3"
 
+    # Responses worth retrying, and the retry schedule for them
+    RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+    MAX_ATTEMPTS = 3
+    RETRY_BACKOFF_BASE = 0.5  # seconds, doubled per attempt
+    MAX_RETRY_DELAY = 8  # Upper bound in seconds for a single retry backoff
+
+    # Partial responses: ask the API only for the fields the video dicts are built from,
+    # so unused data (tags, localizations, thumbnail sizes) is never sent or parsed
+    _THUMBNAIL_FIELDS = "thumbnails(maxres/url,high/url,medium/url,default/url)"
+    SEARCH_FIELDS = f"items(id/videoId,snippet(title,description,channelTitle,{_THUMBNAIL_FIELDS}))"
+    VIDEOS_FIELDS = (
+        f"items(id,snippet(title,description,channelTitle,{_THUMBNAIL_FIELDS}),"
+        "contentDetails/duration,statistics(viewCount,likeCount))"
+    )
+
+    # Request parameters that never change, merged with the per-call ones
+    _SEARCH_PARAMS = MappingProxyType({"part": "snippet", "type": "video", "fields": SEARCH_FIELDS})
+    _VIDEOS_PARAMS = MappingProxyType({"part": "snippet,contentDetails,statistics", "fields": VIDEOS_FIELDS})
+
+    # Video detail lookups are micro-batched: the videos endpoint takes up to 50 IDs
+    DETAILS_BATCH_MAX_IDS = 50
+    DETAILS_BATCH_WINDOW = 0.01  # seconds to wait for more IDs before sending a batch
+
     # List of search term templates for subtopics
-    SUBTOPIC_SEARCH_TERMS = [
+    SUBTOPIC_SEARCH_TERMS = (
         "{topic} tutorial",
         "{topic} guide",
         "{topic} explained",
@@ -34,7 +192,7 @@ class YouTubeApiService(YouTubeService):
         "{topic} course",
         "{topic} for beginners",
         "{topic} introduction"
-    ]
+    )
 
     # Language to region code mapping
     LANGUAGE_TO_REGION = {
@@ -60,6 +218,9 @@ class YouTubeApiService(YouTubeService):
         "Desenvolvendo com", "Profissional", "Moderno", "Eficiente"
     ]
 
+    # Single anchored alternation over the prefixes, longest first so the most specific prefix wins
+    _PREFIX_RE = re.compile("|".join(map(re.escape, sorted(PREFIXES_TO_REMOVE, key=len, reverse=True))))
+
     def __init__(self, cache_ttl: int = 86400):
         """
         Initialize the YouTube API service.
@@ -76,12 +237,145 @@ class YouTubeApiService(YouTubeService):
         self.max_results_default = youtube_config.get("max_results", 5)
         self.timeout = youtube_config.get("timeout", 15)
 
+        # Client-side admission control so retries can't amplify an outage or burn quota
+        rate_limit = youtube_config.get("rate_limit", {})
+        self._rate_limiter = _TokenBucket(
+            rate=rate_limit.get("requests_per_second", 10),
+            capacity=rate_limit.get("burst", 20)
+        )
+
+        # Bound in-flight requests to the API
+        self.max_concurrent_requests = youtube_config.get("max_concurrent_requests", 16)
+        self.request_semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+
+        # Process-local tier in front of the shared cache for hot keys
+        self._local_cache = LocalCache(max_size=1024, ttl=300)
+
+        # Shared HTTP client, created on first request so connections are reused across calls
+        self._client: Optional["httpx.AsyncClient"] = None
+
+        # Video IDs waiting for the next batched videos request
+        self._pending_details: Dict[str, "asyncio.Future[Optional[Dict[str, Any]]]"] = {}
+        self._batch_full = asyncio.Event()
+        self._batch_task: Optional["asyncio.Task[None]"] = None
+
         if not self.api_key:
             self.logger.warning("YouTube API key not configured. YouTube API service will not work.")
         else:
             self.logger.info("Initialized YouTubeApiService")
 
-    async def search_videos(self, query: str, max_results: int = None, language: str = "en") -> List[Dict[str, Any]]:
+    def _get_client(self) -> "httpx.AsyncClient":
+        """
+        Get the shared HTTP client, creating it on first use.
+
+        Returns:
+            httpx.AsyncClient with keep-alive connection pooling (HTTP/2 when h2 is installed)
+        """
+        if self._client is None:
+            import httpx
+
+            # At most max_concurrent_requests are in flight, so keep that many connections alive
+            # and none are closed and reopened under load
+            self._client = httpx.AsyncClient(
+                http2=_HTTP2_AVAILABLE,
+                timeout=self.timeout,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrent_requests,
+                    max_keepalive_connections=self.max_concurrent_requests,
+                    keepalive_expiry=75
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """
+        Close the shared HTTP client. Safe to call more than once.
+        """
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+            self.logger.debug("Closed YouTube API HTTP client")
+
+    async def _get_json(self, endpoint: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        GET an API endpoint, retrying rate limits, server errors and transport errors.
+
+        Args:
+            endpoint: API endpoint name (e.g., "search", "videos")
+            params: Query parameters
+
+        Returns:
+            Parsed JSON response, or None if the request failed or was rejected
+
+        Raises:
+            httpx.TransportError: If the last attempt failed at the transport level
+        """
+        import httpx
+        from tenacity import AsyncRetrying, stop_after_attempt, retry_if_exception_type
+
+        retrying = AsyncRetrying(
+            stop=stop_after_attempt(self.MAX_ATTEMPTS),
+            wait=self._retry_wait,
+            retry=retry_if_exception_type((_RetryableStatusError, httpx.TransportError)),
+            reraise=True
+        )
+        try:
+            return await retrying(self._get_json_once, endpoint, params)
+        except _RetryableStatusError as e:
+            self.logger.error("YouTube API error: %d after %d attempts", e.status_code, self.MAX_ATTEMPTS)
+            return None
+
+    async def _get_json_once(self, endpoint: str, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Make a single API request.
+
+        Args:
+            endpoint: API endpoint name (e.g., "search", "videos")
+            params: Query parameters
+
+        Returns:
+            Parsed JSON response, or None for a non-retryable error or an empty token bucket
+
+        Raises:
+            _RetryableStatusError: If the response status is worth retrying
+        """
+        if not self._rate_limiter.try_acquire():
+            self.logger.warning("YouTube API client-side rate limit reached, rejecting %s request", endpoint)
+            return None
+
+        async with self.request_semaphore:
+            response = await self._get_client().get(f"{self.API_BASE_URL}/{endpoint}", params=params)
+        if response.status_code in self.RETRYABLE_STATUS_CODES:
+            raise _RetryableStatusError(response.status_code, _parse_retry_after(response.headers.get("Retry-After")))
+        if response.status_code != 200:
+            self.logger.error("YouTube API error: %d", response.status_code)
+            return None
+
+        return _json_loads(response.content)
+
+    def _retry_wait(self, retry_state: Any) -> float:
+        """
+        Compute the delay before the next attempt.
+        Honors Retry-After, otherwise uses capped exponential backoff with full jitter.
+
+        Args:
+            retry_state: tenacity RetryCallState of the failed attempt
+
+        Returns:
+            Delay in seconds
+        """
+        error = retry_state.outcome.exception()
+        if isinstance(error, _RetryableStatusError) and error.retry_after is not None:
+            delay = min(self.MAX_RETRY_DELAY, error.retry_after)
+        else:
+            delay = random.uniform(0, min(self.MAX_RETRY_DELAY, self.RETRY_BACKOFF_BASE * 2 ** retry_state.attempt_number))
+
+        self.logger.warning("YouTube API attempt %d failed (%s), retrying in %.2fs",
+                            retry_state.attempt_number, error, delay)
+        return delay
+
+    async def search_videos(self, query: str, max_results: int = None, language: str = "en",
+                            details: bool = True) -> List[Dict[str, Any]]:
         """
         Search for YouTube videos using the YouTube Data API.
 
@@ -89,6 +383,9 @@ class YouTubeApiService(YouTubeService):
             query: Search query
             max_results: Maximum number of results to return
             language: Language code (e.g., 'en', 'pt')
+            details: Whether to fetch duration and statistics with a second videos request.
+                     When False, results are built from the search snippets alone and
+                     duration is None.
 
         Returns:
             List of dictionaries with video information
@@ -101,55 +398,51 @@ class YouTubeApiService(YouTubeService):
             max_results = self.max_results_default
 
         # Check cache first
-        cache_key = f"youtube:api:search:{query}_{max_results}_{language}"
-        cached_result = cache.get(cache_key)
+        cache_key = f"youtube:api:search:{query}_{max_results}_{language}_{int(details)}"
+        cached_result = self._local_cache.get_through(cache, cache_key, self.cache_ttl)
         if cached_result:
             self.logger.debug(f"Using cached YouTube API search results for '{query}'")
             return cached_result
 
-        # Get region code for language
-        region_code = self.LANGUAGE_TO_REGION.get(language, "US")
-
         # Prepare request parameters
         params = {
-            "part": "snippet",
+            **self._SEARCH_PARAMS,
             "q": query,
-            "type": "video",
             "maxResults": min(max_results * 2, 50),  # API limit is 50
-            "regionCode": region_code,
+            "regionCode": self.LANGUAGE_TO_REGION.get(language, "US"),
             "relevanceLanguage": language,
             "key": self.api_key
         }
 
         try:
             # Make API request
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.API_BASE_URL}/search", params=params, timeout=self.timeout) as response:
-                    if response.status != 200:
-                        self.logger.error(f"YouTube API error: {response.status}")
-                        return []
+            data = await self._get_json("search", params)
+            if data is None:
+                return []
 
-                    data = await response.json()
+            # Extract video IDs
+            items = [item for item in data.get("items", []) if "videoId" in item.get("id", {})]
 
-                    # Extract video IDs
-                    video_ids = [item["id"]["videoId"] for item in data.get("items", []) if "videoId" in item.get("id", {})]
+            if not items:
+                self.logger.warning(f"No YouTube videos found for '{query}'")
+                return []
 
-                    if not video_ids:
-                        self.logger.warning(f"No YouTube videos found for '{query}'")
-                        return []
+            if details:
+                # Get video details
+                videos = await self._load_videos_details([item["id"]["videoId"] for item in items])
+            else:
+                # Snippets already carry what topic searches need; skip the videos round trip
+                videos = [self._video_from_snippet(item["id"]["videoId"], item.get("snippet", {})) for item in items]
 
-                    # Get video details
-                    videos = await self._get_videos_details(video_ids)
+            # Limit to max_results
+            videos = videos[:max_results]
 
-                    # Limit to max_results
-                    videos = videos[:max_results]
+            # Cache the results
+            if videos:
+                self._local_cache.setex_later(cache, cache_key, self.cache_ttl, videos)
+                self.logger.debug(f"Cached YouTube API search results for '{query}' ({len(videos)} videos)")
 
-                    # Cache the results
-                    if videos:
-                        cache.setex(cache_key, self.cache_ttl, videos)
-                        self.logger.debug(f"Cached YouTube API search results for '{query}' ({len(videos)} videos)")
-
-                    return videos
+            return videos
         except Exception as e:
             self.logger.error(f"Error searching YouTube API for '{query}': {str(e)}")
             return []
@@ -170,13 +463,13 @@ class YouTubeApiService(YouTubeService):
 
         # Check cache first
         cache_key = f"youtube:api:video:{video_id}"
-        cached_result = cache.get(cache_key)
+        cached_result = self._local_cache.get_through(cache, cache_key, self.cache_ttl)
         if cached_result:
             self.logger.debug(f"Using cached YouTube API video details for '{video_id}'")
             return cached_result
 
         # Get video details
-        videos = await self._get_videos_details([video_id])
+        videos = await self._load_videos_details([video_id])
 
         if not videos:
             self.logger.warning(f"No details found for YouTube video '{video_id}'")
@@ -185,7 +478,7 @@ class YouTubeApiService(YouTubeService):
         video = videos[0]
 
         # Cache the result
-        cache.setex(cache_key, self.cache_ttl, video)
+        self._local_cache.setex_later(cache, cache_key, self.cache_ttl, video)
         self.logger.debug(f"Cached YouTube API video details for '{video_id}'")
 
         return video
@@ -210,7 +503,7 @@ class YouTubeApiService(YouTubeService):
             clean_subtopic = self._clean_subtopic(subtopic)
 
             # For subtopics, use a more specific query
-            search_term = random.choice(self.SUBTOPIC_SEARCH_TERMS).format(topic=clean_subtopic)
+            search_term = _format_search_term(random.choice(self.SUBTOPIC_SEARCH_TERMS), clean_subtopic)
             query = f"{search_term} {topic}"
             is_subtopic = True
         else:
@@ -218,8 +511,8 @@ class YouTubeApiService(YouTubeService):
             query = topic
             is_subtopic = False
 
-        # Search for videos
-        videos = await self.search_videos(query, max_results, language)
+        # Search for videos; resources don't use statistics, so snippets are enough
+        videos = await self.search_videos(query, max_results, language, details=False)
 
         # Convert to Resource objects
         resources = []
@@ -244,6 +537,79 @@ class YouTubeApiService(YouTubeService):
 
         return resources
 
+    async def _load_videos_details(self, video_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get details for videos through the micro-batcher.
+
+        IDs requested by concurrent calls within DETAILS_BATCH_WINDOW are sent
+        together in one videos request, and an ID already waiting is shared.
+
+        Args:
+            video_ids: List of YouTube video IDs
+
+        Returns:
+            List of dictionaries with video details, in the order of video_ids
+        """
+        if not video_ids:
+            return []
+
+        loop = asyncio.get_running_loop()
+        futures = []
+        for video_id in video_ids:
+            future = self._pending_details.get(video_id)
+            if future is None:
+                future = loop.create_future()
+                self._pending_details[video_id] = future
+            futures.append(future)
+
+        if len(self._pending_details) >= self.DETAILS_BATCH_MAX_IDS:
+            self._batch_full.set()
+        if self._batch_task is None:
+            self._batch_task = asyncio.ensure_future(self._run_details_batches())
+
+        # Shield so a cancelled caller doesn't cancel results other callers share
+        videos = await asyncio.gather(*(asyncio.shield(future) for future in futures))
+        return [video for video in videos if video]
+
+    async def _run_details_batches(self) -> None:
+        """
+        Send the pending video IDs in batches and resolve their futures.
+        """
+        batch: Dict[str, "asyncio.Future[Optional[Dict[str, Any]]]"] = {}
+        try:
+            # Give concurrent callers a moment to add their IDs, unless the batch is already full
+            try:
+                await asyncio.wait_for(self._batch_full.wait(), self.DETAILS_BATCH_WINDOW)
+            except asyncio.TimeoutError:
+                pass
+
+            while self._pending_details:
+                self._batch_full.clear()
+                batch = dict(itertools.islice(self._pending_details.items(), self.DETAILS_BATCH_MAX_IDS))
+                for video_id in batch:
+                    del self._pending_details[video_id]
+
+                self.logger.debug("Fetching YouTube details for a batch of %d videos", len(batch))
+                videos = await self._get_videos_details(list(batch))
+                videos_by_id = {video['id']: video for video in videos}
+                for video_id, future in batch.items():
+                    if not future.done():
+                        future.set_result(videos_by_id.get(video_id))
+                batch = {}
+        except BaseException as e:
+            # Don't leave callers waiting on a batch that will never be sent
+            for future in itertools.chain(batch.values(), self._pending_details.values()):
+                if future.done():
+                    continue
+                if isinstance(e, Exception):
+                    future.set_exception(e)
+                else:
+                    future.cancel()
+            self._pending_details.clear()
+            raise
+        finally:
+            self._batch_task = None
+
     async def _get_videos_details(self, video_ids: List[str]) -> List[Dict[str, Any]]:
         """
         Get details for multiple videos using the YouTube Data API.
@@ -259,96 +625,92 @@ class YouTubeApiService(YouTubeService):
 
         # Prepare request parameters
         params = {
-            "part": "snippet,contentDetails,statistics",
+            **self._VIDEOS_PARAMS,
             "id": ",".join(video_ids),
             "key": self.api_key
         }
 
         try:
             # Make API request
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.API_BASE_URL}/videos", params=params, timeout=self.timeout) as response:
-                    if response.status != 200:
-                        self.logger.error(f"YouTube API error: {response.status}")
-                        return []
-
-                    data = await response.json()
-
-                    # Process results
-                    videos = []
-                    for item in data.get("items", []):
-                        # Extract video details
-                        video_id = item.get("id")
-                        snippet = item.get("snippet", {})
-                        content_details = item.get("contentDetails", {})
-                        statistics = item.get("statistics", {})
-
-                        # Parse duration
-                        duration_str = content_details.get("duration")
-                        duration_minutes = self._parse_duration(duration_str)
-
-                        # Get thumbnail
-                        thumbnails = snippet.get("thumbnails", {})
-                        thumbnail = None
-                        for quality in ["maxres", "high", "medium", "default"]:
-                            if quality in thumbnails:
-                                thumbnail = thumbnails[quality].get("url")
-                                break
-
-                        if not thumbnail and video_id:
-                            thumbnail = f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg"
-
-                        # Create video info
-                        video = {
-                            'id': video_id,
-                            'title': snippet.get('title', ''),
-                            'url': f"https://www.youtube.com/watch?v={video_id}",
-                            'description': snippet.get('description', ''),
-                            'duration': duration_minutes,
-                            'thumbnail': thumbnail,
-                            'channel': snippet.get('channelTitle', ''),
-                            'publishedAt': snippet.get('publishedAt', ''),
-                            'viewCount': int(statistics.get('viewCount', 0)),
-                            'likeCount': int(statistics.get('likeCount', 0)),
-                            'tags': snippet.get('tags', [])
-                        }
-
-                        videos.append(video)
-
-                    return videos
+            data = await self._get_json("videos", params)
+            if data is None:
+                return []
+
+            # Process results
+            videos = []
+            for item in data.get("items", []):
+                # Extract video details
+                video_id = item.get("id")
+                snippet = item.get("snippet", {})
+                content_details = item.get("contentDetails", {})
+                statistics = item.get("statistics", {})
+
+                # Parse duration
+                duration_str = content_details.get("duration")
+                duration_minutes = _parse_duration(duration_str)
+
+                # Get thumbnail
+                thumbnail = self._get_thumbnail(video_id, snippet)
+
+                # Create video info
+                video = {
+                    'id': video_id,
+                    'title': snippet.get('title', ''),
+                    'url': f"https://www.youtube.com/watch?v={video_id}",
+                    'description': snippet.get('description', ''),
+                    'duration': duration_minutes,
+                    'thumbnail': thumbnail,
+                    'channel': snippet.get('channelTitle', ''),
+                    'viewCount': int(statistics.get('viewCount', 0)),
+                    'likeCount': int(statistics.get('likeCount', 0))
+                }
+
+                videos.append(video)
+
+            return videos
         except Exception as e:
             self.logger.error(f"Error getting YouTube video details: {str(e)}")
             return []
 
-    def _parse_duration(self, duration_str: str) -> Optional[int]:
+    def _video_from_snippet(self, video_id: str, snippet: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Convert a duration string to minutes.
+        Build video information from a search result snippet.
 
         Args:
-            duration_str: Duration string (e.g., "PT1H30M15S" or "1:30:15")
+            video_id: YouTube video ID
+            snippet: Snippet of the search result
 
         Returns:
-            Duration in minutes or None if conversion is not possible
+            Dictionary with video information (duration is unknown and None)
         """
-        if not duration_str:
-            return None
+        return {
+            'id': video_id,
+            'title': snippet.get('title', ''),
+            'url': f"https://www.youtube.com/watch?v={video_id}",
+            'description': snippet.get('description', ''),
+            'duration': None,
+            'thumbnail': self._get_thumbnail(video_id, snippet),
+            'channel': snippet.get('channelTitle', '')
+        }
 
-        # ISO 8601 format (PT1H30M15S)
-        iso_match = re.match(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?', duration_str)
-        if iso_match:
-            hours = int(iso_match.group(1) or 0)
-            minutes = int(iso_match.group(2) or 0)
-            seconds = int(iso_match.group(3) or 0)
-            return hours * 60 + minutes + (1 if seconds > 30 else 0)
-
-        # HH:MM:SS or MM:SS format
-        time_match = re.match(r'(?:(\d+):)?(\d+):(\d+)', duration_str)
-        if time_match:
-            hours = int(time_match.group(1) or 0)
-            minutes = int(time_match.group(2) or 0)
-            seconds = int(time_match.group(3) or 0)
-            return hours * 60 + minutes + (1 if seconds > 30 else 0)
+    def _get_thumbnail(self, video_id: Optional[str], snippet: Dict[str, Any]) -> Optional[str]:
+        """
+        Get the best available thumbnail URL for a video.
+
+        Args:
+            video_id: YouTube video ID
+            snippet: Snippet of the video or search result
+
+        Returns:
+            Thumbnail URL or None if none can be determined
+        """
+        thumbnails = snippet.get("thumbnails", {})
+        thumbnail = next((thumbnails[quality].get("url") for quality in _THUMBNAIL_QUALITIES if quality in thumbnails), None)
+        if thumbnail:
+            return thumbnail
 
+        if video_id:
+            return f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg"
         return None
 
     def _clean_subtopic(self, subtopic: str) -> str:
@@ -364,9 +726,8 @@ class YouTubeApiService(YouTubeService):
         clean_subtopic = subtopic
 
         # Remove common prefixes that might interfere with search
-        for prefix in self.PREFIXES_TO_REMOVE:
-            if clean_subtopic.startswith(prefix):
-                clean_subtopic = clean_subtopic[len(prefix):].strip()
-                break
+        prefix_match = self._PREFIX_RE.match(clean_subtopic)
+        if prefix_match:
+            clean_subtopic = clean_subtopic[prefix_match.end():].strip()
 
         return clean_subtopic
@@ -2,6 +2,7 @@
 Factory for creating YouTube service instances.
 """
 
+import threading
 from typing import Dict, Any, Optional, List, Tuple
 
 from infrastructure.logging import logger
@@ -20,6 +21,9 @@ class YouTubeFactory:
     # Singleton instances
     _instances: Dict[str, YouTubeService] = {}
 
+    # Guards instance creation; reentrant because unknown types fall back to "default"
+    _lock = threading.RLock()
+
     @classmethod
     def create_youtube_service(cls, service_type: str = "default", config_options: Optional[Dict[str, Any]] = None) -> YouTubeService:
         """
@@ -33,9 +37,30 @@ class YouTubeFactory:
             YouTube service instance implementing YouTubeService
         """
         # Use singleton pattern for efficiency
-        if service_type in cls._instances:
-            return cls._instances[service_type]
+        service = cls._instances.get(service_type)
+        if service is not None:
+            return service
+
+        with cls._lock:
+            # Another thread may have created it while we waited for the lock
+            service = cls._instances.get(service_type)
+            if service is not None:
+                return service
+
+            return cls._create_youtube_service(service_type, config_options)
 
+    @classmethod
+    def _create_youtube_service(cls, service_type: str, config_options: Optional[Dict[str, Any]]) -> YouTubeService:
+        """
+        Create and register a YouTube service instance. Must be called with _lock held.
+
+        Args:
+            service_type: Type of service to create ("ytdlp", "api", "fallback", "default")
+            config_options: Configuration options for the service
+
+        Returns:
+            YouTube service instance implementing YouTubeService
+        """
         # Get configuration
         if config_options is None:
             config_options = {}
@@ -68,7 +93,10 @@ class YouTubeFactory:
                     cls._instances["api"] = YouTubeApiService(cache_ttl=cache_ttl)
                 services.append((cls._instances["api"], 0.8))
 
-            service = FallbackYouTubeService(services=services, cache_ttl=cache_ttl)
+            hedge_delay = config_options.get("hedge_delay", youtube_config.get("hedge_delay", 2.0))
+            weighted = config_options.get("weighted_selection", youtube_config.get("weighted_selection", False))
+            service = FallbackYouTubeService(services=services, cache_ttl=cache_ttl, hedge_delay=hedge_delay,
+                                             weighted=weighted)
         else:
             logger.warning(f"Unknown YouTube service type: {service_type}, falling back to default")
             return cls.create_youtube_service("default", config_options)
@@ -78,3 +106,15 @@ class YouTubeFactory:
 
         logger.info(f"Created YouTube service of type: {service_type}")
         return service
+
+    @classmethod
+    async def aclose_all(cls) -> None:
+        """
+        Release network resources held by all created YouTube service instances.
+        Intended to be called once on application shutdown.
+        """
+        for service_type, service in cls._instances.items():
+            try:
+                await service.aclose()
+            except Exception as e:
+                logger.error(f"Error closing {service_type} YouTube service: {str(e)}")
@@ -57,3 +57,10 @@ class YouTubeService(ABC):
             List of Resource objects
         """
         pass
+
+    async def aclose(self) -> None:
+        """
+        Release network resources held by the service.
+        The default implementation has nothing to release.
+        """
+        pass
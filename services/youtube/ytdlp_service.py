@@ -7,18 +7,166 @@ metadata extraction, and support for playlists.
 
 import yt_dlp
 import asyncio
+import functools
+import heapq
+import importlib.metadata
+import importlib.util
+import math
+import random
+import statistics
+import threading
+import time
 import uuid
 import re
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from urllib.parse import parse_qs, urlparse
+from typing import List, Dict, Any, Optional, FrozenSet, Sequence, Union
 from datetime import datetime
 
+import numpy as np
+
 from infrastructure.logging import logger
 from infrastructure.cache import cache
+from infrastructure.cache.local_cache import LocalCache
 from infrastructure.config import config
+from infrastructure.single_flight import SingleFlight
 from api.models import Resource
 from services.youtube.youtube_service import YouTubeService
 
 
+def _requests_handler_available() -> bool:
+    """
+    Check whether yt-dlp can use its requests handler, which keeps a keep-alive
+    connection pool per YoutubeDL instance. It needs requests and urllib3 >= 2;
+    otherwise yt-dlp falls back to urllib, which reconnects for every request.
+
+    Returns:
+        True if requests and urllib3 >= 2 are installed
+    """
+    if importlib.util.find_spec("requests") is None:
+        return False
+    try:
+        return int(importlib.metadata.version("urllib3").split(".")[0]) >= 2
+    except (importlib.metadata.PackageNotFoundError, ValueError):
+        return False
+
+
+if not _requests_handler_available():
+    logger.get_logger("youtube.ytdlp").warning(
+        "yt-dlp requests handler unavailable (needs requests and urllib3>=2), "
+        "extractions will not reuse connections")
+
+# Duration formats, compiled once since they are parsed for every video
+_ISO_DURATION_RE = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
+_HMS_RE = re.compile(r'(?:(\d+):)?(\d+):(\d+)')
+# Words matched between queries and video titles/descriptions
+_WORD_RE = re.compile(r'\w+')
+
+# Marks a video dictionary whose upload date hasn't been parsed yet (None means unknown)
+_UNPARSED = object()
+
+
+@functools.lru_cache(maxsize=256)
+def _query_terms(query: str) -> FrozenSet[str]:
+    """
+    Split a relevance query into its set of case-folded words. Cached because the
+    same query scores every candidate video of a search.
+
+    Args:
+        query: Relevance query
+
+    Returns:
+        Set of case-folded query words
+    """
+    return frozenset(_WORD_RE.findall(query.casefold()))
+
+
+def _parse_upload_date(upload_date_str: str) -> Optional[datetime]:
+    """
+    Parse a video upload date as a naive UTC datetime.
+
+    Args:
+        upload_date_str: Date in yt-dlp (YYYYMMDD) or ISO 8601 format
+
+    Returns:
+        The upload date, or None if missing or invalid
+    """
+    if not upload_date_str:
+        return None
+    try:
+        # yt-dlp format: YYYYMMDD, sliced directly as strptime is much slower
+        if len(upload_date_str) == 8 and upload_date_str.isdigit():
+            return datetime(int(upload_date_str[:4]), int(upload_date_str[4:6]), int(upload_date_str[6:]))
+        # ISO format
+        if 'T' in upload_date_str:
+            return datetime.fromisoformat(upload_date_str.replace('Z', '+00:00')).replace(tzinfo=None)
+    except ValueError:
+        pass
+    return None
+
+
+class VideoRecord:
+    """
+    Candidate video built from a yt-dlp search entry.
+    Uses __slots__ so the many candidates of a search stay small; it is converted
+    to a dictionary only when the results are cached or returned.
+    """
+
+    # Fields exposed in the video dictionaries
+    FIELDS = ('id', 'title', 'url', 'description', 'duration', 'duration_seconds', 'thumbnail',
+              'channel', 'publishedAt', 'viewCount', 'likeCount', 'tags')
+
+    # relevance_score and upload_date (publishedAt, parsed on first use) are internal
+    __slots__ = FIELDS + ('relevance_score', 'upload_date')
+
+    def __init__(self, id: str, title: str, url: str, description: str, duration: Optional[int],
+                 duration_seconds: Optional[int], thumbnail: Optional[str], channel: str,
+                 publishedAt: str, viewCount: Optional[int], likeCount: Optional[int],
+                 tags: List[str], relevance_score: float = 0.0):
+        self.id = id
+        self.title = title
+        self.url = url
+        self.description = description
+        self.duration = duration
+        self.duration_seconds = duration_seconds
+        self.thumbnail = thumbnail
+        self.channel = channel
+        self.publishedAt = publishedAt
+        self.viewCount = viewCount
+        self.likeCount = likeCount
+        self.tags = list(tags) if tags else []
+        self.relevance_score = relevance_score
+        self.upload_date = _UNPARSED
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get a field like dict.get, so the scoring helpers accept records and dictionaries.
+
+        Args:
+            key: Field name
+            default: Value returned for unknown fields
+
+        Returns:
+            The field value, or default
+        """
+        return getattr(self, key, default)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the record to a video information dictionary, for caching and returning.
+
+        Returns:
+            Dictionary with video information, without the relevance score or missing (None) fields
+        """
+        video = {}
+        for field in self.FIELDS:
+            value = getattr(self, field)
+            if value is not None:
+                video[field] = value
+        return video
+
+
 class YtDlpService(YouTubeService):
     """
     YouTube integration using yt-dlp.
@@ -43,8 +191,60 @@ class YtDlpService(YouTubeService):
     DURATION_WEIGHT = 1.0
     LIKE_RATIO_WEIGHT = 2.0
 
-    # List of search term templates for subtopics - expanded for better coverage
-    SUBTOPIC_SEARCH_TERMS = [
+    # Topic searches run their queries concurrently, at most this many at a time
+    MAX_CONCURRENT_TOPIC_QUERIES = 3
+    TOPIC_QUERY_TIMEOUT = 10  # seconds per query
+
+    # Early refresh of cached topic results (XFetch); higher values refresh earlier
+    XFETCH_BETA = 1.0
+    # Fraction of the TTL after which cached topic results are stale: still served, but refreshed in the background
+    STALE_AFTER_FRACTION = 0.5
+    # Seconds a topic refresh lock is held at most, so a crashed refresh doesn't block later ones
+    REFRESH_LOCK_TTL = 60
+    # Shared cache TTLs vary by +/- this fraction, so entries written in a burst don't all expire together
+    TTL_JITTER = 0.1
+
+    # Candidate sets larger than this are scored and sorted off the event loop
+    RANK_OFFLOAD_THRESHOLD = 32
+
+    # Failed video lookups are cached briefly under this marker
+    MISS_MARKER = '__miss__'
+    MISS_CACHE_TTL = 600  # seconds
+
+    # yt-dlp option variants, merged over common_ydl_opts. Kept fixed so the
+    # pooled YoutubeDL instances (one per variant and thread) stay few.
+    SEARCH_YDL_OPTS = {
+        'quiet': True,
+        'no_warnings': True,
+        'ignoreerrors': True,
+        'extract_flat': 'in_playlist',
+        'skip_download': True,
+        'socket_timeout': 5,
+    }
+    PLAYLIST_YDL_OPTS = {
+        'quiet': True,
+        'no_warnings': True,
+        'ignoreerrors': True,
+        'extract_flat': True,
+        'skip_download': True,
+        'socket_timeout': 5,
+        'retries': 1,         # Minimal retries
+    }
+    DETAILS_YDL_OPTS = {
+        'quiet': True,
+        'no_warnings': True,
+        'ignoreerrors': True,
+        'skip_download': True,
+        'extract_flat': False,  # We want full details for a single video
+        'writesubtitles': False,
+        'writeautomaticsub': False,
+        'allsubtitles': False,
+        'playlist_items': '1',  # Only extract the first item if it's a playlist
+        'socket_timeout': 3,
+    }
+
+    # Search term templates for subtopics - expanded for better coverage
+    SUBTOPIC_SEARCH_TERMS = (
         "{topic} tutorial",
         "{topic} guide",
         "{topic} explained",
@@ -69,10 +269,14 @@ class YtDlpService(YouTubeService):
         "{topic} in depth",
         "{topic} masterclass",
         "{topic} crash course"
-    ]
+    )
+
+    # Templates used for subtopic and topic queries, sliced once instead of on every call
+    _SUBTOPIC_TEMPLATES = SUBTOPIC_SEARCH_TERMS[:8]
+    _TOPIC_TEMPLATES = SUBTOPIC_SEARCH_TERMS[:6]
 
     # Language prefix mapping
-    LANGUAGE_PREFIXES = {
+    LANGUAGE_PREFIXES = MappingProxyType({
         "pt": "português ",
         "en": "english ",
         "es": "español ",
@@ -82,10 +286,10 @@ class YtDlpService(YouTubeService):
         "ru": "русский ",
         "ja": "日本語 ",
         "zh": "中文 "
-    }
+    })
 
     # Prefixes to remove from subtopics for better search results
-    PREFIXES_TO_REMOVE = [
+    PREFIXES_TO_REMOVE = (
         "Introduction to", "Getting Started with", "Understanding", "Basics of",
         "Advanced", "Mastering", "Practical", "Exploring", "Deep Dive into",
         "Essential", "Fundamentals of", "Working with", "Building with",
@@ -93,7 +297,10 @@ class YtDlpService(YouTubeService):
         "Introdução a", "Introdução ao", "Conceitos de", "Fundamentos de",
         "Avançado", "Prático", "Explorando", "Essencial", "Trabalhando com",
         "Desenvolvendo com", "Profissional", "Moderno", "Eficiente"
-    ]
+    )
+
+    # Single anchored alternation over the prefixes, longest first so the most specific prefix wins
+    _PREFIX_RE = re.compile("|".join(map(re.escape, sorted(PREFIXES_TO_REMOVE, key=len, reverse=True))))
 
     def __init__(self, cache_ttl: int = 86400):
         """
@@ -117,7 +324,6 @@ class YtDlpService(YouTubeService):
             'ignoreerrors': True,
             'skip_download': True,
             'extract_flat': 'in_playlist',
-            'format': 'best',
             'socket_timeout': 10,  # Increased from 8 to 10 seconds for more reliable connections
             'retries': 5,          # Increased from 3 to 5 retries for better reliability
             'fragment_retries': 3, # Increased from 2 to 3 retries
@@ -129,13 +335,41 @@ class YtDlpService(YouTubeService):
             'max_sleep_interval': 3, # Reduced from 5 to 3 seconds for faster processing
             'extractor_retries': 3, # Added extractor retries
             'skip_playlist_after_errors': 3, # Skip playlist after 3 errors
-            'postprocessor_args': {
-                'ffmpeg': ['-threads', '4']  # Use 4 threads for ffmpeg processing
-            },
         }
 
-        # Create a cache for video details to avoid redundant lookups
-        self._video_details_cache = {}
+        # Process-local tier in front of the shared cache for video details
+        self._local_cache = LocalCache(max_size=2048, ttl=300)
+
+        # Background topic cache refreshes by cache key, at most one per key
+        self._refresh_tasks: Dict[str, "asyncio.Task[None]"] = {}
+
+        # In-flight lookups by cache key, so concurrent misses share one extraction
+        self._inflight = SingleFlight("yt-dlp lookup")
+
+        # Recently missing videos, checked before the shared cache
+        self._miss_cache = LocalCache(max_size=1024, ttl=self.MISS_CACHE_TTL)
+
+        # Bound the concurrent queries of a topic search
+        self._query_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_TOPIC_QUERIES)
+
+        # Dedicated threads for blocking yt-dlp work, so it neither starves nor is starved
+        # by other users of the loop's default executor
+        self.max_workers = youtube_config.get("ytdlp_workers", 8)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ytdlp")
+        # Large rankings run on their own thread, so they don't queue behind blocking extractions.
+        # One worker also keeps rankings sharing cached video dictionaries from running at once
+        self._rank_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ytdlp-rank")
+
+        # YoutubeDL instances reused across extractions so HTTP connections, cookies and
+        # extractors are set up once. YoutubeDL isn't thread-safe, so each executor thread
+        # keeps its own instance per option variant.
+        self._ydl_local = threading.local()
+        self._ydl_instances: List[yt_dlp.YoutubeDL] = []
+        self._ydl_lock = threading.Lock()
+
+        # Limit concurrent yt-dlp detail extractions so a search doesn't hammer YouTube
+        self.max_concurrent_requests = youtube_config.get("ytdlp_max_concurrent_requests", 8)
+        self.request_semaphore = asyncio.Semaphore(self.max_concurrent_requests)
 
         self.logger.info("Initialized YtDlpService with optimized settings")
 
@@ -155,22 +389,46 @@ class YtDlpService(YouTubeService):
             max_results = self.max_results_default
 
         # Check cache first
-        cache_key = f"youtube:search:{query}_{max_results}_{language}"
+        cache_key = self._search_cache_key(query, max_results, language)
         cached_result = cache.get(cache_key)
         if cached_result:
             self.logger.debug(f"Using cached YouTube search results for '{query}'")
             return cached_result
 
-        # Configure yt-dlp options
-        ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'ignoreerrors': True,
-            'extract_flat': 'in_playlist',
-            'skip_download': True,
-            'format': 'best',
-        }
+        results = await self._inflight.run(
+            cache_key, lambda: self._search_videos_uncached(query, max_results, language, cache_key)
+        )
+        return list(results)
 
+    @staticmethod
+    def _search_cache_key(query: str, max_results: int, language: str) -> str:
+        """
+        Build the cache key of a video search.
+
+        Args:
+            query: Search query
+            max_results: Maximum number of results
+            language: Language code (e.g., 'en', 'pt')
+
+        Returns:
+            Cache key for the search results
+        """
+        return f"youtube:search:{query}_{max_results}_{language}"
+
+    async def _search_videos_uncached(self, query: str, max_results: int, language: str,
+                                      cache_key: str) -> List[Dict[str, Any]]:
+        """
+        Run a yt-dlp video search and cache the results.
+
+        Args:
+            query: Search query
+            max_results: Maximum number of results to return
+            language: Language code (e.g., 'en', 'pt')
+            cache_key: Cache key for the results
+
+        Returns:
+            List of dictionaries with video information, sorted by relevance
+        """
         # Add language prefix to query
         lang_prefix = self.LANGUAGE_PREFIXES.get(language, "")
         # Request more results than needed to allow for filtering
@@ -180,12 +438,16 @@ class YtDlpService(YouTubeService):
             # Run search asynchronously
             loop = asyncio.get_event_loop()
             results = await loop.run_in_executor(
-                None,
-                lambda: self._extract_info_with_ytdlp(search_query, ydl_opts)
+                self._executor,
+                lambda: self._extract_info_with_ytdlp(search_query, self.SEARCH_YDL_OPTS)
             )
 
-            # Process results
-            videos = []
+            # Build the candidate videos from the search entries, dropping the ones that
+            # already fail the quality checks that enrichment can't change. The age checks
+            # and recency scores of this search all use the same current time
+            now = datetime.now()
+            candidates = []
+            detail_ids = set()
             for entry in results:
                 # Check if it's a valid video
                 if entry.get('_type') == 'url' and 'youtube' in entry.get('url', ''):
@@ -197,54 +459,86 @@ class YtDlpService(YouTubeService):
                     thumbnail = self._get_best_thumbnail(entry)
 
                     # Create video info
-                    video = {
-                        'id': entry.get('id', uuid.uuid4().hex[:8]),
-                        'title': entry.get('title', ''),
-                        'url': entry.get('url', ''),
-                        'description': entry.get('description', '') or f"Channel: {entry.get('uploader', '')}",
-                        'duration': duration_minutes,
-                        'duration_seconds': duration_seconds,
-                        'thumbnail': thumbnail,
-                        'channel': entry.get('uploader', ''),
-                        'publishedAt': entry.get('upload_date', ''),
-                        'viewCount': entry.get('view_count', 0),
-                        'likeCount': entry.get('like_count', 0),
-                        'tags': entry.get('tags', [])
-                    }
-
-                    # Get detailed information for better filtering and scoring
-                    if video['id']:
-                        detailed_info = await self.get_video_details(video['id'])
-                        if detailed_info:
-                            # Update with more detailed information
-                            video.update({
-                                'viewCount': detailed_info.get('viewCount', video['viewCount']),
-                                'likeCount': detailed_info.get('likeCount', video['likeCount']),
-                                'tags': detailed_info.get('tags', video['tags']),
-                                'description': detailed_info.get('description', video['description'])
-                            })
-
-                    # Calculate relevance score
-                    video['relevance_score'] = self._score_video(video, query)
-
-                    # Apply quality filters
-                    if self._filter_video_by_quality(video):
-                        videos.append(video)
+                    video = VideoRecord(
+                        id=entry.get('id', uuid.uuid4().hex[:8]),
+                        title=entry.get('title', ''),
+                        url=entry.get('url', ''),
+                        description=entry.get('description', '') or f"Channel: {entry.get('uploader', '')}",
+                        duration=duration_minutes,
+                        duration_seconds=duration_seconds,
+                        thumbnail=thumbnail,
+                        channel=entry.get('uploader', ''),
+                        publishedAt=entry.get('upload_date', ''),
+                        viewCount=entry.get('view_count', 0),
+                        likeCount=entry.get('like_count', 0),
+                        tags=entry.get('tags', [])
+                    )
+                    if not self._meets_duration_and_age(video, now):
+                        continue
+                    candidates.append(video)
+
+                    # Only fetch details when the search entry lacks the fields they provide
+                    needs_details = not (entry.get('view_count') and entry.get('description') and entry.get('tags'))
+                    if needs_details and video.id:
+                        detail_ids.add(video.id)
+
+            # Enrich the candidates in batches, in search order, and stop once the
+            # best videos found so far are good enough
+            kept_records: List[VideoRecord] = []
+            batch_size = max_results * 2
+            for start in range(0, len(candidates), batch_size):
+                batch = candidates[start:start + batch_size]
+
+                # Get detailed information for better filtering and scoring: load the cached
+                # details of the whole batch in one round trip, then extract the rest concurrently
+                detail_keys = {}
+                for video in batch:
+                    cache_key = f"youtube:video:{video.id}"
+                    if video.id in detail_ids and not self._miss_cache.get(cache_key):
+                        detail_keys[video.id] = cache_key
+                cached_details = self._local_cache.get_many_through(cache, list(detail_keys.values()), self.cache_ttl)
+
+                details_by_id: Dict[str, Any] = {}
+                missing_ids = []
+                for video_id, cache_key in detail_keys.items():
+                    if cache_key in cached_details:
+                        details_by_id[video_id] = self._cached_video_details(video_id, cache_key,
+                                                                             cached_details[cache_key])
+                    else:
+                        missing_ids.append(video_id)
+                details = await asyncio.gather(
+                    *(self._extract_video_details(video_id) for video_id in missing_ids),
+                    return_exceptions=True
+                )
+                details_by_id.update(zip(missing_ids, details))
+
+                for video in batch:
+                    detailed_info = details_by_id.get(video.id)
+                    if isinstance(detailed_info, dict):
+                        # Update with more detailed information
+                        video.viewCount = detailed_info.get('viewCount', video.viewCount)
+                        video.likeCount = detailed_info.get('likeCount', video.likeCount)
+                        video.tags = list(detailed_info.get('tags') or video.tags)
+                        video.description = detailed_info.get('description', video.description)
+
+                # Apply quality filters, then calculate relevance scores for the batch at once
+                kept = [video for video in batch if self._filter_video_by_quality(video, now)]
+                for video, score in zip(kept, self._score_videos(kept, query, now).tolist()):
+                    video.relevance_score = score
+                kept_records.extend(kept)
+
+                if self._has_enough_videos(kept_records, max_results):
+                    break
 
             # Sort videos by relevance score (descending)
-            videos.sort(key=lambda v: v.get('relevance_score', 0), reverse=True)
+            kept_records.sort(key=lambda v: v.relevance_score, reverse=True)
 
-            # Limit to max_results
-            videos = videos[:max_results]
-
-            # Remove scoring information before caching
-            for video in videos:
-                if 'relevance_score' in video:
-                    del video['relevance_score']
+            # Limit to max_results and convert to dictionaries (without scoring information) for caching
+            videos = [video.to_dict() for video in kept_records[:max_results]]
 
             # Cache the results
             if videos:
-                cache.setex(cache_key, self.cache_ttl, videos)
+                cache.setex(cache_key, self._jittered_ttl(), videos)
                 self.logger.debug(f"Cached YouTube search results for '{query}' ({len(videos)} videos)")
             else:
                 self.logger.warning(f"No YouTube videos found for '{query}'")
@@ -254,6 +548,24 @@ class YtDlpService(YouTubeService):
             self.logger.error(f"Error searching YouTube for '{query}': {str(e)}")
             return []
 
+    def _has_enough_videos(self, videos: List[VideoRecord], max_results: int) -> bool:
+        """
+        Check whether scored videos are plentiful and relevant enough to stop enriching more candidates.
+
+        Args:
+            videos: Scored videos that passed the quality filters
+            max_results: Number of results the search returns
+
+        Returns:
+            True if there are at least twice max_results videos and the median score
+            of the best max_results exceeds a full title match
+        """
+        if len(videos) < max_results * 2:
+            return False
+
+        top_scores = sorted((video.relevance_score for video in videos), reverse=True)[:max_results]
+        return statistics.median(top_scores) > self.TITLE_MATCH_WEIGHT
+
     async def get_video_details(self, video_id: str) -> Optional[Dict[str, Any]]:
         """
         Get details for a specific video.
@@ -264,33 +576,75 @@ class YtDlpService(YouTubeService):
         Returns:
             Dictionary with video details or None if not found
         """
-        # Check cache first
+        # Check cache first, including recent misses
         cache_key = f"youtube:video:{video_id}"
-        cached_result = cache.get(cache_key)
+        if self._miss_cache.get(cache_key):
+            return None
+        cached_result = self._local_cache.get_through(cache, cache_key, self.cache_ttl)
         if cached_result:
-            self.logger.debug(f"Using cached YouTube video details for '{video_id}'")
-            return cached_result
+            return self._cached_video_details(video_id, cache_key, cached_result)
 
-        # Configure yt-dlp options
-        ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'ignoreerrors': True,
-            'skip_download': True,
-            'format': 'best',
-        }
+        return await self._extract_video_details(video_id)
+
+    def _cached_video_details(self, video_id: str, cache_key: str,
+                              cached_result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Interpret cached video details, which may be a cached miss.
+
+        Args:
+            video_id: YouTube video ID
+            cache_key: Cache key of the details
+            cached_result: Value found in the cache
+
+        Returns:
+            Dictionary with video details or None for a cached miss
+        """
+        if cached_result.get(self.MISS_MARKER):
+            self._miss_cache.set(cache_key, True, self.MISS_CACHE_TTL)
+            self.logger.debug(f"Using cached miss for YouTube video '{video_id}'")
+            return None
+        self.logger.debug(f"Using cached YouTube video details for '{video_id}'")
+        return cached_result
 
+    async def _extract_video_details(self, video_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get details for a video missing from the caches, extracting them once for concurrent callers.
+
+        Args:
+            video_id: YouTube video ID
+
+        Returns:
+            Dictionary with video details or None if not found
+        """
+        cache_key = f"youtube:video:{video_id}"
+        return await self._inflight.run(
+            cache_key, lambda: self._get_video_details_uncached(video_id, cache_key)
+        )
+
+    async def _get_video_details_uncached(self, video_id: str, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract the details of a video with yt-dlp and cache them.
+
+        Args:
+            video_id: YouTube video ID
+            cache_key: Cache key for the result
+
+        Returns:
+            Dictionary with video details or None if not found
+        """
         try:
             # Run extraction asynchronously
             loop = asyncio.get_event_loop()
             video_url = f"https://www.youtube.com/watch?v={video_id}"
-            result = await loop.run_in_executor(
-                None,
-                lambda: self._extract_video_info(video_url, ydl_opts)
-            )
+            async with self.request_semaphore:
+                result = await loop.run_in_executor(
+                    self._executor,
+                    lambda: self._extract_video_info(video_url, self.DETAILS_YDL_OPTS)
+                )
 
             if not result:
                 self.logger.warning(f"No details found for YouTube video '{video_id}'")
+                self._remember_miss(cache_key)
                 return None
 
             # Process result
@@ -312,18 +666,32 @@ class YtDlpService(YouTubeService):
                 'publishedAt': result.get('upload_date', ''),
                 'viewCount': result.get('view_count'),
                 'likeCount': result.get('like_count'),
-                'tags': result.get('tags', [])
+                'tags': list(result.get('tags') or [])
             }
+            # Drop missing fields so they don't take space in the cache
+            video = {key: value for key, value in video.items() if value is not None}
 
             # Cache the result
-            cache.setex(cache_key, self.cache_ttl, video)
+            self._local_cache.setex_later(cache, cache_key, self._jittered_ttl(), video)
             self.logger.debug(f"Cached YouTube video details for '{video_id}'")
 
             return video
         except Exception as e:
             self.logger.error(f"Error getting YouTube video details for '{video_id}': {str(e)}")
+            self._remember_miss(cache_key)
             return None
 
+    def _remember_miss(self, cache_key: str) -> None:
+        """
+        Cache a failed video lookup briefly, so repeated lookups for a missing video skip yt-dlp.
+
+        Args:
+            cache_key: Cache key of the video details
+        """
+        self._miss_cache.set(cache_key, True, self.MISS_CACHE_TTL)
+        self._local_cache.delete(cache_key)
+        cache.setex(cache_key, self.MISS_CACHE_TTL, {self.MISS_MARKER: True})
+
     async def search_playlists(self, query: str, max_results: int = 3, language: str = "en") -> List[Dict[str, Any]]:
         """
         Search for YouTube playlists related to a query.
@@ -343,18 +711,25 @@ class YtDlpService(YouTubeService):
             self.logger.debug(f"Using cached YouTube playlist results for '{query}'")
             return cached_result
 
-        # Configure yt-dlp options - use minimal options for faster processing
-        ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'ignoreerrors': True,
-            'extract_flat': True,
-            'skip_download': True,
-            'format': 'best',
-            'socket_timeout': 3,  # Short timeout
-            'retries': 1,         # Minimal retries
-        }
+        results = await self._inflight.run(
+            cache_key, lambda: self._search_playlists_uncached(query, max_results, language, cache_key)
+        )
+        return list(results)
 
+    async def _search_playlists_uncached(self, query: str, max_results: int, language: str,
+                                         cache_key: str) -> List[Dict[str, Any]]:
+        """
+        Run a yt-dlp playlist search and cache the results.
+
+        Args:
+            query: Search query
+            max_results: Maximum number of playlists to return
+            language: Language code (e.g., 'en', 'pt')
+            cache_key: Cache key for the results
+
+        Returns:
+            List of dictionaries with playlist information
+        """
         # Add language prefix to query
         lang_prefix = self.LANGUAGE_PREFIXES.get(language, "")
         # Request fewer playlists to speed up processing
@@ -364,8 +739,8 @@ class YtDlpService(YouTubeService):
             # Run search asynchronously with a timeout
             loop = asyncio.get_event_loop()
             extract_task = loop.run_in_executor(
-                None,
-                lambda: self._extract_info_with_ytdlp(search_query, ydl_opts)
+                self._executor,
+                lambda: self._extract_info_with_ytdlp(search_query, self.PLAYLIST_YDL_OPTS)
             )
 
             # Set a timeout for the extraction
@@ -380,11 +755,9 @@ class YtDlpService(YouTubeService):
             for entry in results:
                 # Check if it's a valid playlist
                 if entry and entry.get('_type') == 'url' and 'youtube.com/playlist' in entry.get('url', ''):
-                    # Extract playlist ID from URL
+                    # Extract playlist ID from the URL's query string
                     url = entry.get('url', '')
-                    playlist_id = None
-                    if 'list=' in url:
-                        playlist_id = url.split('list=')[1].split('&')[0]
+                    playlist_id = parse_qs(urlparse(url).query).get('list', [None])[0]
 
                     if not playlist_id:
                         continue
@@ -407,7 +780,7 @@ class YtDlpService(YouTubeService):
 
             # Cache the results
             if playlists:
-                cache.setex(cache_key, self.cache_ttl, playlists)
+                cache.setex(cache_key, self._jittered_ttl(), playlists)
                 self.logger.debug(f"Cached YouTube playlist results for '{query}' ({len(playlists)} playlists)")
             else:
                 self.logger.warning(f"No YouTube playlists found for '{query}'")
@@ -436,27 +809,36 @@ class YtDlpService(YouTubeService):
             self.logger.debug(f"Using cached YouTube playlist videos for '{playlist_id}'")
             return cached_result
 
-        # Configure yt-dlp options - use minimal options for faster processing
-        ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-            'ignoreerrors': True,
-            'extract_flat': True,
-            'skip_download': True,
-            'format': 'best',
-            'socket_timeout': 3,  # Short timeout
-            'retries': 1,         # Minimal retries
-            'playlistend': max_videos,  # Limit the number of videos to extract
-        }
+        results = await self._inflight.run(
+            cache_key, lambda: self._get_playlist_videos_uncached(playlist_id, max_videos, language, cache_key)
+        )
+        return list(results)
+
+    async def _get_playlist_videos_uncached(self, playlist_id: str, max_videos: int, language: str,
+                                            cache_key: str) -> List[Dict[str, Any]]:
+        """
+        Extract the videos of a playlist with yt-dlp and cache them.
+
+        Args:
+            playlist_id: YouTube playlist ID
+            max_videos: Maximum number of videos to return
+            language: Language code (e.g., 'en', 'pt')
+            cache_key: Cache key for the results
 
+        Returns:
+            List of dictionaries with video information
+        """
         playlist_url = f"https://www.youtube.com/playlist?list={playlist_id}"
 
         try:
             # Run extraction asynchronously with a timeout
             loop = asyncio.get_event_loop()
             extract_task = loop.run_in_executor(
-                None,
-                lambda: self._extract_info_with_ytdlp(playlist_url, ydl_opts)
+                self._executor,
+                lambda: self._extract_info_with_ytdlp(
+                    playlist_url, self.PLAYLIST_YDL_OPTS,
+                    {'playlistend': max_videos}  # Limit the number of videos to extract
+                )
             )
 
             # Set a timeout for the extraction
@@ -505,7 +887,7 @@ class YtDlpService(YouTubeService):
 
             # Cache the results
             if videos:
-                cache.setex(cache_key, self.cache_ttl, videos)
+                cache.setex(cache_key, self._jittered_ttl(), videos)
                 self.logger.debug(f"Cached YouTube playlist videos for '{playlist_id}' ({len(videos)} videos)")
             else:
                 self.logger.warning(f"No videos found in YouTube playlist '{playlist_id}'")
@@ -533,80 +915,79 @@ class YtDlpService(YouTubeService):
         """
         # Check cache first for this specific topic/subtopic combination
         cache_key = f"youtube:topic:{topic}_{subtopic}_{max_results}_{language}"
-        cached_result = cache.get(cache_key, resource_type='resource_list')
-        if cached_result:
-            # If we have a small number of cached results, consider refreshing in the background
-            if len(cached_result) < max_results:
-                self.logger.info(f"Found only {len(cached_result)} cached results for '{topic}', will refresh in background")
-                # Schedule a background refresh but still return cached results
-                asyncio.create_task(self._refresh_topic_cache(topic, subtopic, max_results, language, cache_key))
+        cached_entry = cache.get(cache_key)
+        if cached_entry:
+            cached_result = [Resource.from_dict(resource) for resource in cached_entry['resources']]
+            # Refresh in the background as expiry approaches, but still return cached results.
+            # The refresh lock keeps other workers sharing the cache from refreshing the same topic
+            if (self._should_refresh_early(cached_entry) and cache_key not in self._refresh_tasks
+                    and cache.setnx(f"{cache_key}:refresh_lock", self.REFRESH_LOCK_TTL, True)):
+                self.logger.info(f"Cached YouTube topic results for '{topic}' are stale or close to expiry, refreshing in background")
+                task = asyncio.create_task(self._refresh_topic_cache(topic, subtopic, max_results, language, cache_key))
+                self._refresh_tasks[cache_key] = task
+                task.add_done_callback(lambda _: self._refresh_tasks.pop(cache_key, None))
             else:
                 self.logger.info(f"Using cached YouTube topic results for '{topic}' ({len(cached_result)} videos)")
             return cached_result
 
+        started = time.monotonic()
+
         # Generate multiple search queries for better coverage
         search_queries = self._generate_search_queries(topic, subtopic, language)
 
-        # Track all videos found across all queries
-        all_videos = []
-        existing_ids = set()
+        # Track all videos found across all queries, by ID so duplicates are dropped on merge
+        all_videos: Dict[str, Dict[str, Any]] = {}
 
         # Limit the number of queries to try based on topic complexity
         max_queries_to_try = min(5, len(search_queries))
         if ' ' not in topic:  # Simple topics need fewer queries
             max_queries_to_try = min(3, max_queries_to_try)
 
-        # Use a longer timeout for the first query, shorter for subsequent ones
-        first_query_timeout = 15  # 15 seconds for first query
-        subsequent_query_timeout = 8  # 8 seconds for subsequent queries
-
-        # Try each query until we have enough results or run out of queries
-        for i, query_info in enumerate(search_queries[:max_queries_to_try]):
-            query = query_info["query"]
-            query_type = query_info["type"]
-
-            self.logger.info(f"Trying {query_type} query: '{query}'")
-
-            # Skip if we already have enough videos
-            if len(all_videos) >= max_results * 1.5:  # Get 50% more than needed for better filtering
-                break
-
-            # Set timeout based on query position
-            query_timeout = first_query_timeout if i == 0 else subsequent_query_timeout
-
-            # Try this query with a timeout
-            try:
-                # Adjust max_results based on how many we still need
-                needed_results = max(1, max_results - len(all_videos))
-
-                # For first query, request more results
-                if i == 0:
-                    request_count = needed_results * 3  # Request 3x for first query
-                else:
-                    request_count = needed_results * 2  # Request 2x for subsequent queries
-
-                videos_task = asyncio.create_task(self.search_videos(query, request_count, language))
-                videos = await asyncio.wait_for(videos_task, timeout=query_timeout)
-
-                # Add new videos to our collection, avoiding duplicates
-                for video in videos:
-                    video_id = video.get('id')
-                    if video_id and video_id not in existing_ids:
-                        all_videos.append(video)
-                        existing_ids.add(video_id)
-
-                self.logger.info(f"Found {len(videos)} videos for query '{query}', total now: {len(all_videos)}")
-
-                # If we got good results from the first query, we can be more selective with subsequent ones
-                if i == 0 and len(videos) >= max_results:
-                    max_queries_to_try = min(3, max_queries_to_try)  # Reduce max queries if first query was successful
+        def add_videos(videos: List[Dict[str, Any]]) -> None:
+            # Add new videos to our collection, avoiding duplicates
+            for video in videos:
+                video_id = video.get('id')
+                if video_id:
+                    all_videos.setdefault(video_id, video)
+
+        # Request 3x for the first query, 2x for the others
+        queries = [
+            (query_info, max_results * (3 if i == 0 else 2))
+            for i, query_info in enumerate(search_queries[:max_queries_to_try])
+        ]
+
+        # Load every query's cached search results in one round trip and only search for the misses
+        search_keys = [self._search_cache_key(query_info["query"], request_count, language)
+                       for query_info, request_count in queries]
+        cached_searches = {key: videos for key, videos in cache.get_many(search_keys).items() if videos}
+        pending = []
+        for (query_info, request_count), search_key in zip(queries, search_keys):
+            cached_videos = cached_searches.get(search_key)
+            if cached_videos:
+                self.logger.debug(f"Using cached YouTube search results for '{query_info['query']}'")
+                add_videos(cached_videos)
+            else:
+                pending.append((query_info, request_count))
+
+        # Run the remaining queries concurrently (bounded by the query semaphore) and stop
+        # as soon as we have 50% more videos than needed, for better filtering
+        tasks = []
+        if len(all_videos) < max_results * 1.5:
+            tasks = [
+                asyncio.ensure_future(self._run_topic_query(query_info, request_count, language))
+                for query_info, request_count in pending
+            ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                add_videos(await next_done)
 
-            except asyncio.TimeoutError:
-                self.logger.warning(f"Timeout searching videos for '{query}'")
-                continue
-            except Exception as e:
-                self.logger.error(f"Error searching videos for '{query}': {str(e)}")
-                continue
+                if len(all_videos) >= max_results * 1.5:
+                    break
+        finally:
+            # Cancel the queries we no longer need
+            for query_task in tasks:
+                query_task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
         # If we still don't have enough videos, try searching for playlists
         if len(all_videos) < max_results:
@@ -623,38 +1004,39 @@ class YtDlpService(YouTubeService):
                 playlists_task = asyncio.create_task(self.search_playlists(playlist_query, 2, language))
                 playlists = await asyncio.wait_for(playlists_task, timeout=6)  # Increased timeout
 
-                # Try each playlist until we have enough videos
+                # Get the videos of all playlists concurrently and stop once we have enough
+                needed_videos = max(1, max_results - len(all_videos))
+                playlist_tasks = []
                 for playlist in playlists:
-                    # Skip if we already have enough videos
-                    if len(all_videos) >= max_results:
-                        break
-
                     playlist_id = playlist.get('id')
                     if not playlist_id:
                         continue
 
                     self.logger.info(f"Trying playlist: {playlist.get('title', 'Unknown')}")
+                    playlist_tasks.append(asyncio.ensure_future(asyncio.wait_for(
+                        self.get_playlist_videos(playlist_id, max_videos=needed_videos * 2, language=language),
+                        timeout=6  # Increased timeout
+                    )))
 
-                    # Get videos from this playlist
-                    try:
-                        needed_videos = max(1, max_results - len(all_videos))
-                        playlist_videos_task = asyncio.create_task(
-                            self.get_playlist_videos(playlist_id, max_videos=needed_videos * 2, language=language)
-                        )
-                        playlist_videos = await asyncio.wait_for(playlist_videos_task, timeout=6)  # Increased timeout
+                try:
+                    for next_done in asyncio.as_completed(playlist_tasks):
+                        try:
+                            playlist_videos = await next_done
+                        except (asyncio.TimeoutError, Exception) as e:
+                            self.logger.warning(f"Error or timeout getting playlist videos: {str(e)}")
+                            continue
 
                         # Add playlist videos to results, avoiding duplicates
-                        for video in playlist_videos:
-                            video_id = video.get('id')
-                            if video_id and video_id not in existing_ids:
-                                all_videos.append(video)
-                                existing_ids.add(video_id)
-
+                        add_videos(playlist_videos)
                         self.logger.info(f"Added {len(playlist_videos)} videos from playlist, total now: {len(all_videos)}")
 
-                    except (asyncio.TimeoutError, Exception) as e:
-                        self.logger.warning(f"Error or timeout getting playlist videos: {str(e)}")
-                        continue
+                        if len(all_videos) >= max_results:
+                            break
+                finally:
+                    # Cancel the playlists we no longer need
+                    for playlist_task in playlist_tasks:
+                        playlist_task.cancel()
+                    await asyncio.gather(*playlist_tasks, return_exceptions=True)
 
             except (asyncio.TimeoutError, Exception) as e:
                 self.logger.warning(f"Error or timeout searching playlists: {str(e)}")
@@ -665,13 +1047,8 @@ class YtDlpService(YouTubeService):
         else:
             relevance_query = topic
 
-        for video in all_videos:
-            video['relevance_score'] = self._score_video(video, relevance_query)
-
-        all_videos.sort(key=lambda v: v.get('relevance_score', 0), reverse=True)
-
-        # Limit to max_results
-        final_videos = all_videos[:max_results]
+        # Keep the max_results most relevant videos
+        final_videos = await self._rank_videos(list(all_videos.values()), relevance_query, max_results)
 
         # Convert to Resource objects
         resources = self._convert_videos_to_resources(final_videos, subtopic=subtopic, is_subtopic=bool(subtopic))
@@ -688,12 +1065,101 @@ class YtDlpService(YouTubeService):
                 cache_ttl = self.cache_ttl
                 self.logger.info(f"Caching {len(resources)} resources for '{topic}' with normal TTL")
 
-            cache.setex(cache_key, cache_ttl, resources)
+            self._cache_topic_results(cache_key, cache_ttl, resources, time.monotonic() - started)
         else:
             self.logger.warning(f"No YouTube videos found for '{topic}'")
 
         return resources
 
+    def _should_refresh_early(self, entry: Dict[str, Any]) -> bool:
+        """
+        Decide whether to refresh cached topic results before they expire.
+
+        Results past their stale point are always refreshed (stale-while-revalidate).
+        Before that, the chance of refreshing grows as expiry approaches and with
+        how long the results took to compute (XFetch), so one caller usually
+        refreshes shortly before expiry instead of many recomputing at once after it.
+
+        Args:
+            entry: Cached topic entry, as written by _cache_topic_results
+
+        Returns:
+            True if the caller should refresh the results now
+        """
+        now = time.time()
+        if now >= entry['stale_at']:
+            return True
+
+        # -log(random()) is exponentially distributed, so early refreshes are rare until close to expiry
+        early_by = -entry['delta'] * self.XFETCH_BETA * math.log(1.0 - random.random())
+        return now + early_by >= entry['expiry']
+
+    def _jittered_ttl(self, ttl: Optional[int] = None) -> int:
+        """
+        Spread a shared cache TTL uniformly by +/- TTL_JITTER.
+
+        Args:
+            ttl: Base TTL in seconds (default: the service cache TTL)
+
+        Returns:
+            Jittered TTL in seconds
+        """
+        ttl = self.cache_ttl if ttl is None else ttl
+        return int(ttl * (1.0 - self.TTL_JITTER + 2 * self.TTL_JITTER * random.random()))
+
+    def _cache_topic_results(self, cache_key: str, ttl: int, resources: List[Resource], delta: float) -> None:
+        """
+        Cache topic results with the metadata used for early and stale refreshes.
+        Both share one entry, so they can't expire apart: a non-empty dict is kept for
+        its full TTL, while cache backends shorten the TTL of small lists.
+
+        Args:
+            cache_key: Cache key of the topic results
+            ttl: Time to live in seconds
+            resources: Resources to cache
+            delta: Seconds it took to compute the results
+        """
+        ttl = self._jittered_ttl(ttl)
+        now = time.time()
+        cache.setex(cache_key, ttl, {
+            'resources': [resource.to_dict() for resource in resources],
+            'expiry': now + ttl,
+            'stale_at': now + ttl * self.STALE_AFTER_FRACTION,
+            'delta': delta
+        })
+
+    async def _run_topic_query(self, query_info: Dict[str, str], request_count: int,
+                               language: str) -> List[Dict[str, Any]]:
+        """
+        Run one topic search query under the query semaphore and timeout.
+
+        Args:
+            query_info: Query dictionary from _generate_search_queries
+            request_count: Number of videos to request
+            language: Language code (e.g., 'en', 'pt')
+
+        Returns:
+            List of dictionaries with video information, empty on timeout or error
+        """
+        query = query_info["query"]
+
+        async with self._query_semaphore:
+            self.logger.info(f"Trying {query_info['type']} query: '{query}'")
+            try:
+                videos = await asyncio.wait_for(
+                    self.search_videos(query, request_count, language),
+                    timeout=self.TOPIC_QUERY_TIMEOUT
+                )
+            except asyncio.TimeoutError:
+                self.logger.warning(f"Timeout searching videos for '{query}'")
+                return []
+            except Exception as e:
+                self.logger.error(f"Error searching videos for '{query}': {str(e)}")
+                return []
+
+        self.logger.info(f"Found {len(videos)} videos for query '{query}'")
+        return videos
+
     def _generate_search_queries(self, topic: str, subtopic: str = None, language: str = "en") -> List[Dict[str, str]]:
         """
         Generate multiple search queries for a topic/subtopic combination.
@@ -706,47 +1172,30 @@ class YtDlpService(YouTubeService):
         Returns:
             List of query dictionaries with 'query' and 'type' keys
         """
-        queries = []
         lang_prefix = self.LANGUAGE_PREFIXES.get(language, "")
+        prefixed_topic = f"{lang_prefix}{topic}"
 
         # If we have a subtopic, create specific queries
         if subtopic:
             # Clean subtopic for better search results
             clean_subtopic = self._clean_subtopic(subtopic)
 
-            # Add direct subtopic query
-            queries.append({
-                "query": f"{lang_prefix}{clean_subtopic} {topic}",
-                "type": "direct_subtopic"
-            })
-
-            # Add formatted subtopic queries
-            for template in self.SUBTOPIC_SEARCH_TERMS[:8]:  # Use first 8 templates
-                search_term = template.format(topic=clean_subtopic)
-                queries.append({
-                    "query": f"{lang_prefix}{search_term} {topic}",
-                    "type": "formatted_subtopic"
-                })
+            # Direct subtopic query, then formatted subtopic queries
+            queries = [{"query": f"{lang_prefix}{clean_subtopic} {topic}", "type": "direct_subtopic"}]
+            queries.extend(
+                {"query": f"{lang_prefix}{template.format(topic=clean_subtopic)} {topic}", "type": "formatted_subtopic"}
+                for template in self._SUBTOPIC_TEMPLATES
+            )
 
             # Add topic-only query as fallback
-            queries.append({
-                "query": f"{lang_prefix}{topic}",
-                "type": "topic_only"
-            })
+            queries.append({"query": prefixed_topic, "type": "topic_only"})
         else:
-            # For main topic, start with direct query
-            queries.append({
-                "query": f"{lang_prefix}{topic}",
-                "type": "direct_topic"
-            })
-
-            # Add some formatted topic queries
-            for template in self.SUBTOPIC_SEARCH_TERMS[:6]:  # Use first 6 templates
-                search_term = template.format(topic=topic)
-                queries.append({
-                    "query": f"{lang_prefix}{search_term}",
-                    "type": "formatted_topic"
-                })
+            # For main topic, start with direct query, then some formatted topic queries
+            queries = [{"query": prefixed_topic, "type": "direct_topic"}]
+            queries.extend(
+                {"query": f"{lang_prefix}{template.format(topic=topic)}", "type": "formatted_topic"}
+                for template in self._TOPIC_TEMPLATES
+            )
 
         # Add simplified query if topic has multiple words
         if ' ' in topic:
@@ -767,7 +1216,7 @@ class YtDlpService(YouTubeService):
 
     async def _refresh_topic_cache(self, topic: str, subtopic: str, max_results: int, language: str, cache_key: str) -> None:
         """
-        Refresh the cache for a topic in the background.
+        Refresh the cache for a topic in the background, releasing its refresh lock when done.
 
         Args:
             topic: Main topic
@@ -778,59 +1227,58 @@ class YtDlpService(YouTubeService):
         """
         try:
             self.logger.debug(f"Background refreshing cache for topic '{topic}'")
+            started = time.monotonic()
 
             # Get the current cache value to compare later
-            current_cached = cache.get(cache_key, resource_type='resource_list')
-            current_count = len(current_cached) if current_cached else 0
+            current_entry = cache.get(cache_key)
+            current_count = len(current_entry['resources']) if current_entry else 0
 
             # Generate multiple search queries
             search_queries = self._generate_search_queries(topic, subtopic, language)
 
-            # Track all videos
-            all_videos = []
-            existing_ids = set()
+            # Track all videos, by ID so duplicates are dropped on merge
+            all_videos: Dict[str, Dict[str, Any]] = {}
 
-            # Try each query
-            for query_info in search_queries[:3]:  # Limit to first 3 queries for background refresh
-                query = query_info["query"]
+            # Run the first 3 queries concurrently; the refresh isn't latency-critical, so all of them complete
+            results = await asyncio.gather(*(
+                self._run_topic_query(query_info, max_results * 2, language)
+                for query_info in search_queries[:3]
+            ))
 
-                try:
-                    videos = await self.search_videos(query, max_results * 2, language)
-
-                    # Add new videos, avoiding duplicates
-                    for video in videos:
-                        video_id = video.get('id')
-                        if video_id and video_id not in existing_ids:
-                            all_videos.append(video)
-                            existing_ids.add(video_id)
-                except Exception:
-                    continue
-
-                if len(all_videos) >= max_results * 1.5:
-                    break
+            # Add new videos in query order, avoiding duplicates
+            for videos in results:
+                for video in videos:
+                    video_id = video.get('id')
+                    if video_id:
+                        all_videos.setdefault(video_id, video)
 
             # Sort by relevance
             relevance_query = f"{topic} {subtopic}" if subtopic else topic
-            for video in all_videos:
-                video['relevance_score'] = self._score_video(video, relevance_query)
-
-            all_videos.sort(key=lambda v: v.get('relevance_score', 0), reverse=True)
-
-            # Limit to max_results
-            final_videos = all_videos[:max_results]
+            # Keep the max_results most relevant videos
+            final_videos = await self._rank_videos(list(all_videos.values()), relevance_query, max_results)
 
             # Convert to Resource objects
             resources = self._convert_videos_to_resources(final_videos, subtopic=subtopic, is_subtopic=bool(subtopic))
 
-            # Only update cache if we found more results than before
-            if len(resources) > current_count:
+            # Only update cache if we found at least as many results as before
+            if resources and len(resources) >= current_count:
                 self.logger.info(f"Background refresh found {len(resources)} resources (was {current_count})")
-                cache.setex(cache_key, self.cache_ttl, resources)
+                self._cache_topic_results(cache_key, self.cache_ttl, resources, time.monotonic() - started)
             else:
-                self.logger.info(f"Background refresh didn't improve results ({len(resources)} ≤ {current_count})")
+                self.logger.info(f"Background refresh didn't improve results ({len(resources)} < {current_count})")
+                if current_entry:
+                    # Keep the current results, but move their stale point halfway to expiry,
+                    # so the next hits don't start another refresh right away
+                    now = time.time()
+                    remaining = current_entry['expiry'] - now
+                    if remaining >= 1:
+                        current_entry['stale_at'] = now + remaining * self.STALE_AFTER_FRACTION
+                        cache.setex(cache_key, int(remaining), current_entry)
 
         except Exception as e:
             self.logger.error(f"Error in background topic cache refresh: {str(e)}")
+        finally:
+            cache.delete(f"{cache_key}:refresh_lock")
 
     def _convert_videos_to_resources(self, videos: List[Dict[str, Any]],
                                     subtopic: str = None, is_subtopic: bool = False) -> List[Resource]:
@@ -884,34 +1332,77 @@ class YtDlpService(YouTubeService):
 
         return resources
 
-    def _extract_info_with_ytdlp(self, search_query: str, ydl_opts: dict) -> List[dict]:
+    def _get_ydl(self, ydl_opts: dict) -> yt_dlp.YoutubeDL:
+        """
+        Get this thread's YoutubeDL instance for an option variant, creating it on first use.
+
+        Args:
+            ydl_opts: yt-dlp option variant (one of the *_YDL_OPTS constants)
+
+        Returns:
+            YoutubeDL instance configured with the common options and the variant
+        """
+        pool = getattr(self._ydl_local, 'pool', None)
+        if pool is None:
+            pool = self._ydl_local.pool = {}
+
+        key = repr(sorted(ydl_opts.items()))
+        ydl = pool.get(key)
+        if ydl is None:
+            ydl = yt_dlp.YoutubeDL({**self.common_ydl_opts, **ydl_opts})
+            pool[key] = ydl
+            with self._ydl_lock:
+                self._ydl_instances.append(ydl)
+        return ydl
+
+    async def aclose(self) -> None:
+        """
+        Shut down the yt-dlp executors and close the pooled YoutubeDL instances.
+        Safe to call more than once.
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._rank_executor.shutdown(wait=False, cancel_futures=True)
+
+        with self._ydl_lock:
+            instances, self._ydl_instances = self._ydl_instances, []
+        self._ydl_local = threading.local()
+
+        for ydl in instances:
+            try:
+                ydl.close()
+            except Exception as e:
+                self.logger.warning(f"Error closing yt-dlp instance: {str(e)}")
+
+    def _extract_info_with_ytdlp(self, search_query: str, ydl_opts: dict,
+                                 overrides: Optional[dict] = None) -> List[dict]:
         """
         Extract information from videos using yt-dlp.
 
         Args:
             search_query: Search query
-            ydl_opts: yt-dlp options
+            ydl_opts: yt-dlp option variant (one of the *_YDL_OPTS constants)
+            overrides: Per-call options applied to the pooled instance (e.g., playlistend)
 
         Returns:
             List of video information
         """
-        # Merge with common options
-        merged_opts = {**self.common_ydl_opts, **ydl_opts}
-
-        # Add a timeout to the entire operation
         try:
-            with yt_dlp.YoutubeDL(merged_opts) as ydl:
-                # Set a timeout for the extraction process
-                ydl.params['socket_timeout'] = 5  # 5 seconds timeout
+            ydl = self._get_ydl(ydl_opts)
 
+            # Apply per-call options only for this extraction; the instance is reused
+            saved = {key: ydl.params.get(key) for key in overrides or ()}
+            ydl.params.update(overrides or {})
+            try:
                 # Extract info with timeout
                 result = ydl.extract_info(search_query, download=False)
+            finally:
+                ydl.params.update(saved)
 
-                if result and 'entries' in result:
-                    # Filter out None entries that might cause issues
-                    entries = [entry for entry in result['entries'] if entry is not None]
-                    return entries
-                return []
+            if result and 'entries' in result:
+                # Filter out None entries that might cause issues
+                entries = [entry for entry in result['entries'] if entry is not None]
+                return entries
+            return []
         except yt_dlp.utils.DownloadError as e:
             # More specific error handling for common YouTube issues
             if "This video is not available" in str(e):
@@ -931,39 +1422,14 @@ class YtDlpService(YouTubeService):
 
         Args:
             video_url: Video URL
-            ydl_opts: yt-dlp options
+            ydl_opts: yt-dlp option variant (one of the *_YDL_OPTS constants)
 
         Returns:
             Video information or None if not found
         """
-        # Check in-memory cache first
-        video_id = video_url.split('v=')[-1].split('&')[0] if 'v=' in video_url else None
-        if video_id and video_id in self._video_details_cache:
-            return self._video_details_cache[video_id]
-
-        # Merge with common options
-        merged_opts = {**self.common_ydl_opts, **ydl_opts}
-
-        # Use a more minimal set of options for single video extraction
-        merged_opts['extract_flat'] = False  # We want full details for a single video
-        merged_opts['writesubtitles'] = False
-        merged_opts['writeautomaticsub'] = False
-        merged_opts['allsubtitles'] = False
-        merged_opts['playlist_items'] = '1'  # Only extract the first item if it's a playlist
-
         try:
-            with yt_dlp.YoutubeDL(merged_opts) as ydl:
-                # Set a shorter timeout for single video extraction
-                ydl.params['socket_timeout'] = 3  # 3 seconds timeout
-
-                # Extract info with timeout
-                result = ydl.extract_info(video_url, download=False, process=False)
-
-                # Cache the result in memory
-                if result and video_id:
-                    self._video_details_cache[video_id] = result
-
-                return result
+            # Extract info with timeout
+            return self._get_ydl(ydl_opts).extract_info(video_url, download=False, process=False)
         except yt_dlp.utils.DownloadError as e:
             # More specific error handling for common YouTube issues
             if "This video is not available" in str(e):
@@ -997,15 +1463,11 @@ class YtDlpService(YouTubeService):
                 return f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg"
             return None
 
-        # Sort thumbnails by resolution (width x height)
-        sorted_thumbnails = sorted(
-            thumbnails,
-            key=lambda t: (t.get('width', 0) * t.get('height', 0)),
-            reverse=True
-        )
+        # Pick the highest resolution thumbnail (width x height); the first one wins ties
+        best_thumbnail = max(thumbnails, key=lambda t: (t.get('width') or 0) * (t.get('height') or 0))
 
         # Return the URL of the best thumbnail
-        return sorted_thumbnails[0].get('url') if sorted_thumbnails else None
+        return best_thumbnail.get('url')
 
     def _parse_duration(self, duration_str: str) -> Optional[int]:
         """
@@ -1021,7 +1483,7 @@ class YtDlpService(YouTubeService):
             return None
 
         # ISO 8601 format (PT1H30M15S)
-        iso_match = re.match(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?', duration_str)
+        iso_match = _ISO_DURATION_RE.match(duration_str)
         if iso_match:
             hours = int(iso_match.group(1) or 0)
             minutes = int(iso_match.group(2) or 0)
@@ -1029,7 +1491,7 @@ class YtDlpService(YouTubeService):
             return hours * 60 + minutes + (1 if seconds > 30 else 0)
 
         # HH:MM:SS or MM:SS format
-        time_match = re.match(r'(?:(\d+):)?(\d+):(\d+)', duration_str)
+        time_match = _HMS_RE.match(duration_str)
         if time_match:
             hours = int(time_match.group(1) or 0)
             minutes = int(time_match.group(2) or 0)
@@ -1051,117 +1513,186 @@ class YtDlpService(YouTubeService):
         clean_subtopic = subtopic
 
         # Remove common prefixes that might interfere with search
-        for prefix in self.PREFIXES_TO_REMOVE:
-            if clean_subtopic.startswith(prefix):
-                clean_subtopic = clean_subtopic[len(prefix):].strip()
-                break
+        prefix_match = self._PREFIX_RE.match(clean_subtopic)
+        if prefix_match:
+            clean_subtopic = clean_subtopic[prefix_match.end():].strip()
 
         return clean_subtopic
 
+    async def _rank_videos(self, videos: List[Dict[str, Any]], query: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Score videos and select the most relevant ones. Large candidate sets are
+        ranked on the ranking executor to keep the event loop responsive.
+
+        Args:
+            videos: Video information dictionaries
+            query: Relevance query
+            limit: Number of videos to select
+
+        Returns:
+            Up to limit videos, most relevant first
+        """
+        if len(videos) > self.RANK_OFFLOAD_THRESHOLD:
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(self._rank_executor, self._select_top_videos, videos, query, limit)
+        return self._select_top_videos(videos, query, limit)
+
+    def _select_top_videos(self, videos: List[Dict[str, Any]], query: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Score videos and select the most relevant ones, without sorting the whole list.
+        Scores stay local: the dictionaries may be shared with other searches (single-flight
+        and cached results), which rank them against other queries.
+
+        Args:
+            videos: Video information dictionaries
+            query: Relevance query
+            limit: Number of videos to select
+
+        Returns:
+            Up to limit videos, most relevant first (ties keep their original order)
+        """
+        scores = self._score_videos(videos, query)
+        return [videos[i] for i in heapq.nlargest(limit, range(len(videos)), key=scores.__getitem__)]
+
     def _score_video(self, video: Dict[str, Any], query: str) -> float:
         """
         Calculate a relevance score for a video based on various factors.
 
         Args:
-            video: Video information dictionary
+            video: Video information dictionary or VideoRecord
             query: Original search query
 
         Returns:
             Relevance score (higher is better)
         """
-        score = 0.0
+        return float(self._score_videos([video], query)[0])
 
-        # Extract video data
-        title = video.get('title', '').lower()
-        description = video.get('description', '').lower()
-        view_count = video.get('viewCount', 0) or 0
-        duration_seconds = video.get('duration', 0) * 60 if video.get('duration') else 0
-        like_count = video.get('likeCount', 0) or 0
+    def _score_videos(self, videos: Sequence[Union[VideoRecord, Dict[str, Any]]], query: str,
+                      now: Optional[datetime] = None) -> np.ndarray:
+        """
+        Calculate relevance scores for a batch of videos.
+        Query terms are matched per video; the view, recency, duration and like
+        sub-scores are computed for the whole batch over column arrays.
 
-        # Parse upload date
-        upload_date_str = video.get('publishedAt', '')
-        upload_date = None
-        if upload_date_str:
-            try:
-                # YouTube API format: YYYYMMDD
-                if len(upload_date_str) == 8:
-                    upload_date = datetime.strptime(upload_date_str, '%Y%m%d')
-                # ISO format
-                elif 'T' in upload_date_str:
-                    upload_date = datetime.fromisoformat(upload_date_str.replace('Z', '+00:00'))
-            except ValueError:
-                pass
-
-        # Calculate title match score
-        query_terms = query.lower().split()
-        title_match_count = sum(1 for term in query_terms if term in title)
-        title_match_score = title_match_count / max(1, len(query_terms))
-        score += title_match_score * self.TITLE_MATCH_WEIGHT
-
-        # Calculate description match score
-        description_match_count = sum(1 for term in query_terms if term in description)
-        description_match_score = description_match_count / max(1, len(query_terms))
-        score += description_match_score * self.DESCRIPTION_MATCH_WEIGHT
-
-        # Calculate view count score (logarithmic scale)
-        if view_count > 0:
-            view_score = min(1.0, max(0.0, (min(10000000, view_count) / 10000000)))
-            score += view_score * self.VIEWS_WEIGHT
-
-        # Calculate recency score
-        if upload_date:
-            days_old = (datetime.now() - upload_date).days
-            recency_score = max(0.0, 1.0 - (days_old / self.MAX_AGE_DAYS))
-            score += recency_score * self.RECENCY_WEIGHT
-
-        # Calculate duration score (prefer videos between 5-30 minutes)
-        if duration_seconds:
-            if duration_seconds < 300:  # Less than 5 minutes
-                duration_score = duration_seconds / 300
-            elif duration_seconds <= 1800:  # 5-30 minutes (ideal)
-                duration_score = 1.0
-            else:  # More than 30 minutes
-                duration_score = max(0.0, 1.0 - ((duration_seconds - 1800) / 1800))
-            score += duration_score * self.DURATION_WEIGHT
-
-        # Calculate like ratio score
-        if view_count > 0 and like_count > 0:
-            like_ratio = min(1.0, like_count / max(1, view_count / 10))  # Assuming 10% like rate is good
-            score += like_ratio * self.LIKE_RATIO_WEIGHT
-
-        return score
-
-    def _filter_video_by_quality(self, video: Dict[str, Any]) -> bool:
+        Args:
+            videos: Video information dictionaries or VideoRecords
+            query: Original search query
+            now: Current time for recency scores (default: read once for the batch)
+
+        Returns:
+            Array of relevance scores (higher is better), in the order of videos
+        """
+        query_terms = _query_terms(query)
+        term_count = max(1, len(query_terms))
+        # Ages are whole calendar days: integer ordinal differences, no timedelta per video
+        now_ordinal = (now or datetime.now()).toordinal()
+
+        count = len(videos)
+        title_matches = np.zeros(count)
+        description_matches = np.zeros(count)
+        view_counts = np.zeros(count)
+        like_counts = np.zeros(count)
+        duration_seconds = np.zeros(count)
+        days_old = np.full(count, np.nan)  # NaN when the upload date is unknown
+
+        # Extract video data, matching query words against each text's set of words
+        for i, video in enumerate(videos):
+            title_words = _WORD_RE.findall((video.get('title') or '').casefold())
+            description_words = _WORD_RE.findall((video.get('description') or '').casefold())
+            title_matches[i] = len(query_terms.intersection(title_words))
+            description_matches[i] = len(query_terms.intersection(description_words))
+            view_counts[i] = video.get('viewCount', 0) or 0
+            like_counts[i] = video.get('likeCount', 0) or 0
+            # Exact duration when known (search results), whole minutes otherwise
+            duration_seconds[i] = video.get('duration_seconds') or (video.get('duration') or 0) * 60
+            upload_date = self._get_upload_date(video)
+            if upload_date:
+                days_old[i] = now_ordinal - upload_date.toordinal()
+
+        # Title and description match scores
+        scores = title_matches / term_count * self.TITLE_MATCH_WEIGHT
+        scores += description_matches / term_count * self.DESCRIPTION_MATCH_WEIGHT
+
+        # View count score (capped at 10M views)
+        scores += np.clip(view_counts, 0, 10000000) / 10000000 * self.VIEWS_WEIGHT
+
+        # Recency score (no score without an upload date)
+        scores += np.nan_to_num(np.maximum(0.0, 1.0 - days_old / self.MAX_AGE_DAYS)) * self.RECENCY_WEIGHT
+
+        # Duration score (prefer videos between 5-30 minutes)
+        duration_scores = np.select(
+            [duration_seconds < 300, duration_seconds <= 1800],
+            [duration_seconds / 300, 1.0],
+            default=np.clip(1.0 - (duration_seconds - 1800) / 1800, 0.0, 1.0)
+        )
+        scores += duration_scores * self.DURATION_WEIGHT
+
+        # Like ratio score, assuming a 10% like rate is good
+        like_ratios = np.minimum(1.0, like_counts / np.maximum(1.0, view_counts / 10))
+        scores += np.where((view_counts > 0) & (like_counts > 0), like_ratios, 0.0) * self.LIKE_RATIO_WEIGHT
+
+        return scores
+
+    def _filter_video_by_quality(self, video: VideoRecord, now: Optional[datetime] = None) -> bool:
         """
         Check if a video meets the quality criteria.
 
         Args:
-            video: Video information dictionary
+            video: Candidate video record
+            now: Current time for the age check, shared by a batch of videos (default: now)
 
         Returns:
             True if the video meets quality criteria, False otherwise
         """
         # Check view count
-        view_count = video.get('viewCount', 0) or 0
+        view_count = video.viewCount or 0
         if view_count < self.MIN_VIEWS:
             return False
 
+        return self._meets_duration_and_age(video, now)
+
+    def _meets_duration_and_age(self, video: VideoRecord, now: Optional[datetime] = None) -> bool:
+        """
+        Check the quality criteria that only depend on search result fields (duration and age).
+
+        Args:
+            video: Candidate video record
+            now: Current time for the age check, shared by a batch of videos (default: now)
+
+        Returns:
+            True if the video meets the duration and age criteria, False otherwise
+        """
         # Check duration
-        duration_seconds = video.get('duration', 0) * 60 if video.get('duration') else 0
+        duration_seconds = video.duration_seconds or 0
         if duration_seconds < self.MIN_DURATION_SECONDS or duration_seconds > self.MAX_DURATION_SECONDS:
             return False
 
-        # Check age
-        upload_date_str = video.get('publishedAt', '')
-        if upload_date_str:
-            try:
-                # YouTube API format: YYYYMMDD
-                if len(upload_date_str) == 8:
-                    upload_date = datetime.strptime(upload_date_str, '%Y%m%d')
-                    days_old = (datetime.now() - upload_date).days
-                    if days_old > self.MAX_AGE_DAYS:
-                        return False
-            except ValueError:
-                pass
+        # Check age last, so videos rejected by the cheaper checks never parse their upload date
+        upload_date = self._get_upload_date(video)
+        if upload_date and (now or datetime.now()).toordinal() - upload_date.toordinal() > self.MAX_AGE_DAYS:
+            return False
 
         return True
+
+    def _get_upload_date(self, video: Union[VideoRecord, Dict[str, Any]]) -> Optional[datetime]:
+        """
+        Get the parsed upload date of a video, parsing publishedAt only once per video.
+        Records keep it in their upload_date slot; dictionaries keep it under '_upload_date'.
+
+        Args:
+            video: Video information dictionary or VideoRecord
+
+        Returns:
+            The upload date, or None if missing or invalid
+        """
+        if isinstance(video, VideoRecord):
+            upload_date = video.upload_date
+            if upload_date is _UNPARSED:
+                upload_date = video.upload_date = _parse_upload_date(video.publishedAt)
+        else:
+            upload_date = video.get('_upload_date', _UNPARSED)
+            if upload_date is _UNPARSED:
+                upload_date = video['_upload_date'] = _parse_upload_date(video.get('publishedAt', ''))
+
+        # Parsed, the date is a datetime or None (unknown)
+        return upload_date if isinstance(upload_date, datetime) else None
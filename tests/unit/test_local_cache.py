@@ -0,0 +1,85 @@
+"""
+Unit tests for the LocalCache implementation.
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from infrastructure.cache.local_cache import LocalCache
+
+
+class TestLocalCache:
+    """Tests for the LocalCache implementation."""
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = LocalCache(max_size=2, ttl=60)
+
+        cache.set("a", 1, 60)
+        cache.set("b", 2, 60)
+        cache.get("a")
+        cache.set("c", 3, 60)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        assert len(cache) == 2
+
+    def test_ttl_capped_by_local_ttl(self):
+        """Test that entries never outlive the local TTL."""
+        cache = LocalCache(max_size=10, ttl=5)
+
+        with patch("infrastructure.cache.local_cache.time.monotonic", return_value=100.0):
+            cache.set("key", [1, 2], 86400)
+        with patch("infrastructure.cache.local_cache.time.monotonic", return_value=104.0):
+            assert cache.get("key") == [1, 2]
+        with patch("infrastructure.cache.local_cache.time.monotonic", return_value=106.0):
+            assert cache.get("key") is None
+
+    def test_read_and_write_through(self):
+        """Test that shared cache hits are kept locally and failed writes drop local entries."""
+        cache = LocalCache(max_size=10, ttl=60)
+        shared = MagicMock()
+        shared.get.return_value = ["result"]
+
+        assert cache.get_through(shared, "key", 3600) == ["result"]
+        assert cache.get_through(shared, "key", 3600) == ["result"]
+        shared.get.assert_called_once_with("key")
+
+        shared.setex.return_value = False
+        assert not cache.setex_through(shared, "key", 3600, ["new"])
+        assert cache.get("key") is None
+
+        shared.setex.return_value = True
+        assert cache.setex_through(shared, "key", 3600, ["new"])
+        assert cache.get("key") == ["new"]
+
+    def test_get_many_through(self):
+        """Test that local misses are fetched from the shared cache in one call and kept locally."""
+        cache = LocalCache(max_size=10, ttl=60)
+        cache.set("a", 1, 60)
+        shared = MagicMock()
+        shared.get_many.return_value = {"b": 2}
+
+        assert cache.get_many_through(shared, ["a", "b", "c"], 3600) == {"a": 1, "b": 2}
+        shared.get_many.assert_called_once_with(["b", "c"])
+        assert cache.get("b") == 2
+
+    @pytest.mark.asyncio
+    async def test_setex_later_defers_and_coalesces(self):
+        """Test that deferred writes reach the shared cache once, after the current step."""
+        cache = LocalCache(max_size=10, ttl=60)
+        shared = MagicMock()
+        shared.setex.return_value = True
+
+        cache.setex_later(shared, "key", 3600, ["first"])
+        cache.setex_later(shared, "key", 3600, ["second"])
+
+        # Visible locally right away, written to the shared cache on the next loop iteration
+        assert cache.get("key") == ["second"]
+        shared.setex.assert_not_called()
+
+        await asyncio.sleep(0)
+        shared.setex.assert_called_once_with("key", 3600, ["second"])
@@ -22,6 +22,23 @@ class TestMemoryCache:
         
         assert value == "test_value"
         
+    def test_get_many(self):
+        """Test getting several values at once."""
+        cache = MemoryCache(max_size=10)
+        cache.setex("key1", 60, "value1")
+        cache.setex("key2", 60, "value2")
+
+        assert cache.get_many(["key1", "key2", "missing"]) == {"key1": "value1", "key2": "value2"}
+        
+    def test_setnx(self):
+        """Test that setnx only sets missing keys."""
+        cache = MemoryCache(max_size=10)
+
+        assert cache.setnx("lock", 60, True)
+        assert not cache.setnx("lock", 60, True)
+        cache.delete("lock")
+        assert cache.setnx("lock", 60, True)
+        
     def test_ttl_expiration(self):
         """Test that values expire after TTL."""
         cache = MemoryCache(max_size=10)
@@ -204,6 +221,16 @@ class TestMemoryCache:
         # Should be equal to the original value
         assert retrieved_value == complex_value
         
+    def test_non_json_values(self):
+        """Test that values JSON can't represent still round-trip."""
+        cache = MemoryCache(max_size=10)
+        
+        # Integer keys and bytes are not valid JSON
+        value = {1: "one", "raw": b"\x00\x01"}
+        cache.setex("non_json_key", 60, value)
+        
+        assert cache.get("non_json_key") == value
+        
     def test_metrics(self):
         """Test cache metrics."""
         cache = MemoryCache(max_size=2)
@@ -2,31 +2,54 @@
 Unit tests for the search implementations.
 """
 
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from unittest.mock import patch, MagicMock, AsyncMock
 
-from services.search.duckduckgo_search import DuckDuckGoSearch
+from infrastructure.circuit_breaker import CircuitBreaker, CircuitBreakerOpenError
+from services.search.duckduckgo_search import DuckDuckGoSearch, DuckDuckGoRateLimitError, _RATE_LIMITED_SENTINEL
 from services.search.brave_search import BraveSearch
-from services.search.fallback_search import FallbackSearch
+from services.search.fallback_search import FallbackSearch, _local_cache, _canonical_url
 from services.search.search_factory import SearchFactory
 
 
+DDG_HTML_PAGE = """
+<html><body>
+<div class="result results_links result--ad">
+  <a class="result__a" href="https://ads.example.com/">Sponsored</a>
+</div>
+<div class="result results_links results_links_deep web-result ">
+  <h2 class="result__title"><a class="result__a" href="https://example.com/1">Test Title 1</a></h2>
+  <a class="result__snippet" href="https://example.com/1">Test Description 1</a>
+</div>
+<div class="result results_links results_links_deep web-result ">
+  <h2 class="result__title">
+    <a class="result__a" href="//duckduckgo.com/l/?uddg=https%3A%2F%2Fexample.com%2F2&amp;rut=abc">Test Title 2</a>
+  </h2>
+  <a class="result__snippet" href="https://example.com/2">Test Description 2</a>
+</div>
+</body></html>
+"""
+
+
 class TestDuckDuckGoSearch:
     """Tests for the DuckDuckGoSearch implementation."""
 
     @pytest.mark.asyncio
     async def test_search_impl(self):
         """Test the _search_impl method."""
-        # Mock the DDGS class
-        mock_ddgs = MagicMock()
-        mock_ddgs.__enter__.return_value = mock_ddgs
-        mock_ddgs.text.return_value = [
-            {"title": "Test Title 1", "href": "https://example.com/1", "body": "Test Description 1"},
-            {"title": "Test Title 2", "href": "https://example.com/2", "body": "Test Description 2"}
-        ]
+        # Mock the shared HTTP client
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.text = DDG_HTML_PAGE
+        mock_client = MagicMock()
+        mock_client.post = AsyncMock(return_value=mock_response)
         
-        with patch("services.search.duckduckgo_search.DDGS", return_value=mock_ddgs):
-            search = DuckDuckGoSearch()
+        search = DuckDuckGoSearch()
+        with patch.object(search, "_get_client", return_value=mock_client):
             results = await search._search_impl("test query", 2, "en")
             
             # Check results
@@ -35,12 +58,74 @@ class TestDuckDuckGoSearch:
             assert results[0]["url"] == "https://example.com/1"
             assert results[0]["description"] == "Test Description 1"
             
-            # Check that DDGS.text was called with the correct arguments
-            mock_ddgs.text.assert_called_once()
-            args, kwargs = mock_ddgs.text.call_args
-            assert args[0] == "test query"
-            assert kwargs["max_results"] == 2
-            assert kwargs["region"] == "us-en"
+            # Check that the HTML endpoint was called with the correct arguments
+            mock_client.post.assert_called_once()
+            args, kwargs = mock_client.post.call_args
+            assert args[0] == DuckDuckGoSearch.HTML_SEARCH_URL
+            assert kwargs["data"]["q"] == "test query"
+            assert kwargs["data"]["kl"] == "us-en"
+
+    @pytest.mark.asyncio
+    async def test_search_impl_negative_cache(self):
+        """Test that an empty result is remembered and not re-requested."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.text = "<html><body></body></html>"
+        mock_client = MagicMock()
+        mock_client.post = AsyncMock(return_value=mock_response)
+        
+        search = DuckDuckGoSearch()
+        with patch.object(search, "_get_client", return_value=mock_client):
+            assert await search._search_impl("unanswerable query", 2, "en") == []
+            assert await search._search_impl("unanswerable query", 2, "en") == []
+            
+            # The second call is answered from the negative cache
+            mock_client.post.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_search_impl_rate_limit_not_retried(self):
+        """Test that a rate-limited request is sent once, then remembered in the negative cache."""
+        import httpx
+
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(429)
+
+        search = DuckDuckGoSearch()
+        search.min_request_interval = 0.01
+        search._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        CircuitBreaker._instances.pop("duckduckgo_search", None)
+
+        try:
+            started = time.monotonic()
+            with pytest.raises(DuckDuckGoRateLimitError):
+                await search._search_impl("throttled query", 2, "en")
+            assert time.monotonic() - started < 5
+            assert len(requests) == 1
+
+            expires_at, value = search._negative_cache[("throttled query", 2, "en")]
+            assert value is _RATE_LIMITED_SENTINEL
+            assert expires_at - time.monotonic() == pytest.approx(DuckDuckGoSearch.RATE_LIMIT_CACHE_TTL, abs=1)
+            assert search.min_request_interval == pytest.approx(0.015)
+
+            # Later calls fail fast from the negative cache, even with the breaker reset
+            CircuitBreaker._instances.pop("duckduckgo_search", None)
+            with pytest.raises(DuckDuckGoRateLimitError):
+                await search._search_impl("throttled query", 2, "en")
+            assert len(requests) == 1
+        finally:
+            await search.aclose()
+            CircuitBreaker._instances.pop("duckduckgo_search", None)
+
+    def test_parse_html_results(self):
+        """Test that ads are skipped and redirect links are unwrapped."""
+        search = DuckDuckGoSearch()
+        results = search._parse_html_results(DDG_HTML_PAGE)
+        
+        assert [r["href"] for r in results] == ["https://example.com/1", "https://example.com/2"]
+        assert results[1]["body"] == "Test Description 2"
 
     @pytest.mark.asyncio
     async def test_search_with_cache(self):
@@ -101,6 +186,23 @@ class TestDuckDuckGoSearch:
             assert results[0]["title"] == "Test Title"
 
 
+    @pytest.mark.asyncio
+    async def test_search_with_retry_circuit_breaker_open(self):
+        """Test that search_with_retry doesn't retry when the circuit breaker is open."""
+        search = DuckDuckGoSearch()
+        search._search_impl = AsyncMock(side_effect=CircuitBreakerOpenError("duckduckgo_search is open"))
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = None
+
+        with patch("services.search.base_search.cache", mock_cache), \
+             patch("services.search.base_search.asyncio.sleep", new=AsyncMock()):
+            results = await search.search_with_retry("test query", 2, "en", max_retries=3)
+
+            assert results == []
+            search._search_impl.assert_called_once()
+
+
 class TestBraveSearch:
     """Tests for the BraveSearch implementation."""
 
@@ -146,9 +248,22 @@ class TestBraveSearch:
             assert kwargs["headers"]["X-Subscription-Token"] == "test_api_key"
 
 
+    def test_concurrency_limit_from_config(self):
+        """Test that each engine gets its configured in-flight request limit."""
+        assert BraveSearch().max_concurrent_requests == 5
+        assert DuckDuckGoSearch().max_concurrent_requests == 10
+
+
 class TestFallbackSearch:
     """Tests for the FallbackSearch implementation."""
 
+    @pytest.fixture(autouse=True)
+    def clear_local_cache(self):
+        """Start every test with an empty process-local result cache."""
+        _local_cache.clear()
+        yield
+        _local_cache.clear()
+
     @pytest.mark.asyncio
     async def test_search_impl_first_engine_succeeds(self):
         """Test the _search_impl method when the first engine succeeds."""
@@ -232,7 +347,7 @@ class TestFallbackSearch:
         
         with patch("services.search.fallback_search.cache", mock_cache):
             # Test search_parallel
-            results = await search.search_parallel("test query", 4, "en")
+            results = await search.search_parallel_impl("test query", 4, "en")
             
             # Check results (should be 3 unique results)
             assert len(results) == 3
@@ -246,6 +361,164 @@ class TestFallbackSearch:
             mock_cache.setex.assert_called_once()
 
 
+    @pytest.mark.asyncio
+    async def test_search_parallel_short_circuits_on_top_engine(self):
+        """Test that slower engines are cancelled once the highest-weight engine answers."""
+        slow_engine_cancelled = asyncio.Event()
+
+        async def slow_search(*args, **kwargs):
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                slow_engine_cancelled.set()
+                raise
+            return []
+
+        mock_engine1 = MagicMock()
+        mock_engine1.name = "engine1"
+        mock_engine1.search = AsyncMock(return_value=[
+            {"title": "Engine 1 Result", "url": "https://example.com/1", "description": "Engine 1 Description"}
+        ])
+
+        mock_engine2 = MagicMock()
+        mock_engine2.name = "engine2"
+        mock_engine2.search = slow_search
+
+        search = FallbackSearch([(mock_engine1, 1.0), (mock_engine2, 0.8)])
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = None
+
+        with patch("services.search.fallback_search.cache", mock_cache):
+            results = await asyncio.wait_for(search.search_parallel_impl("test query", 4, "en"), timeout=1)
+
+            assert len(results) == 1
+            assert results[0]["url"] == "https://example.com/1"
+            assert slow_engine_cancelled.is_set()
+
+
+    @pytest.mark.asyncio
+    async def test_search_uses_local_cache(self):
+        """Test that repeated searches are served from the process-local cache."""
+        mock_engine = MagicMock()
+        mock_engine.name = "engine1"
+        mock_engine.search = AsyncMock(return_value=[
+            {"title": "Engine 1 Result", "url": "https://example.com/1", "description": "Engine 1 Description"}
+        ])
+
+        search = FallbackSearch([(mock_engine, 1.0)])
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = None
+
+        with patch("services.search.fallback_search.cache", mock_cache):
+            first = await search.search("test query", 2, "en")
+            mock_cache.get.reset_mock()
+            second = await search.search("test query", 2, "en")
+
+            assert second == first
+            mock_cache.get.assert_not_called()
+            mock_engine.search.assert_called_once()
+
+
+    @pytest.mark.asyncio
+    async def test_search_coalesces_concurrent_queries(self):
+        """Test that concurrent identical searches share one engine call."""
+        release = asyncio.Event()
+
+        async def slow_search(*args, **kwargs):
+            await release.wait()
+            return [{"title": "Engine 1 Result", "url": "https://example.com/1", "description": "Engine 1 Description"}]
+
+        mock_engine = MagicMock()
+        mock_engine.name = "engine1"
+        mock_engine.search = AsyncMock(side_effect=slow_search)
+
+        search = FallbackSearch([(mock_engine, 1.0)])
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = None
+
+        with patch("services.search.fallback_search.cache", mock_cache):
+            callers = [asyncio.ensure_future(search.search("test query", 2, "en")) for _ in range(3)]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*callers)
+
+            assert all(len(r) == 1 for r in results)
+            mock_engine.search.assert_called_once()
+            assert not search._inflight
+
+
+    @pytest.mark.asyncio
+    async def test_search_parallel_skips_open_breakers(self):
+        """Test that engines with an open circuit breaker are not called."""
+        mock_engine1 = MagicMock()
+        mock_engine1.name = "engine1"
+        mock_engine1.search = AsyncMock()
+
+        mock_engine2 = MagicMock()
+        mock_engine2.name = "engine2"
+        mock_engine2.search = AsyncMock(return_value=[
+            {"title": "Engine 2 Result", "url": "https://example.com/2", "description": "Engine 2 Description"}
+        ])
+
+        search = FallbackSearch([(mock_engine1, 1.0), (mock_engine2, 0.8)])
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = None
+        statuses = {
+            "engine1_search": {"state": "OPEN", "last_failure_time": time.time(), "reset_timeout": 60}
+        }
+
+        with patch("services.search.fallback_search.cache", mock_cache), \
+             patch("services.search.fallback_search.CircuitBreaker.get_all_statuses", return_value=statuses):
+            results = await search.search_parallel_impl("test query", 4, "en")
+
+            assert len(results) == 1
+            mock_engine1.search.assert_not_called()
+            # engine2 receives the whole allocation
+            args, kwargs = mock_engine2.search.call_args
+            assert args[1] == 6
+
+    @pytest.mark.asyncio
+    async def test_search_parallel_keeps_highest_weighted_duplicate(self):
+        """Test that a page returned by several engines keeps its highest-weighted copy."""
+        mock_engine1 = MagicMock()
+        mock_engine1.name = "engine1"
+        mock_engine1.search = AsyncMock(return_value=[
+            {"title": "Result A", "url": "https://example.com/a", "description": "Engine 1"},
+            {"title": "Result B", "url": "https://example.com/b", "description": "Engine 1"}
+        ])
+
+        mock_engine2 = MagicMock()
+        mock_engine2.name = "engine2"
+        mock_engine2.search = AsyncMock(return_value=[
+            {"title": "Result B", "url": "https://www.example.com/b/", "description": "Engine 2"}
+        ])
+
+        search = FallbackSearch([(mock_engine1, 1.0), (mock_engine2, 0.8)])
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = None
+
+        with patch("services.search.fallback_search.cache", mock_cache):
+            results = await search.search_parallel_impl("test query", 4, "en")
+
+            # engine2's top result (0.8) outweighs engine1's second result (0.75)
+            assert [r["description"] for r in results] == ["Engine 1", "Engine 2"]
+            assert all("_weight" not in r for r in results)
+
+    def test_canonical_url(self):
+        """Test that URL variants of the same page share a dedup key."""
+        key = _canonical_url("https://example.com/a")
+
+        assert _canonical_url("http://www.Example.com/a/") == key
+        assert _canonical_url("https://example.com/a?utm_source=x&fbclid=y") == key
+        assert _canonical_url("https://example.com/a?b=2&a=1") == _canonical_url("https://example.com/a?a=1&b=2")
+        assert _canonical_url("https://example.com/a?page=2") != key
+
+
 class TestSearchFactory:
     """Tests for the SearchFactory."""
 
@@ -271,3 +544,12 @@ class TestSearchFactory:
         assert SearchFactory.create_search("brave") is brave_search
         assert SearchFactory.create_search("fallback") is fallback_search
         assert SearchFactory.create_search("default") is default_search
+
+    def test_create_search_concurrent(self):
+        """Test that concurrent calls create a single instance."""
+        SearchFactory._instances = {}
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            instances = list(executor.map(lambda _: SearchFactory.create_search("duckduckgo"), range(8)))
+
+        assert all(instance is instances[0] for instance in instances)
@@ -0,0 +1,73 @@
+"""
+Unit tests for the SingleFlight implementation.
+"""
+
+import asyncio
+
+import pytest
+
+from infrastructure.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Tests for the SingleFlight implementation."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_lookup(self):
+        """Test that concurrent callers for the same key share one lookup and its result."""
+        group = SingleFlight()
+        calls = []
+        release = asyncio.Event()
+
+        async def fetch(key):
+            calls.append(key)
+            await release.wait()
+            return key.upper()
+
+        callers = [asyncio.ensure_future(group.run(key, lambda key=key: fetch(key))) for key in ("a", "a", "b")]
+        await asyncio.sleep(0)
+        assert len(group) == 2
+
+        release.set()
+        assert await asyncio.gather(*callers) == ["A", "A", "B"]
+        assert sorted(calls) == ["a", "b"]
+        assert not group
+
+    @pytest.mark.asyncio
+    async def test_failure_shared_and_not_kept(self):
+        """Test that a failed lookup raises for every caller and the next call starts a new one."""
+        group = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(group.run("key", fetch), group.run("key", fetch), return_exceptions=True)
+        assert [type(result) for result in results] == [ValueError, ValueError]
+        assert calls == 1
+
+        with pytest.raises(ValueError):
+            await group.run("key", fetch)
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_lookup(self):
+        """Test that cancelling one caller leaves the lookup running for the others."""
+        group = SingleFlight()
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "result"
+
+        first = asyncio.ensure_future(group.run("key", fetch))
+        second = asyncio.ensure_future(group.run("key", fetch))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        release.set()
+        assert await second == "result"
+        assert first.cancelled()
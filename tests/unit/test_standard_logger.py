@@ -90,6 +90,34 @@ class TestStandardLogger:
         assert "request_id=abc" in message
         assert "action=test" in message
         
+    def test_lazy_formatting_args(self):
+        """Test that %-style arguments are passed through and merged with context."""
+        logger = StandardLogger(name="test_logger")
+        
+        # Mock the underlying logger
+        mock_logger = MagicMock()
+        logger.logger = mock_logger
+        
+        # Without context the arguments are left for the logging module
+        logger.info("Found %d results for '%s'", 3, "python")
+        args, kwargs = mock_logger.log.call_args
+        assert args == (logging.INFO, "Found %d results for '%s'", 3, "python")
+        
+        # With context the message is formatted before the context is appended
+        logger.info("Found %d results", 3, query="100%")
+        args, kwargs = mock_logger.log.call_args
+        assert args == (logging.INFO, "Found 3 results [query=100%]")
+        
+    def test_disabled_level_skipped(self):
+        """Test that messages below the effective level are not emitted."""
+        logger = StandardLogger(name="test_lazy_logger", level="INFO")
+        
+        with patch.object(logger.logger, "log") as mock_log:
+            logger.debug("Debug %s", "message")
+            mock_log.assert_not_called()
+            assert not logger.is_enabled_for(logging.DEBUG)
+            assert logger.is_enabled_for(logging.INFO)
+        
     def test_get_logger(self):
         """Test that get_logger returns a new logger with the correct name."""
         parent_logger = StandardLogger(name="parent")
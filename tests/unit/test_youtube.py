@@ -2,12 +2,22 @@
 Unit tests for the YouTube service implementations.
 """
 
+import asyncio
+import threading
+import time
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pytest
-from unittest.mock import patch, MagicMock, AsyncMock
+from unittest.mock import ANY, patch, MagicMock, AsyncMock
 
 from api.models import Resource
-from services.youtube.ytdlp_service import YtDlpService
-from services.youtube.youtube_api_service import YouTubeApiService
+from infrastructure.cache.memory_cache import MemoryCache
+from infrastructure.circuit_breaker import CircuitBreaker, CircuitState
+from services.youtube.ytdlp_service import VideoRecord, YtDlpService, _query_terms
+from services.youtube import ytdlp_service
+from services.youtube.youtube_api_service import YouTubeApiService, _parse_duration
 from services.youtube.fallback_youtube_service import FallbackYouTubeService
 from services.youtube.youtube_factory import YouTubeFactory
 
@@ -110,6 +120,617 @@ class TestYtDlpService:
         assert args[1] == 2
         assert args[2] == "en"
 
+    @pytest.mark.asyncio
+    async def test_search_videos_fetches_details_concurrently(self):
+        """Test that video details for the search entries are fetched concurrently."""
+        mock_results = [
+            {"_type": "url", "url": f"https://www.youtube.com/watch?v=test{i}", "id": f"test{i}",
+             "title": f"Test Video {i}", "duration": 180, "uploader": "Test Channel"}
+            for i in range(4)
+        ]
+
+        service = YtDlpService()
+        thread_names = []
+
+        def extract(*args):
+            thread_names.append(threading.current_thread().name)
+            return mock_results
+
+        service._extract_info_with_ytdlp = MagicMock(side_effect=extract)
+
+        in_flight = 0
+        peak = 0
+
+        async def slow_details(video_id):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"viewCount": 10000, "likeCount": 100}
+
+        service._extract_video_details = AsyncMock(side_effect=slow_details)
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = None
+
+        with patch("services.youtube.ytdlp_service.cache", mock_cache):
+            await service.search_videos("test query", 2, "en")
+
+        assert service._extract_video_details.call_count == 4
+        assert peak == 4
+
+        # Blocking yt-dlp work runs on the service's own executor
+        assert thread_names[0].startswith("ytdlp")
+
+    @pytest.mark.asyncio
+    async def test_search_videos_enriches_only_when_needed(self):
+        """Test that details are only fetched for entries that pass cheap filters and lack fields."""
+        mock_results = [
+            {"_type": "url", "url": "https://www.youtube.com/watch?v=full", "id": "full", "title": "Full",
+             "duration": 180, "view_count": 5000, "description": "Complete entry", "tags": ["python"]},
+            {"_type": "url", "url": "https://www.youtube.com/watch?v=short", "id": "short", "title": "Short",
+             "duration": 5},
+            {"_type": "url", "url": "https://www.youtube.com/watch?v=flat", "id": "flat", "title": "Flat",
+             "duration": 180},
+        ]
+
+        service = YtDlpService()
+        service._extract_info_with_ytdlp = MagicMock(return_value=mock_results)
+        service._extract_video_details = AsyncMock(return_value={"viewCount": 10000})
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = None
+
+        with patch("services.youtube.ytdlp_service.cache", mock_cache):
+            results = await service.search_videos("test query", 5, "en")
+
+        service._extract_video_details.assert_called_once_with("flat")
+        assert sorted(video["id"] for video in results) == ["flat", "full"]
+
+    @pytest.mark.asyncio
+    async def test_search_videos_extracts_only_uncached_details(self):
+        """Test that cached details and misses from one get_many call are used, and only the rest extracted."""
+        mock_results = [
+            {"_type": "url", "url": f"https://www.youtube.com/watch?v={video_id}", "id": video_id, "title": video_id,
+             "duration": 180}
+            for video_id in ("hit", "gone", "new")
+        ]
+
+        service = YtDlpService()
+        service._extract_info_with_ytdlp = MagicMock(return_value=mock_results)
+        service._extract_video_details = AsyncMock(return_value={"viewCount": 10000})
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = None
+        mock_cache.get_many.return_value = {
+            "youtube:video:hit": {"viewCount": 20000},
+            "youtube:video:gone": {service.MISS_MARKER: True},
+        }
+
+        with patch("services.youtube.ytdlp_service.cache", mock_cache):
+            results = await service.search_videos("test query", 5, "en")
+
+        mock_cache.get_many.assert_called_once_with(["youtube:video:hit", "youtube:video:gone", "youtube:video:new"])
+        service._extract_video_details.assert_called_once_with("new")
+        assert not any(c.args[0].startswith("youtube:video:") for c in mock_cache.get.call_args_list)
+        assert {video["id"]: video["viewCount"] for video in results} == {"hit": 20000, "new": 10000}
+        assert service._miss_cache.get("youtube:video:gone")
+
+    def test_video_record(self):
+        """Test that video records use slots and convert to dictionaries without the relevance score."""
+        record = VideoRecord(
+            id="test1", title="Python", url="https://www.youtube.com/watch?v=test1", description="",
+            duration=10, duration_seconds=600, thumbnail=None, channel="", publishedAt="",
+            viewCount=1000, likeCount=10, tags=None, relevance_score=2.5
+        )
+
+        assert not hasattr(record, "__dict__")
+        assert record.get("viewCount") == 1000
+        assert record.get("missing", "default") == "default"
+        video = record.to_dict()
+        assert "relevance_score" not in video
+        assert "thumbnail" not in video
+        assert video["duration_seconds"] == 600
+        assert video["tags"] == []
+
+    @pytest.mark.asyncio
+    async def test_search_videos_stops_enriching_when_enough(self):
+        """Test that enrichment stops after a batch yields enough relevant videos."""
+        mock_results = [
+            {"_type": "url", "url": f"https://www.youtube.com/watch?v=test{i}", "id": f"test{i}",
+             "title": f"Python classes {i}", "duration": 600}
+            for i in range(8)
+        ]
+
+        service = YtDlpService()
+        service._extract_info_with_ytdlp = MagicMock(return_value=mock_results)
+        service._extract_video_details = AsyncMock(return_value={"viewCount": 100000, "description": "python classes"})
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = None
+
+        with patch("services.youtube.ytdlp_service.cache", mock_cache):
+            results = await service.search_videos("python classes", 2, "en")
+
+        assert len(results) == 2
+        assert service._extract_video_details.call_count == 4
+        assert [call.args[0] for call in service._extract_video_details.call_args_list] == [f"test{i}" for i in range(4)]
+
+    @pytest.mark.asyncio
+    async def test_search_videos_for_topic_runs_queries_concurrently(self):
+        """Test that topic queries run concurrently and the rest are cancelled once there are enough videos."""
+        service = YtDlpService()
+        started = []
+        cancelled = []
+
+        async def search(query, max_results, language):
+            started.append(query)
+            if len(started) > 1:
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    cancelled.append(query)
+                    raise
+            await asyncio.sleep(0.01)
+            return [
+                {"id": f"test{i}", "title": f"python classes {i}", "url": f"https://www.youtube.com/watch?v=test{i}",
+                 "description": "", "duration": 5, "thumbnail": ""}
+                for i in range(3)
+            ]
+
+        service.search_videos = AsyncMock(side_effect=search)
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = None
+
+        with patch("services.youtube.ytdlp_service.cache", mock_cache):
+            results = await asyncio.wait_for(service.search_videos_for_topic("python", "classes", 2, "en"), timeout=5)
+
+        assert len(results) == 2
+        assert len(started) == service.MAX_CONCURRENT_TOPIC_QUERIES
+        assert cancelled == started[1:]
+
+    @pytest.mark.asyncio
+    async def test_search_videos_for_topic_fetches_playlists_concurrently(self):
+        """Test that playlist videos are fetched concurrently and slow playlists are cancelled."""
+        service = YtDlpService()
+        service.search_videos = AsyncMock(return_value=[])
+        service.search_playlists = AsyncMock(return_value=[{"id": "slow"}, {"id": "fast"}])
+        cancelled = []
+
+        async def playlist_videos(playlist_id, max_videos, language):
+            if playlist_id == "slow":
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    cancelled.append(playlist_id)
+                    raise
+            return [
+                {"id": f"test{i}", "title": f"python classes {i}", "url": f"https://www.youtube.com/watch?v=test{i}",
+                 "description": "", "duration": 5, "thumbnail": "", "isFromPlaylist": True}
+                for i in range(max_videos)
+            ]
+
+        service.get_playlist_videos = AsyncMock(side_effect=playlist_videos)
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = None
+
+        with patch("services.youtube.ytdlp_service.cache", mock_cache):
+            results = await asyncio.wait_for(service.search_videos_for_topic("python", "classes", 2, "en"), timeout=5)
+
+        assert len(results) == 2
+        assert service.get_playlist_videos.call_count == 2
+        assert cancelled == ["slow"]
+
+    @pytest.mark.asyncio
+    async def test_search_videos_for_topic_scores_duplicates_once(self):
+        """Test that videos returned by several queries are merged and scored once."""
+        service = YtDlpService()
+        service.search_videos = AsyncMock(return_value=[
+            {"id": f"test{i}", "title": f"python classes {i}", "url": f"https://www.youtube.com/watch?v=test{i}",
+             "description": "", "duration": 5, "thumbnail": ""}
+            for i in range(2)
+        ])
+        service.search_playlists = AsyncMock(return_value=[])
+        service._score_videos = MagicMock(side_effect=lambda videos, query: np.ones(len(videos)))
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = None
+
+        with patch("services.youtube.ytdlp_service.cache", mock_cache):
+            results = await service.search_videos_for_topic("python basics", "classes", 4, "en")
+
+        assert service.search_videos.call_count > 1
+        assert len(results) == 2
+        assert [len(call.args[0]) for call in service._score_videos.call_args_list] == [2]
+
+    @pytest.mark.asyncio
+    async def test_search_videos_for_topic_uses_cached_searches(self):
+        """Test that cached query results are loaded in one get_many call and not searched again."""
+        service = YtDlpService()
+        service.search_videos = AsyncMock(return_value=[])
+        cached_videos = [
+            {"id": f"test{i}", "title": f"python classes {i}", "url": f"https://www.youtube.com/watch?v=test{i}",
+             "description": "", "duration": 5, "thumbnail": ""}
+            for i in range(3)
+        ]
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = None
+        mock_cache.get_many.side_effect = lambda keys: {keys[0]: cached_videos}
+
+        with patch("services.youtube.ytdlp_service.cache", mock_cache):
+            results = await service.search_videos_for_topic("python", "classes", 2, "en")
+
+        assert len(results) == 2
+        mock_cache.get_many.assert_called_once()
+        service.search_videos.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_search_videos_for_topic_refreshes_early_once(self):
+        """Test that cached topic results are refreshed near expiry by a single background task."""
+        service = YtDlpService()
+        service._refresh_topic_cache = AsyncMock()
+        resource = Resource(id="youtube_1", title="Python", url="https://www.youtube.com/watch?v=1", type="video")
+        entry = {"resources": [resource.to_dict()], "expiry": time.time() + 86400,
+                 "stale_at": time.time() + 43200, "delta": 1.0}
+
+        mock_cache = MagicMock()
+        mock_cache.get.side_effect = lambda key, **kwargs: entry
+
+        with patch("services.youtube.ytdlp_service.cache", mock_cache):
+            # Far from expiry, cached results are served as they are
+            assert await service.search_videos_for_topic("python", None, 3, "en") == [resource]
+            service._refresh_topic_cache.assert_not_called()
+
+            # Past expiry, concurrent hits share one refresh
+            entry.update(expiry=time.time() - 1, stale_at=time.time() - 1)
+            await asyncio.gather(*(service.search_videos_for_topic("python", None, 3, "en") for _ in range(3)))
+            await asyncio.sleep(0)
+            service._refresh_topic_cache.assert_called_once()
+            mock_cache.setnx.assert_called_once_with("youtube:topic:python_None_3_en:refresh_lock",
+                                                     service.REFRESH_LOCK_TTL, True)
+            assert not service._refresh_tasks
+
+            # Another worker holding the refresh lock keeps this one from refreshing
+            mock_cache.setnx.return_value = False
+            await service.search_videos_for_topic("python", None, 3, "en")
+            await asyncio.sleep(0)
+            service._refresh_topic_cache.assert_called_once()
+
+    def test_should_refresh_early_when_stale(self):
+        """Test that cached topic results past their stale point are always refreshed."""
+        service = YtDlpService()
+        entry = {"resources": [], "expiry": time.time() + 1000, "stale_at": time.time() + 500, "delta": 0.0}
+
+        assert not service._should_refresh_early(entry)
+        with patch("services.youtube.ytdlp_service.time.time", return_value=entry["stale_at"]):
+            assert service._should_refresh_early(entry)
+
+    def test_cache_topic_results_keeps_full_ttl(self):
+        """Test that topic results and their refresh metadata expire together, even for small result lists."""
+        service = YtDlpService()
+        memory_cache = MemoryCache()
+        resource = Resource(id="youtube_1", title="Python", url="https://www.youtube.com/watch?v=1", type="video")
+
+        with patch("services.youtube.ytdlp_service.cache", memory_cache):
+            with patch("services.youtube.ytdlp_service.random.random", return_value=0.5):  # No TTL jitter
+                service._cache_topic_results("topic-key", 1000, [resource], 0.0)
+
+        entry = memory_cache.get("topic-key")
+        assert [Resource.from_dict(r) for r in entry["resources"]] == [resource]
+        assert memory_cache.expiry["topic-key"] == pytest.approx(entry["expiry"], abs=1)
+        assert entry["expiry"] - entry["stale_at"] == pytest.approx(500)
+
+    @pytest.mark.asyncio
+    async def test_stale_topic_results_refresh_and_back_off(self):
+        """Test that small stale topic results are served and refreshed, and that a refresh
+        that doesn't improve them moves their stale point back."""
+        service = YtDlpService()
+        service.search_videos = AsyncMock(return_value=[])
+        memory_cache = MemoryCache()
+        resource = Resource(id="youtube_1", title="Python", url="https://www.youtube.com/watch?v=1", type="video")
+        key = "youtube:topic:python_None_1_en"
+
+        with patch("services.youtube.ytdlp_service.cache", memory_cache):
+            with patch("services.youtube.ytdlp_service.random.random", return_value=0.5):  # No TTL jitter
+                service._cache_topic_results(key, 1000, [resource], 0.0)
+            entry = memory_cache.get(key)
+
+            now = entry["stale_at"] + 1
+            with patch("services.youtube.ytdlp_service.time.time", return_value=now):
+                assert await service.search_videos_for_topic("python", None, 1, "en") == [resource]
+                await asyncio.wait_for(service._refresh_tasks[key], timeout=5)
+
+                refreshed = memory_cache.get(key)
+                assert refreshed["resources"] == entry["resources"]
+                assert refreshed["stale_at"] == pytest.approx(now + (entry["expiry"] - now) / 2)
+                assert not service._should_refresh_early(refreshed)
+                assert memory_cache.get(f"{key}:refresh_lock") is None
+
+    def test_jittered_ttl(self):
+        """Test that shared cache TTLs are spread by TTL_JITTER around the base TTL."""
+        service = YtDlpService(cache_ttl=1000)
+
+        with patch("services.youtube.ytdlp_service.random.random", side_effect=[0.0, 0.5, 0.999999]):
+            assert [service._jittered_ttl() for _ in range(3)] == [900, 1000, 1099]
+        assert 450 <= service._jittered_ttl(500) <= 550
+
+    def test_requests_handler_available(self):
+        """Test that the requests handler needs requests and urllib3 >= 2."""
+        with patch("services.youtube.ytdlp_service.importlib.util.find_spec", return_value=MagicMock()):
+            with patch("services.youtube.ytdlp_service.importlib.metadata.version", return_value="2.2.1"):
+                assert ytdlp_service._requests_handler_available()
+            with patch("services.youtube.ytdlp_service.importlib.metadata.version", return_value="1.26.20"):
+                assert not ytdlp_service._requests_handler_available()
+
+        with patch("services.youtube.ytdlp_service.importlib.util.find_spec", return_value=None):
+            assert not ytdlp_service._requests_handler_available()
+
+    @pytest.mark.asyncio
+    async def test_refresh_topic_cache_runs_queries_concurrently(self):
+        """Test that the background refresh runs its queries concurrently and caches the merged results."""
+        service = YtDlpService()
+        started = []
+        all_started = asyncio.Event()
+
+        async def search(query, max_results, language):
+            started.append(query)
+            if len(started) == 3:
+                all_started.set()
+            await all_started.wait()
+            return [
+                {"id": f"{len(started)}-{i}", "title": f"python {i}", "url": f"https://www.youtube.com/watch?v={i}",
+                 "description": "", "duration": 5, "thumbnail": ""}
+                for i in range(2)
+            ]
+
+        service.search_videos = AsyncMock(side_effect=search)
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = None
+
+        with patch("services.youtube.ytdlp_service.cache", mock_cache):
+            await asyncio.wait_for(service._refresh_topic_cache("python", None, 3, "en", "topic-key"), timeout=5)
+
+        assert len(started) == 3
+        mock_cache.setex.assert_any_call("topic-key", ANY, ANY)
+        ttl = next(c.args[1] for c in mock_cache.setex.call_args_list if c.args[0] == "topic-key")
+        assert service.cache_ttl * 0.9 <= ttl <= service.cache_ttl * 1.1
+        mock_cache.delete.assert_called_once_with("topic-key:refresh_lock")
+
+    @pytest.mark.asyncio
+    async def test_search_playlists_parses_playlist_ids(self):
+        """Test that playlist IDs are read from the list query parameter."""
+        service = YtDlpService()
+        service._extract_info_with_ytdlp = MagicMock(return_value=[
+            {"_type": "url", "url": "https://www.youtube.com/playlist?list=PL1&index=2", "title": "First"},
+            {"_type": "url", "url": "https://www.youtube.com/playlist?ref=shared_list=x&list=PL2", "title": "Second"},
+            {"_type": "url", "url": "https://www.youtube.com/playlist?index=1", "title": "No list"},
+        ])
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = None
+
+        with patch("services.youtube.ytdlp_service.cache", mock_cache):
+            playlists = await service.search_playlists("python", 3, "en")
+
+        assert [playlist["id"] for playlist in playlists] == ["PL1", "PL2"]
+
+    @pytest.mark.asyncio
+    async def test_get_video_details_caches_misses(self):
+        """Test that a missing video is remembered and not extracted again."""
+        service = YtDlpService()
+        service._extract_video_info = MagicMock(return_value=None)
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = None
+
+        with patch("services.youtube.ytdlp_service.cache", mock_cache):
+            assert await service.get_video_details("gone") is None
+            assert await service.get_video_details("gone") is None
+
+            service._extract_video_info.assert_called_once()
+            mock_cache.setex.assert_called_once_with(
+                "youtube:video:gone", service.MISS_CACHE_TTL, {service.MISS_MARKER: True}
+            )
+
+            # A miss cached by another process is honoured too
+            mock_cache.get.return_value = {service.MISS_MARKER: True}
+            assert await service.get_video_details("gone_elsewhere") is None
+            service._extract_video_info.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_video_details_coalesces_concurrent_lookups(self):
+        """Test that concurrent lookups for the same video share one extraction."""
+        service = YtDlpService()
+
+        def extract(*args):
+            time.sleep(0.05)
+            return {"id": "test1", "title": "Test Video 1", "duration": 180}
+
+        service._extract_video_info = MagicMock(side_effect=extract)
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = None
+
+        with patch("services.youtube.ytdlp_service.cache", mock_cache):
+            results = await asyncio.gather(*(service.get_video_details("test1") for _ in range(3)))
+
+            assert all(result["title"] == "Test Video 1" for result in results)
+            service._extract_video_info.assert_called_once()
+            assert not service._inflight
+
+            # Later lookups are answered by the local tier without touching the shared cache
+            shared_lookups = mock_cache.get.call_count
+            assert (await service.get_video_details("test1"))["title"] == "Test Video 1"
+            assert mock_cache.get.call_count == shared_lookups
+
+    def test_get_best_thumbnail(self):
+        """Test that the highest resolution thumbnail is picked, with a fallback for videos without any."""
+        service = YtDlpService()
+        thumbnails = [
+            {"url": "small", "width": 120, "height": 90},
+            {"url": "unknown", "width": None},
+            {"url": "large", "width": 1280, "height": 720},
+            {"url": "large-copy", "width": 1280, "height": 720},
+        ]
+
+        assert service._get_best_thumbnail({"thumbnails": thumbnails}) == "large"
+        assert service._get_best_thumbnail({"id": "abc"}) == "https://i.ytimg.com/vi/abc/hqdefault.jpg"
+        assert service._get_best_thumbnail({}) is None
+
+    def test_score_video_reuses_query_terms(self):
+        """Test that query terms are split once per query and the precompiled patterns match."""
+        service = YtDlpService()
+        video = {"title": "Python Classes Tutorial", "description": "Learn python", "duration": 10}
+
+        _query_terms.cache_clear()
+        scores = [service._score_video(video, "Python Classes") for _ in range(3)]
+
+        assert scores[0] == scores[1] == scores[2]
+        assert _query_terms.cache_info().misses == 1
+        assert service._parse_duration("PT1H30M45S") == 91
+        assert service._parse_duration("1:30:15") == 90
+        assert service._clean_subtopic("Introdução ao Python") == "Python"
+        assert service._clean_subtopic("Classes") == "Classes"
+
+    def test_score_videos_matches_single_scores(self):
+        """Test that batch scoring gives each video the same score as scoring it alone."""
+        service = YtDlpService()
+        videos = [
+            {"title": "Python Classes", "description": "python", "viewCount": 50000, "likeCount": 2000,
+             "duration": 12, "publishedAt": "20240101"},
+            {"title": "Java", "description": "", "viewCount": 0, "likeCount": 0, "duration": 3, "publishedAt": ""},
+            {"title": "Python course", "description": "classes", "viewCount": 20000000, "likeCount": None,
+             "duration": 45, "publishedAt": "2020-01-01T00:00:00Z"},
+        ]
+
+        scores = service._score_videos(videos, "python classes")
+
+        assert scores.shape == (3,)
+        assert scores.tolist() == [service._score_video(video, "python classes") for video in videos]
+        assert scores[0] > scores[2] > scores[1]
+
+    def test_score_videos_matches_whole_words(self):
+        """Test that query terms match whole words, ignoring punctuation, not substrings."""
+        service = YtDlpService()
+        videos = [
+            {"title": "Python, classes!", "description": ""},
+            {"title": "Pythonic classification", "description": ""},
+        ]
+
+        scores = service._score_videos(videos, "python classes")
+
+        assert _query_terms("Python  classes") == {"python", "classes"}
+        assert _query_terms("Straße") == _query_terms("STRASSE")
+        assert scores[0] == service.TITLE_MATCH_WEIGHT
+        assert scores[1] == 0.0
+
+    def test_upload_date_parsed_once(self):
+        """Test that a video's upload date is parsed once, and only when the cheaper checks pass."""
+        service = YtDlpService()
+        video = {"title": "Python", "description": "", "publishedAt": "20240101"}
+
+        with patch("services.youtube.ytdlp_service._parse_upload_date",
+                   wraps=ytdlp_service._parse_upload_date) as parse:
+            record = VideoRecord(
+                id="test1", title="Python", url="", description="", duration=10, duration_seconds=600,
+                thumbnail=None, channel="", publishedAt="20240101", viewCount=1000, likeCount=10, tags=[]
+            )
+            rejected = VideoRecord(
+                id="test2", title="Python", url="", description="", duration=10, duration_seconds=600,
+                thumbnail=None, channel="", publishedAt="20240101", viewCount=1, likeCount=0, tags=[]
+            )
+            assert not service._filter_video_by_quality(rejected)
+            assert parse.call_count == 0
+            assert service._filter_video_by_quality(record)
+            service._score_videos([record], "python")
+            service._score_videos([video], "python")
+            service._score_videos([video], "python")
+
+        assert parse.call_count == 2
+        assert "upload_date" not in record.to_dict()
+
+    def test_parse_upload_date(self):
+        """Test that upload dates are parsed from yt-dlp and ISO 8601 formats."""
+        assert ytdlp_service._parse_upload_date("20240131") == datetime(2024, 1, 31)
+        assert ytdlp_service._parse_upload_date("2024-01-31T10:00:00Z") == datetime(2024, 1, 31, 10)
+        assert ytdlp_service._parse_upload_date("20241331") is None
+        assert ytdlp_service._parse_upload_date("2024-1-1") is None
+        assert ytdlp_service._parse_upload_date("") is None
+
+    def test_quality_filter_uses_given_time(self):
+        """Test that the quality filter uses exact durations and the batch time for age and recency."""
+        service = YtDlpService()
+        record = VideoRecord(
+            id="test1", title="Python", url="", description="", duration=10, duration_seconds=600,
+            thumbnail=None, channel="", publishedAt="20100101", viewCount=1000, likeCount=0, tags=[]
+        )
+
+        assert service._filter_video_by_quality(record, datetime(2015, 1, 1))
+        record.duration, record.duration_seconds = 0, 45  # Under a minute, but above MIN_DURATION_SECONDS
+        assert service._filter_video_by_quality(record, datetime(2015, 1, 1))
+        record.duration, record.duration_seconds = 10, 600
+        assert not service._filter_video_by_quality(record, datetime(2030, 1, 1))
+        assert service._score_videos([record], "python", datetime(2010, 1, 1))[0] > \
+            service._score_videos([record], "python", datetime(2015, 1, 1))[0]
+
+    @pytest.mark.asyncio
+    async def test_rank_videos_offloads_large_sets(self):
+        """Test that large candidate sets are ranked on the ranking executor and small ones inline."""
+        service = YtDlpService()
+        threads = set()
+
+        def score(videos, query):
+            threads.add(threading.current_thread().name)
+            return np.array([video["views"] for video in videos], dtype=float)
+
+        service._score_videos = MagicMock(side_effect=score)
+
+        small = [{"views": i} for i in range(3)]
+        ranked = await service._rank_videos(small, "python", 2)
+        assert [v["views"] for v in ranked] == [2, 1]
+        assert threads == {threading.current_thread().name}
+
+        threads.clear()
+        large = [{"views": i} for i in range(service.RANK_OFFLOAD_THRESHOLD + 1)]
+        ranked = await service._rank_videos(large, "python", 3)
+        assert [v["views"] for v in ranked] == [service.RANK_OFFLOAD_THRESHOLD - i for i in range(3)]
+        assert all(name.startswith("ytdlp-rank") for name in threads)
+        assert not any("relevance_score" in video for video in large)
+
+    @pytest.mark.asyncio
+    async def test_ydl_instances_reused_and_closed(self):
+        """Test that YoutubeDL instances are reused per option variant and closed by aclose."""
+        service = YtDlpService()
+
+        with patch("services.youtube.ytdlp_service.yt_dlp.YoutubeDL") as mock_ydl_class:
+            mock_ydl_class.side_effect = lambda opts: MagicMock(params=dict(opts))
+
+            search_ydl = service._get_ydl(service.SEARCH_YDL_OPTS)
+            assert service._get_ydl(service.SEARCH_YDL_OPTS) is search_ydl
+            assert service._get_ydl(service.DETAILS_YDL_OPTS) is not search_ydl
+            assert mock_ydl_class.call_count == 2
+            assert search_ydl.params["socket_timeout"] == 5
+
+            # Per-call overrides don't stick to the pooled instance
+            playlist_ydl = service._get_ydl(service.PLAYLIST_YDL_OPTS)
+            playlist_ydl.extract_info.side_effect = lambda *args, **kwargs: {
+                "entries": [{"playlistend": playlist_ydl.params["playlistend"]}]
+            }
+            entries = service._extract_info_with_ytdlp("url", service.PLAYLIST_YDL_OPTS, {"playlistend": 4})
+            assert entries == [{"playlistend": 4}]
+            assert playlist_ydl.params.get("playlistend") is None
+
+            await service.aclose()
+            search_ydl.close.assert_called_once()
+            playlist_ydl.close.assert_called_once()
+            assert service._executor._shutdown
+            assert service._get_ydl(service.SEARCH_YDL_OPTS) is not search_ydl
+
 
 class TestYouTubeApiService:
     """Tests for the YouTubeApiService implementation."""
@@ -117,18 +738,12 @@ class TestYouTubeApiService:
     @pytest.mark.asyncio
     async def test_search_videos(self):
         """Test the search_videos method."""
-        # Mock the aiohttp.ClientSession
-        mock_session = AsyncMock()
-        mock_response = AsyncMock()
-        mock_response.status = 200
-        mock_response.json = AsyncMock(return_value={
-            "items": [
-                {"id": {"videoId": "test1"}},
-                {"id": {"videoId": "test2"}}
-            ]
-        })
-        mock_session.__aenter__.return_value = mock_session
-        mock_session.get.return_value.__aenter__.return_value = mock_response
+        # Mock the httpx.AsyncClient
+        mock_client = MagicMock()
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"items": [{"id": {"videoId": "test1"}}, {"id": {"videoId": "test2"}}]}'
+        mock_client.get = AsyncMock(return_value=mock_response)
 
         # Mock the _get_videos_details method
         service = YouTubeApiService()
@@ -159,7 +774,7 @@ class TestYouTubeApiService:
         mock_cache = MagicMock()
         mock_cache.get.return_value = None
 
-        with patch("services.youtube.youtube_api_service.aiohttp.ClientSession", return_value=mock_session), \
+        with patch.object(service, "_get_client", return_value=mock_client), \
              patch("services.youtube.youtube_api_service.config", mock_config), \
              patch("services.youtube.youtube_api_service.cache", mock_cache):
             # Test search_videos
@@ -171,9 +786,9 @@ class TestYouTubeApiService:
             assert results[0]["title"] == "Test Video 1"
             assert results[0]["url"] == "https://www.youtube.com/watch?v=test1"
 
-            # Check that session.get was called with the correct arguments
-            mock_session.get.assert_called_once()
-            args, kwargs = mock_session.get.call_args
+            # Check that client.get was called with the correct arguments
+            mock_client.get.assert_called_once()
+            args, kwargs = mock_client.get.call_args
             assert args[0] == "https://www.googleapis.com/youtube/v3/search"
             assert kwargs["params"]["q"] == "test query"
             assert kwargs["params"]["maxResults"] == 4  # 2 * 2
@@ -187,6 +802,157 @@ class TestYouTubeApiService:
             mock_cache.setex.assert_called_once()
 
 
+    @pytest.mark.asyncio
+    async def test_client_reused_and_closed(self):
+        """Test that one HTTP client is shared across calls and closed by aclose."""
+        mock_client = MagicMock()
+        mock_client.aclose = AsyncMock()
+
+        service = YouTubeApiService()
+
+        with patch("httpx.AsyncClient", return_value=mock_client) as mock_cls:
+            assert service._get_client() is mock_client
+            assert service._get_client() is mock_client
+            mock_cls.assert_called_once()
+            limits = mock_cls.call_args.kwargs["limits"]
+            assert limits.max_connections == limits.max_keepalive_connections == service.max_concurrent_requests
+
+            await service.aclose()
+            mock_client.aclose.assert_called_once()
+            await service.aclose()
+            mock_client.aclose.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_video_details_batches_concurrent_calls(self):
+        """Test that concurrent detail lookups share one videos request."""
+        service = YouTubeApiService()
+        service.api_key = "test_api_key"
+        service._get_videos_details = AsyncMock(side_effect=lambda ids: [
+            {"id": video_id, "title": f"Video {video_id}"} for video_id in ids if video_id != "missing"
+        ])
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = None
+
+        with patch("services.youtube.youtube_api_service.cache", mock_cache):
+            results = await asyncio.gather(
+                service.get_video_details("test1"),
+                service.get_video_details("test2"),
+                service.get_video_details("test1"),
+                service.get_video_details("missing")
+            )
+
+        assert [r["id"] if r else None for r in results] == ["test1", "test2", "test1", None]
+        service._get_videos_details.assert_called_once_with(["test1", "test2", "missing"])
+        assert not service._pending_details
+
+    @pytest.mark.asyncio
+    async def test_search_videos_for_topic_skips_details_request(self):
+        """Test that topic searches are built from search snippets without a videos request."""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = (
+            b'{"items": [{"id": {"videoId": "test1"}, "snippet": {"title": "Test Video 1", '
+            b'"description": "Test Description 1", "thumbnails": {"high": {"url": "https://example.com/t1.jpg"}}}}]}'
+        )
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock(return_value=mock_response)
+
+        service = YouTubeApiService()
+        service.api_key = "test_api_key"
+        service._get_client = MagicMock(return_value=mock_client)
+        service._get_videos_details = AsyncMock()
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = None
+
+        with patch("services.youtube.youtube_api_service.cache", mock_cache):
+            resources = await service.search_videos_for_topic("python", max_results=1, language="en")
+
+        assert len(resources) == 1
+        assert resources[0].url == "https://www.youtube.com/watch?v=test1"
+        assert resources[0].thumbnail == "https://example.com/t1.jpg"
+        assert resources[0].duration is None
+        mock_client.get.assert_called_once()
+        service._get_videos_details.assert_not_called()
+        # Only the fields the results are built from are requested
+        assert mock_client.get.call_args.kwargs["params"]["fields"] == YouTubeApiService.SEARCH_FIELDS
+
+    @pytest.mark.asyncio
+    async def test_get_json_retries_retryable_status(self):
+        """Test that 5xx/429 responses are retried, honoring Retry-After."""
+        unavailable = MagicMock()
+        unavailable.status_code = 503
+        unavailable.headers = {"Retry-After": "0"}
+        ok = MagicMock()
+        ok.status_code = 200
+        ok.content = b'{"items": []}'
+
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock(side_effect=[unavailable, ok])
+
+        service = YouTubeApiService()
+        service._get_client = MagicMock(return_value=mock_client)
+
+        assert await service._get_json("videos", {"id": "test1"}) == {"items": []}
+        assert mock_client.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_json_rejected_when_rate_limited(self):
+        """Test that requests are rejected without a network call when the token bucket is empty."""
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock()
+
+        service = YouTubeApiService()
+        service._get_client = MagicMock(return_value=mock_client)
+        service._rate_limiter.tokens = 0
+        service._rate_limiter.rate = 0
+
+        assert await service._get_json("videos", {"id": "test1"}) is None
+        mock_client.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_bounded(self):
+        """Test that in-flight API requests are capped by the request semaphore."""
+        in_flight = 0
+        peak = 0
+
+        async def slow_get(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            response = MagicMock()
+            response.status_code = 200
+            response.content = b'{"items": []}'
+            return response
+
+        mock_client = MagicMock()
+        mock_client.get = AsyncMock(side_effect=slow_get)
+
+        service = YouTubeApiService()
+        assert service.max_concurrent_requests == 16
+        service.request_semaphore = asyncio.Semaphore(2)
+        service._get_client = MagicMock(return_value=mock_client)
+
+        await asyncio.gather(*(service._get_json("videos", {"id": str(i)}) for i in range(6)))
+        assert peak == 2
+
+    def test_parse_duration_and_clean_subtopic(self):
+        """Test duration parsing and subtopic prefix removal."""
+        service = YouTubeApiService()
+
+        assert _parse_duration("PT1H30M45S") == 91
+        assert _parse_duration("2:40") == 3
+        assert _parse_duration("") is None
+
+        assert service._clean_subtopic("Introduction to  Python") == "Python"
+        assert service._clean_subtopic("Python Basics") == "Python Basics"
+        # The longest matching prefix wins over a shorter one listed first
+        assert service._clean_subtopic("Introdução ao Python") == "Python"
+
+
 class TestFallbackYouTubeService:
     """Tests for the FallbackYouTubeService implementation."""
 
@@ -272,6 +1038,166 @@ class TestFallbackYouTubeService:
             mock_cache.get.assert_called_once()
             mock_cache.setex.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_search_videos_coalesces_concurrent_queries(self):
+        """Test that concurrent identical searches share one upstream call."""
+        release = asyncio.Event()
+
+        async def slow_search(*args, **kwargs):
+            await release.wait()
+            return [{"id": "test1", "title": "Test Video 1", "url": "https://www.youtube.com/watch?v=test1"}]
+
+        mock_service = MagicMock()
+        mock_service.__class__.__name__ = "MockService"
+        mock_service.search_videos = AsyncMock(side_effect=slow_search)
+
+        service = FallbackYouTubeService([(mock_service, 1.0)])
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = None
+
+        with patch("services.youtube.fallback_youtube_service.cache", mock_cache):
+            callers = [asyncio.ensure_future(service.search_videos("test query", 2, "en")) for _ in range(3)]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*callers)
+
+            assert all(len(r) == 1 for r in results)
+            mock_service.search_videos.assert_called_once()
+            mock_cache.setex.assert_called_once()
+            assert not service._inflight
+
+    @pytest.mark.asyncio
+    async def test_search_videos_hedges_slow_service(self):
+        """Test that a slow service is hedged with the next one and then cancelled."""
+        cancelled = asyncio.Event()
+
+        async def hanging_search(*args, **kwargs):
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        mock_service1 = MagicMock()
+        mock_service1.__class__.__name__ = "MockService1"
+        mock_service1.search_videos = AsyncMock(side_effect=hanging_search)
+
+        mock_service2 = MagicMock()
+        mock_service2.__class__.__name__ = "MockService2"
+        mock_service2.search_videos = AsyncMock(return_value=[
+            {"id": "test2", "title": "Test Video 2", "url": "https://www.youtube.com/watch?v=test2"}
+        ])
+
+        service = FallbackYouTubeService([(mock_service1, 1.0), (mock_service2, 0.8)], hedge_delay=0.01)
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = None
+
+        with patch("services.youtube.fallback_youtube_service.cache", mock_cache):
+            results = await asyncio.wait_for(service.search_videos("test query", 2, "en"), timeout=5)
+
+            assert results[0]["id"] == "test2"
+            mock_service2.search_videos.assert_called_once()
+            assert cancelled.is_set()
+            mock_cache.setex.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_hedged_fetch_records_every_finished_attempt(self):
+        """Test that attempts finishing together all record their outcome, and none is penalized as cancelled."""
+        release = asyncio.Event()
+
+        def make_service(name, video_id):
+            async def search(*args, **kwargs):
+                await release.wait()
+                return [{"id": video_id, "title": name, "url": f"https://www.youtube.com/watch?v={video_id}"}]
+
+            mock_service = MagicMock()
+            mock_service.__class__.__name__ = name
+            mock_service.search_videos = AsyncMock(side_effect=search)
+            return mock_service
+
+        service = FallbackYouTubeService(
+            [(make_service("MockService1", "test1"), 1.0), (make_service("MockService2", "test2"), 0.8)],
+            hedge_delay=0.01
+        )
+        service._breakers = [MagicMock(state=CircuitState.HALF_OPEN) for _ in range(2)]
+
+        fetch = asyncio.ensure_future(service._hedged_fetch("search_videos", "test query", 2, "en"))
+        while sum(s.search_videos.call_count for s, _ in service.services) < 2:
+            await asyncio.sleep(0.01)
+        release.set()
+
+        results = await asyncio.wait_for(fetch, timeout=5)
+
+        assert results[0]["id"] in ("test1", "test2")
+        for breaker in service._breakers:
+            breaker.record_success.assert_called_once()
+            breaker.record_failure.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_search_videos_skips_service_with_open_breaker(self):
+        """Test that a repeatedly failing service is skipped once its breaker opens."""
+        mock_service1 = MagicMock()
+        mock_service1.__class__.__name__ = "FailingService"
+        mock_service1.search_videos = AsyncMock(return_value=[])
+
+        mock_service2 = MagicMock()
+        mock_service2.__class__.__name__ = "HealthyService"
+        mock_service2.search_videos = AsyncMock(return_value=[
+            {"id": "test2", "title": "Test Video 2", "url": "https://www.youtube.com/watch?v=test2"}
+        ])
+
+        CircuitBreaker._instances.pop("youtube_FailingService", None)
+        service = FallbackYouTubeService([(mock_service1, 1.0), (mock_service2, 0.8)])
+
+        mock_cache = MagicMock()
+        mock_cache.get.return_value = None
+
+        try:
+            with patch("services.youtube.fallback_youtube_service.cache", mock_cache):
+                for i in range(7):
+                    results = await service.search_videos(f"query {i}", 2, "en")
+                    assert results[0]["id"] == "test2"
+
+            # The breaker opens after 5 consecutive failures
+            assert mock_service1.search_videos.call_count == 5
+            assert mock_service2.search_videos.call_count == 7
+        finally:
+            CircuitBreaker._instances.pop("youtube_FailingService", None)
+            CircuitBreaker._instances.pop("youtube_HealthyService", None)
+
+    def test_service_order_weighted_selection(self):
+        """Test that weighted selection picks the first service by weight, skipping open breakers."""
+        mock_service1 = MagicMock()
+        mock_service1.__class__.__name__ = "HeavyService"
+
+        mock_service2 = MagicMock()
+        mock_service2.__class__.__name__ = "LightService"
+
+        CircuitBreaker._instances.pop("youtube_HeavyService", None)
+        CircuitBreaker._instances.pop("youtube_LightService", None)
+        service = FallbackYouTubeService([(mock_service2, 0.8), (mock_service1, 1.0)], weighted=True)
+
+        try:
+            # Drawing the lighter service puts it first; the rest follow by weight
+            with patch("services.youtube.fallback_youtube_service.random.choices",
+                       side_effect=lambda population, weights, k: [population[1]]) as mock_choices:
+                order = [s for s, _ in service._service_order()]
+                assert order == [mock_service2, mock_service1]
+                assert mock_choices.call_args.kwargs["weights"] == [1.0, 0.8]
+
+                # An open breaker takes the service out of the draw
+                service._breakers[1].state = CircuitState.OPEN
+                service._breakers[1].last_failure_time = time.time()
+                mock_choices.side_effect = lambda population, weights, k: [population[0]]
+                order = [s for s, _ in service._service_order()]
+                assert order == [mock_service2, mock_service1]
+                assert mock_choices.call_args.kwargs["weights"] == [0.8]
+        finally:
+            CircuitBreaker._instances.pop("youtube_HeavyService", None)
+            CircuitBreaker._instances.pop("youtube_LightService", None)
+
 
 class TestYouTubeFactory:
     """Tests for the YouTubeFactory."""
@@ -298,3 +1224,12 @@ class TestYouTubeFactory:
         assert YouTubeFactory.create_youtube_service("api") is api_service
         assert YouTubeFactory.create_youtube_service("fallback") is fallback_service
         assert YouTubeFactory.create_youtube_service("default") is default_service
+
+    def test_create_youtube_service_concurrent(self):
+        """Test that concurrent calls create a single instance."""
+        YouTubeFactory._instances = {}
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            instances = list(executor.map(lambda _: YouTubeFactory.create_youtube_service("api"), range(8)))
+
+        assert all(instance is instances[0] for instance in instances)